@@ -2,7 +2,16 @@
 # Adapter to integrate the advanced blackjack game from ad_casino.py into main.py
 import pygame
 import sys
-import random
+
+from blackjack_core import (
+    NUM_DECKS, STARTING_BANKROLL, MIN_BET, MAX_BET,
+    BlackjackEngine, PlayerHand, outcome_message,
+)
+from card_atlas import get_atlas
+from cards import CARD_HILO
+from pacing import ActionScheduler
+from text_cache import SHADOW_OFFSET, render_text
+from fonts import get_font
 
 # Import all the game logic from ad_casino but adapt it for integration
 # Copy over the essential constants and functions
@@ -17,10 +26,9 @@ GRAY = (120, 120, 130)
 BLACK = (0, 0, 0)
 ACCENT = (160, 90, 255)
 
-STARTING_BANKROLL = 200
-MIN_BET = 10
-MAX_BET = 500
-NUM_DECKS = 6
+# Pacing (seconds of game time, scaled by the table's pacing speed)
+DEAL_CARD_TIME = 0.22      # flight time of each dealt card
+DEALER_STEP_DELAY = 0.35   # pause before each dealer draw / stand
 
 # Fonts - will be initialized when pygame is ready
 FONT_BIG = None
@@ -32,57 +40,20 @@ def init_fonts():
     """Initialize fonts after pygame is initialized"""
     global FONT_BIG, FONT_MED, FONT, FONT_SMALL
     if FONT_BIG is None:
-        FONT_BIG = pygame.font.SysFont("arial", 48, bold=True)
-        FONT_MED = pygame.font.SysFont("arial", 28, bold=True)
-        FONT = pygame.font.SysFont("arial", 22)
-        FONT_SMALL = pygame.font.SysFont("arial", 18)
-
-# Cards / Blackjack Logic
-SUITS = ["♠", "♥", "♦", "♣"]
-RANKS = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
-VALUES = {**{str(i): i for i in range(2, 11)}, "J": 10, "Q": 10, "K": 10, "A": 11}
-
-def build_shoe(num_decks=6):
-    shoe = []
-    for _ in range(num_decks):
-        for s in SUITS:
-            for r in RANKS:
-                shoe.append((r, s))
-    random.shuffle(shoe)
-    return shoe
-
-def hand_total(cards):
-    # cards: list of (rank, suit)
-    total = 0
-    aces = 0
-    for r, _ in cards:
-        total += VALUES[r]
-        if r == "A":
-            aces += 1
-    while total > 21 and aces:
-        total -= 10
-        aces -= 1
-    return total
-
-def is_blackjack(cards):
-    return len(cards) == 2 and hand_total(cards) == 21
-
-def is_bust(cards):
-    return hand_total(cards) > 21
+        FONT_BIG = get_font("arial", 48, bold=True)
+        FONT_MED = get_font("arial", 28, bold=True)
+        FONT = get_font("arial", 22)
+        FONT_SMALL = get_font("arial", 18)
 
 # UI Helpers
 def draw_text(surface, text, font, color, x, y, center=False, shadow=False):
-    if shadow:
-        sh = font.render(text, True, BLACK)
-        rect = sh.get_rect()
-        rect.topleft = (x + 2, y + 2)
-        if center:
-            rect.center = (x + 2, y + 2)
-        surface.blit(sh, rect)
-    surf = font.render(text, True, color)
+    # Rendered surfaces come from the shared LRU cache (text_cache.py)
+    surf = render_text(font, text, color, shadow=shadow)
     rect = surf.get_rect()
     if center:
-        rect.center = (x, y)
+        # a shadowed surface is SHADOW_OFFSET larger; keep the text itself centred
+        off = SHADOW_OFFSET // 2 if shadow else 0
+        rect.center = (x + off, y + off)
     else:
         rect.topleft = (x, y)
     surface.blit(surf, rect)
@@ -103,45 +74,82 @@ def point_in_rect(pos, rect):
     rx, ry, rw, rh = rect
     return (rx <= x <= rx+rw) and (ry <= y <= ry+rh)
 
-def draw_card(surface, x, y, rank, suit, face_up=True):
-    w, h = 80, 112
-    r = pygame.Rect(x, y, w, h)
-    if face_up:
-        pygame.draw.rect(surface, WHITE, r, border_radius=10)
-        pygame.draw.rect(surface, BLACK, r, width=2, border_radius=10)
-        col = RED if suit in ("♥", "♦") else BLACK
-        draw_text(surface, rank, FONT_SMALL, col, x + 8, y + 6)
-        draw_text(surface, suit, FONT_MED, col, x + w//2, y + h//2, center=True)
-        draw_text(surface, rank, FONT_SMALL, col, x + w - 8, y + h - 20)
-    else:
-        pygame.draw.rect(surface, (30, 60, 130), r, border_radius=10)
-        pygame.draw.rect(surface, WHITE, r, width=3, border_radius=10)
-        pygame.draw.circle(surface, (200, 220, 255), (x + w//2, y + h//2), 18)
-    return r
+def merge_rects(rects):
+    """Union overlapping rects so every dirty pixel is repainted exactly once."""
+    merged = []
+    for rect in rects:
+        if not (rect.width and rect.height):
+            continue
+        rect = pygame.Rect(rect)
+        i = rect.collidelist(merged)
+        while i != -1:
+            rect.union_ip(merged.pop(i))
+            i = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+def draw_card(surface, x, y, card, face_up=True):
+    # Faces are pre-rendered once per size (card_atlas.py); this is one blit
+    return get_atlas().blit(surface, x, y, card, face_up)
 
 
 class BlackjackTable:
-    """Adapter class that wraps the ad_casino.py blackjack game for use in main.py"""
+    """Adapter class that draws and animates a BlackjackEngine for use in main.py"""
     
-    def __init__(self, pos):
+    def __init__(self, pos, pacing_speed=1.0, instant=False, seed=None, bankroll=STARTING_BANKROLL):
         # Initialize fonts if needed
         init_fonts()
         
         self.pos = pos
-        self.bankroll = STARTING_BANKROLL
+        # Rules, shoe, hands and bankroll live in the pygame-free engine;
+        # the seed (engine.seed) reproduces every shoe this table deals
+        self.engine = BlackjackEngine(NUM_DECKS, bankroll, MIN_BET, MAX_BET,
+                                      allow_double=False, allow_split=False, seed=seed)
         self.bet = MIN_BET
         self.message = ""
-        self.shoe = build_shoe(NUM_DECKS)
-        self.player = []
-        self.dealer = []
         self.revealed = False
         self.hand_phase = "betting"  # betting -> dealing -> player -> dealer -> settle -> done
         self.anim_cards = []  # list of dicts with animation info
+        self.landed = {"player": 0, "dealer": 0}  # cards shown per hand while dealing
+        # Dealer draws and deal animation run on frame time, never blocking the loop
+        self.pacer = ActionScheduler(speed=pacing_speed, instant=instant)
         self.state = 'waiting'  # Interface compatibility with main.py
+        self._no_hand = PlayerHand()
+        # Cached static layer and per-layer (signature, rect) of the last draw
+        self._background = None
+        self._drawn = {}
+        self._pending = []
+        self._full_redraw = True
+        self.blit_area = 0  # pixels repainted by the last draw()
         
         # For compatibility with main.py interface
         self.player_money = self.bankroll
+
+    @property
+    def bankroll(self):
+        return self.engine.bankroll
+
+    @bankroll.setter
+    def bankroll(self, value):
+        self.engine.bankroll = value
+
+    @property
+    def shoe(self):
+        return self.engine.shoe
+
+    @property
+    def player(self):
+        return self.engine.hands[0] if self.engine.hands else self._no_hand
+
+    @property
+    def dealer(self):
+        return self.engine.dealer
         
+    def set_pacing(self, speed=1.0, instant=False):
+        """Change dealer/animation pacing; instant skips all delays (headless runs)."""
+        self.pacer.speed = speed
+        self.pacer.instant = instant
+
     def start_game(self):
         """Called when player interacts with the table"""
         self.state = 'betting'
@@ -162,42 +170,37 @@ class BlackjackTable:
         """Restart for a new hand"""
         if self.bankroll > 0:
             self.message = ""
-            self.player, self.dealer = [], []
+            self.engine.reset()
             self.revealed = False
             self.hand_phase = "betting"
             self.state = 'betting'
-    
-    def reshoe_if_needed(self):
-        if len(self.shoe) < 20:
-            self.shoe = build_shoe(NUM_DECKS)
 
     def start_hand(self):
         self.message = ""
-        self.player = []
-        self.dealer = []
         self.revealed = False
-        self.reshoe_if_needed()
+        self.pacer.clear()
+        dealt = self.engine.start_hand(self.bet)
         # dealing animation
         self.hand_phase = "dealing"
         self.state = 'playing'
         self.anim_cards = []
-        deal_order = [
-            ("player", 0), ("dealer", 0),
-            ("player", 1), ("dealer", 1)
-        ]
+        if self.pacer.instant:
+            self.finish_deal()
+            return
+        self.landed = {"player": 0, "dealer": 0}
         # animation spawn times
-        t = 0
-        for who, idx in deal_order:
+        t = 0.0
+        for who, idx, card in dealt:
             self.anim_cards.append({
                 "who": who,
                 "idx": idx,
-                "t_start": pygame.time.get_ticks() + t,
+                "t_start": self.pacer.clock + t,
                 "from": (WIDTH//2, -140),
                 "to": self.card_target_pos(who, idx),
                 "arrived": False,
-                "card": self.shoe.pop()
+                "card": card
             })
-            t += 220
+            t += DEAL_CARD_TIME
 
     def card_target_pos(self, who, idx):
         # determine where nth card should land
@@ -210,22 +213,16 @@ class BlackjackTable:
         return (base_x + idx * 90, base_y)
 
     def update_deal_anim(self):
-        now = pygame.time.get_ticks()
+        now = self.pacer.clock
         still_animating = False
         for c in self.anim_cards:
             if c["arrived"] or now < c["t_start"]:
                 continue
-            # lerp
-            fx, fy = c["from"]
-            tx, ty = c["to"]
-            dt = (now - c["t_start"]) / 220.0
+            dt = (now - c["t_start"]) / DEAL_CARD_TIME
             if dt >= 1.0:
                 c["arrived"] = True
-                # actually add the card
-                if c["who"] == "player":
-                    self.player.append(c["card"])
-                else:
-                    self.dealer.append(c["card"])
+                # the engine already holds the card; just show it
+                self.landed[c["who"]] += 1
             else:
                 still_animating = True
         # remove fully arrived ones from animation list to draw them as real cards
@@ -234,36 +231,42 @@ class BlackjackTable:
         if not still_animating and all(a["arrived"] or now >= a["t_start"] for a in self.anim_cards):
             # done
             self.anim_cards.clear()
-            # next phase
-            if is_blackjack(self.player) or is_blackjack(self.dealer):
-                self.hand_phase = "settle"
-                self.revealed = True
-            else:
-                self.hand_phase = "player"
+            self.finish_deal()
+
+    def finish_deal(self):
+        """All four cards are down: settle naturals or hand over to the player."""
+        if self.engine.phase == "settle":
+            self.hand_phase = "settle"
+            self.revealed = True
+        else:
+            self.hand_phase = "player"
 
     def hit(self):
         """Player hits"""
         if self.hand_phase == "player":
-            self.player.append(self.shoe.pop())
-            self.reshoe_if_needed()
-            if is_bust(self.player):
+            self.engine.hit()
+            if self.engine.phase == "settle":
                 self.revealed = True
                 self.hand_phase = "settle"
     
     def stand(self):
         """Player stands"""
         if self.hand_phase == "player":
+            self.engine.stand()
             self.hand_phase = "dealer"
+            self.pacer.schedule(DEALER_STEP_DELAY, self.dealer_step)
+
+    def dealer_step(self):
+        """One paced dealer action; queues the next one until the dealer stands."""
+        self.dealer_play()
+        if self.hand_phase == "dealer":
+            self.pacer.schedule(DEALER_STEP_DELAY, self.dealer_step)
 
     def dealer_play(self):
         """Dealer plays automatically"""
-        if self.hand_phase == "dealer":
-            if hand_total(self.dealer) < 17:
-                self.dealer.append(self.shoe.pop())
-                self.reshoe_if_needed()
-            else:
-                self.revealed = True
-                self.hand_phase = "settle"
+        if self.hand_phase == "dealer" and not self.engine.dealer_step():
+            self.revealed = True
+            self.hand_phase = "settle"
 
     def handle_game_over(self):
         """Handle the end of the game"""
@@ -271,51 +274,18 @@ class BlackjackTable:
             self.settle_hand()
 
     def settle_hand(self):
-        p = hand_total(self.player)
-        d = hand_total(self.dealer)
-
-        # Natural blackjack first
-        if is_blackjack(self.player) and is_blackjack(self.dealer):
-            self.message = "Both blackjack — Push."
-            delta = 0
-        elif is_blackjack(self.player):
-            win = int(self.bet * 1.5)
-            self.message = f"Blackjack! You win ${win}."
-            delta = win
-        elif is_blackjack(self.dealer):
-            self.message = "Dealer blackjack. You lose."
-            delta = -self.bet
-        else:
-            if is_bust(self.player):
-                self.message = "You bust."
-                delta = -self.bet
-            elif is_bust(self.dealer):
-                self.message = "Dealer busts. You win!"
-                delta = self.bet
-            else:
-                if p > d:
-                    self.message = "You win!"
-                    delta = self.bet
-                elif p < d:
-                    self.message = "Dealer wins."
-                    delta = -self.bet
-                else:
-                    self.message = "Push."
-                    delta = 0
-
-        self.bankroll += delta
+        hand = self.engine.settle()[0]
+        self.message = outcome_message(hand)
         self.player_money = self.bankroll  # Keep sync for main.py interface
         self.hand_phase = "done"
         self.state = 'game_over'
 
-    def update(self):
-        """Update game state - called each frame"""
+    def update(self, dt):
+        """Update game state - called each frame with the frame time in seconds"""
+        # Runs queued dealer draws once their delay has elapsed
+        self.pacer.update(dt)
         if self.hand_phase == "dealing":
             self.update_deal_anim()
-        elif self.hand_phase == "dealer":
-            # Dealer auto-plays with some pacing
-            pygame.time.delay(350)
-            self.dealer_play()
         elif self.hand_phase == "settle":
             self.settle_hand()
 
@@ -372,62 +342,183 @@ class BlackjackTable:
         
         return rects
 
-    def draw(self, surface):
-        """Draw the blackjack table interface"""
-        # Background
-        surface.fill((14, 70, 50))
-        pygame.draw.rect(surface, TABLE_COLOR, (60, 80, WIDTH-120, HEIGHT-160), border_radius=30)
-        pygame.draw.rect(surface, GOLD, (60, 80, WIDTH-120, HEIGHT-160), width=4, border_radius=30)
-        draw_text(surface, "Blackjack Table", FONT_BIG, WHITE, WIDTH//2, 110, center=True)
-
-        # Bankroll and bet
-        draw_text(surface, f"Bankroll: ${self.bankroll}", FONT_MED, WHITE, 80, 160)
-        draw_text(surface, f"Bet: ${self.bet}", FONT_MED, WHITE, 80, 200)
-
+    def invalidate(self, rect=None):
+        """Repaint rect (or the whole table when None) on the next draw()."""
+        if rect is None:
+            self._full_redraw = True
+        else:
+            self._pending.append(pygame.Rect(rect))
+
+    def build_background(self, size):
+        """Static layer: felt, border, title and labels, rendered once per screen size."""
+        bg = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            bg = bg.convert()
+        bg.fill((14, 70, 50))
+        pygame.draw.rect(bg, TABLE_COLOR, (60, 80, WIDTH-120, HEIGHT-160), border_radius=30)
+        pygame.draw.rect(bg, GOLD, (60, 80, WIDTH-120, HEIGHT-160), width=4, border_radius=30)
+        draw_text(bg, "Blackjack Table", FONT_BIG, WHITE, WIDTH//2, 110, center=True)
+        draw_text(bg, "Dealer", FONT_MED, WHITE, 80, 270)
+        draw_text(bg, "You", FONT_MED, WHITE, 80, HEIGHT-230)
+        return bg
+
+    def layers(self):
+        """Dynamic layers as (name, signature, rect, draw function).
+
+        A layer is repainted only when its signature changes; its old and new
+        rects become the frame's dirty regions.
+        """
+        phase = self.hand_phase
         rects = self.get_button_rects()
+        layers = [
+            self.text_layer("bankroll", f"Bankroll: ${self.bankroll}", FONT_MED, WHITE, 80, 160),
+            self.text_layer("bet", f"Bet: ${self.bet}", FONT_MED, WHITE, 80, 200),
+            self.count_layer(),
+        ]
 
-        # Betting controls
-        if self.hand_phase == "betting":
-            button(surface, rects["minus"], "-")
-            button(surface, rects["plus"], "+")
-            button(surface, rects["deal"], "Deal", enabled=(self.bet>0 and self.bet<=self.bankroll))
-            draw_text(surface, "Adjust your bet, then Deal.", FONT, WHITE, 80, 240)
-
-        # Dealer area
-        draw_text(surface, "Dealer", FONT_MED, WHITE, 80, 270)
-        self.draw_hand(surface, self.dealer, x0=160, y0=300, hide_first=(not self.revealed and self.hand_phase in ("player","dealing")))
-
-        # Player area
-        draw_text(surface, "You", FONT_MED, WHITE, 80, HEIGHT-230)
-        self.draw_hand(surface, self.player, x0=160, y0=HEIGHT-200, hide_first=False)
-
-        # Buttons for actions
-        if self.hand_phase == "player":
-            button(surface, rects["hit"], "Hit", enabled=True)
-            button(surface, rects["stand"], "Stand", enabled=True)
-        elif self.hand_phase == "done":
-            button(surface, rects["next"], "Next Hand", enabled=(self.bankroll>0))
+        if phase == "betting":
+            deal_ok = self.bet > 0 and self.bet <= self.bankroll
+            layers.append(self.text_layer("hint", "Adjust your bet, then Deal.", FONT, WHITE, 80, 240))
+            layers.append(self.button_layer("minus", rects["minus"], "-"))
+            layers.append(self.button_layer("plus", rects["plus"], "+"))
+            layers.append(self.button_layer("deal", rects["deal"], "Deal", deal_ok))
+        elif phase == "player":
+            layers.append(self.button_layer("hit", rects["hit"], "Hit"))
+            layers.append(self.button_layer("stand", rects["stand"], "Stand"))
+        elif phase == "done":
+            layers.append(self.button_layer("next", rects["next"], "Next Hand", self.bankroll > 0))
+
+        dealing = phase == "dealing"
+        layers.append(self.hand_layer("dealer", self.dealer, 160, 300,
+                                      hide_first=self.hole_card_hidden(),
+                                      shown=self.landed["dealer"] if dealing else None))
+        layers.append(self.hand_layer("player", self.player, 160, HEIGHT-200, hide_first=False,
+                                      shown=self.landed["player"] if dealing else None))
+        layers.append(self.anim_layer())
 
-        # Message/status
         if self.message:
-            draw_text(surface, self.message, FONT_MED, GOLD if "win" in self.message.lower() else WHITE, WIDTH//2, 170, center=True)
-
-    def draw_hand(self, surface, cards, x0, y0, hide_first=False):
-        # live cards
-        for i, (r, s) in enumerate(cards):
-            face_up = not (hide_first and i == 0)
-            draw_card(surface, x0 + i*90, y0, r, s, face_up=face_up)
-        # animating "in-flight" cards preview
-        now = pygame.time.get_ticks()
+            color = GOLD if "win" in self.message.lower() else WHITE
+            layers.append(self.text_layer("message", self.message, FONT_MED, color, WIDTH//2, 170, center=True))
+        return layers
+
+    def text_layer(self, name, text, font, color, x, y, center=False):
+        rect = render_text(font, text, color).get_rect()
+        if center:
+            rect.center = (x, y)
+        else:
+            rect.topleft = (x, y)
+        return (name, (text, color), rect,
+                lambda surface: draw_text(surface, text, font, color, x, y, center=center))
+
+    def button_layer(self, name, rect, label, enabled=True):
+        return (name, (label, enabled), pygame.Rect(rect),
+                lambda surface: button(surface, rect, label, enabled=enabled))
+
+    def hand_layer(self, name, cards, x0, y0, hide_first, shown):
+        visible = tuple(cards[:shown])
+        rect = pygame.Rect(x0, y0, len(visible) * 90 - 10, 112) if visible else pygame.Rect(x0, y0, 0, 0)
+
+        def draw(surface):
+            for i, card in enumerate(visible):
+                draw_card(surface, x0 + i*90, y0, card, face_up=not (hide_first and i == 0))
+        return (name, (visible, hide_first), rect, draw)
+
+    def anim_layer(self):
+        # in-flight cards, face down while flying
+        now = self.pacer.clock
+        flying = []
         for a in self.anim_cards:
             if now < a["t_start"]:
                 continue
-            # interpolate
-            fx, fy = a["from"]
-            tx, ty = a["to"]
-            dt = (now - a["t_start"]) / 220.0
+            dt = (now - a["t_start"]) / DEAL_CARD_TIME
             if dt < 1.0:
-                x = fx + (tx - fx) * dt
-                y = fy + (ty - fy) * dt
-                # Face down while flying; final orientation when lands handled elsewhere
-                draw_card(surface, int(x), int(y), a["card"][0], a["card"][1], face_up=False)
\ No newline at end of file
+                fx, fy = a["from"]
+                tx, ty = a["to"]
+                flying.append((int(fx + (tx - fx) * dt), int(fy + (ty - fy) * dt), a["card"]))
+        rect = pygame.Rect(0, 0, 0, 0)
+        if flying:
+            rect = pygame.Rect(flying[0][0], flying[0][1], 80, 112).unionall(
+                [pygame.Rect(x, y, 80, 112) for x, y, _ in flying[1:]])
+
+        def draw(surface):
+            for x, y, card in flying:
+                draw_card(surface, x, y, card, face_up=False)
+        return ("anim", tuple(flying), rect, draw)
+
+    def hole_card_hidden(self):
+        """Is the dealer's first card drawn face down? Shared by the hand drawing and the count."""
+        return not self.revealed and self.hand_phase in ("player", "dealing")
+
+    def hidden_cards(self):
+        """Dealt cards the player can't see yet (the dealer's hole card)."""
+        if self.hole_card_hidden() and len(self.dealer):
+            return (self.dealer[0],)
+        return ()
+
+    def displayed_running_count(self):
+        """Running count over the cards the player can see."""
+        return self.shoe.running_count - sum(CARD_HILO[c] for c in self.hidden_cards())
+
+    def count_layer(self):
+        """Shoe count and bust odds; all O(1) reads from the shoe's tracker."""
+        lines = []
+        if self.hand_phase != "dealing":  # the engine has dealt cards that are still in flight
+            shoe = self.shoe
+            hidden = self.hidden_cards()
+            lines.append(f"Running count: {self.displayed_running_count():+d}")
+            lines.append(f"True count: {shoe.true_count(hidden):+.1f}")
+            if self.hand_phase == "player":
+                lines.append(f"Bust if you hit: {shoe.bust_probability(self.player.hard, hidden):.0%}")
+        x, y0 = WIDTH-270, 160
+        rect = pygame.Rect(x, y0, 0, 0)
+        for i, line in enumerate(lines):
+            rect.union_ip(render_text(FONT_SMALL, line, WHITE).get_rect(topleft=(x, y0 + i*22)))
+
+        def draw(surface):
+            for i, line in enumerate(lines):
+                draw_text(surface, line, FONT_SMALL, WHITE, x, y0 + i*22)
+        return ("count", tuple(lines), rect, draw)
+
+    def draw(self, surface):
+        """Draw the table; returns the dirty rects for pygame.display.update().
+
+        The static layer is cached and only layers whose content changed are
+        repainted, so an idle table returns no rects at all.
+        """
+        size = surface.get_size()
+        if self._background is None or self._background.get_size() != size:
+            self._background = self.build_background(size)
+            self._full_redraw = True
+        layers = self.layers()
+
+        if self._full_redraw:
+            self._full_redraw = False
+            self._pending.clear()
+            surface.blit(self._background, (0, 0))
+            for _, _, _, draw in layers:
+                draw(surface)
+            self._drawn = {name: (sig, rect) for name, sig, rect, _ in layers}
+            return [surface.get_rect()]
+
+        dirty = self._pending
+        self._pending = []
+        drawn = self._drawn
+        for name, sig, rect, _ in layers:
+            old = drawn.pop(name, None)
+            if old is None or old[0] != sig:
+                if old is not None:
+                    dirty.append(old[1])
+                dirty.append(rect)
+        dirty.extend(rect for _, rect in drawn.values())  # layers that went away
+        dirty = merge_rects(r.clip(surface.get_rect()) for r in dirty)
+
+        for rect in dirty:
+            surface.set_clip(rect)
+            surface.blit(self._background, rect, rect)
+            for _, _, layer_rect, draw in layers:
+                if layer_rect.colliderect(rect):
+                    draw(surface)
+        surface.set_clip(None)
+        self._drawn = {name: (sig, rect) for name, sig, rect, _ in layers}
+        self.blit_area = sum(r.width * r.height for r in dirty)
+        return dirty
@@ -0,0 +1,152 @@
+"""
+Animated tiles drawn over the cached static map.
+
+Two sources of animation are supported, both timed from Tiled data:
+
+* tiles in the TMX tile layers that carry a Tiled <animation> (pytmx exposes
+  it as the tile's 'frames' property), and
+* sprite-sheet tilesets (config.ANIMATION_TILESETS): a TSX whose image is one
+  of the casino animation sheets, with an <animation> on a tile and a
+  'replaces' property listing the map tile gids it brings to life.
+
+Every sheet is sliced into frames once. Each frame only the animated tile
+positions are blitted on top of the static layer.
+"""
+import bisect
+import os
+import xml.etree.ElementTree as ET
+
+import pygame as pg
+
+
+class Animation:
+    """Frames and their durations (ms) of one looping tile animation."""
+
+    def __init__(self, frames, durations):
+        self.frames = frames
+        self.ends = []  # cumulative end time of every frame
+        total = 0
+        for duration in durations:
+            total += max(int(duration), 1)
+            self.ends.append(total)
+        self.length = total
+
+    @property
+    def durations(self) -> list:
+        return [end - start for start, end in zip([0] + self.ends, self.ends)]
+
+    def frame_at(self, ms: int) -> pg.Surface:
+        return self.frames[bisect.bisect_right(self.ends, ms % self.length)]
+
+
+def slice_sheet(sheet: pg.Surface, tile_w: int, tile_h: int, columns: int, count: int,
+                spacing: int = 0, margin: int = 0) -> list:
+    """Cut a sprite sheet into count frames, left to right, top to bottom."""
+    frames = []
+    for i in range(count):
+        x = margin + (i % columns) * (tile_w + spacing)
+        y = margin + (i // columns) * (tile_h + spacing)
+        frames.append(sheet.subsurface((x, y, tile_w, tile_h)).copy())
+    return frames
+
+
+def load_sheet_animations(tsx_path: str, scale: float = 1.0) -> list:
+    """(Animation, replaced gids) for every animated tile of a sprite-sheet TSX."""
+    root = ET.parse(tsx_path).getroot()
+    tile_w, tile_h = int(root.get('tilewidth')), int(root.get('tileheight'))
+    image = root.find('image')
+    sheet = pg.image.load(os.path.join(os.path.dirname(tsx_path), image.get('source')))
+    if pg.display.get_surface() is not None:
+        sheet = sheet.convert_alpha()
+    frames = slice_sheet(sheet, tile_w, tile_h, int(root.get('columns')), int(root.get('tilecount')),
+                         int(root.get('spacing', 0)), int(root.get('margin', 0)))
+    if scale != 1.0:
+        size = (round(tile_w * scale), round(tile_h * scale))
+        frames = [pg.transform.scale(frame, size) for frame in frames]
+
+    animations = []
+    for tile in root.iter('tile'):
+        anim = tile.find('animation')
+        if anim is None:
+            continue
+        props = {p.get('name'): p.get('value') for p in tile.iter('property')}
+        replaces = {int(g) for g in props.get('replaces', '').split(',') if g.strip()}
+        steps = anim.findall('frame')
+        animation = Animation([frames[int(f.get('tileid'))] for f in steps],
+                              [int(f.get('duration')) for f in steps])
+        animations.append((animation, replaces))
+    return animations
+
+
+def tile_animation(tmx_data, gid, tilesize: int = None):
+    """Animation of a pytmx tile gid (from its Tiled <animation>), or None."""
+    props = tmx_data.get_tile_properties_by_gid(gid)
+    frames = props.get('frames') if props else None
+    if not frames:
+        return None
+    images = []
+    for frame in frames:
+        image = tmx_data.get_tile_image_by_gid(frame.gid)
+        if tilesize and (image.get_width() != tilesize or image.get_height() != tilesize):
+            image = pg.transform.scale(image, (tilesize, tilesize))
+        images.append(image)
+    return Animation(images, [frame.duration for frame in frames])
+
+
+class AnimatedTileLayer:
+    """Positions of every animated tile in a map, grouped by animation."""
+
+    def __init__(self, tilesize: int, groups=()):
+        self.tilesize = tilesize
+        self.clock = 0.0  # ms
+        self.blits = 0  # frames blitted by the last draw()
+        self.groups = list(groups)  # (Animation, [(x, y, phase ms), ...])
+
+    @classmethod
+    def from_tmx(cls, tmx_data, tile_layers, tilesize: int, sheet_tilesets=()) -> "AnimatedTileLayer":
+        """Find every animated tile in the map's tile layers."""
+        tiled_animations = {}  # pytmx gid -> Animation or None
+        replaced = {}          # Tiled gid -> Animation from a sprite-sheet tileset
+        scale = tilesize / tmx_data.tilewidth
+        for path in sheet_tilesets:
+            for animation, gids in load_sheet_animations(path, scale):
+                replaced.update(dict.fromkeys(gids, animation))
+        sheet_animations = set(replaced.values())
+
+        positions = {}  # Animation -> positions
+        tiledgidmap = tmx_data.tiledgidmap
+        for layer in tile_layers:
+            for y, row in enumerate(layer.data):
+                for x, gid in enumerate(row):
+                    if not gid:
+                        continue
+                    animation = replaced.get(tiledgidmap.get(gid, gid))
+                    if animation is None:
+                        if gid not in tiled_animations:
+                            tiled_animations[gid] = tile_animation(tmx_data, gid, tilesize)
+                        animation = tiled_animations[gid]
+                    if animation is not None:
+                        # Sheet animations play out of step so a row of machines doesn't blink in unison
+                        phase = (x * 7919 + y * 104729) % animation.length if animation in sheet_animations else 0
+                        positions.setdefault(animation, []).append((x * tilesize, y * tilesize, phase))
+        return cls(tilesize, positions.items())
+
+    def __len__(self):
+        return sum(len(tiles) for _, tiles in self.groups)
+
+    def update(self, dt: float):
+        self.clock += dt * 1000
+
+    def draw(self, surface: pg.Surface, camera: pg.Rect):
+        """Blit the current frame at every animated position inside camera."""
+        ox, oy = camera.x, camera.y
+        left, top, right, bottom = camera.left, camera.top, camera.right, camera.bottom
+        clock = int(self.clock)
+        blits = []
+        for animation, tiles in self.groups:
+            w, h = animation.frames[0].get_size()
+            for x, y, phase in tiles:
+                if x < right and y < bottom and x + w > left and y + h > top:
+                    blits.append((animation.frame_at(clock + phase), (x - ox, y - oy)))
+        surface.blits(blits, doreturn=False)
+        self.blits = len(blits)
@@ -4,6 +4,8 @@ Asset management system for loading and caching game resources.
 import os
 import pygame as pg
 from config import CASINO_TILESET_DIR
+from fonts import get_font
+from gamelog import ASSETS
 
 
 def load_image(path: str) -> pg.Surface:
@@ -11,7 +13,7 @@ def load_image(path: str) -> pg.Surface:
         image = pg.image.load(path)
         return image.convert_alpha() if image.get_alpha() else image.convert()
     except pg.error:
-        print(f'Could not load image: {path}')
+        ASSETS.warning("Could not load image: %s", path)
         return None
 
 
@@ -42,13 +44,13 @@ class AssetManager:
                     try:
                         image = pg.image.load(path).convert_alpha()
                         self.loaded_images[key] = image
-                        print(f"Loaded asset: {name} from {path}")
+                        ASSETS.debug("Loaded asset: %s from %s", name, path)
                         return image
                     except Exception as e:
-                        print(f"Error loading {path}: {e}")
+                        ASSETS.error("Error loading %s: %s", path, e)
             
             # Create placeholder if image not found
-            print(f"Asset not found: {name}, creating placeholder")
+            ASSETS.warning("Asset not found: %s, creating placeholder", name)
             placeholder = self.create_placeholder(name, category)
             self.loaded_images[key] = placeholder
             return placeholder
@@ -74,7 +76,7 @@ class AssetManager:
         pg.draw.rect(surface, (255, 255, 255), (0, 0, size[0], size[1]), 2)
         
         # Add text label
-        font = pg.font.SysFont(None, 12)
+        font = get_font(None, 12)
         text = font.render(name[:4], True, (255, 255, 255))
         text_rect = text.get_rect(center=(size[0]//2, size[1]//2))
         surface.blit(text, text_rect)
@@ -99,7 +101,7 @@ class AssetManager:
             # Load once & cache
             if tileset_path not in self._tileset_cache:
                 if not os.path.exists(tileset_path):
-                    print(f"[ERROR] Tileset not found: {tileset_path}")
+                    ASSETS.error("Tileset not found: %s", tileset_path)
                     return self.create_placeholder("nof", "general")
                 self._tileset_cache[tileset_path] = pg.image.load(tileset_path).convert_alpha()
             tileset = self._tileset_cache[tileset_path]
@@ -107,18 +109,18 @@ class AssetManager:
             sheet_w, sheet_h = tileset.get_width(), tileset.get_height()
             # Bounds check
             if x < 0 or y < 0 or width <= 0 or height <= 0:
-                print(f"[WARN] Invalid dimensions ({x},{y},{width},{height})")
+                ASSETS.warning("Invalid dimensions (%d,%d,%d,%d)", x, y, width, height)
                 return self.create_placeholder("bad", "general")
             if x + width > sheet_w or y + height > sheet_h:
-                print(f"[WARN] Out-of-bounds extract ({x},{y},{width},{height}) on sheet {sheet_w}x{sheet_h}")
+                ASSETS.warning("Out-of-bounds extract (%d,%d,%d,%d) on sheet %dx%d", x, y, width, height, sheet_w, sheet_h)
                 return self.create_placeholder("oob", "general")
 
             extracted = pg.Surface((width, height), pg.SRCALPHA)
             extracted.blit(tileset, (0, 0), (x, y, width, height))
-            print(f"Successfully extracted from ({x}, {y}) with size ({width}, {height})")
+            ASSETS.debug("Extracted (%d, %d) size (%d, %d) from %s", x, y, width, height, tileset_path)
             return extracted
         except Exception as e:
-            print(f"Error extracting from tileset {tileset_path} at ({x}, {y}, {width}, {height}): {e}")
+            ASSETS.error("Error extracting from tileset %s at (%d, %d, %d, %d): %s", tileset_path, x, y, width, height, e)
             return self.create_placeholder("err", "general")
     
     def load_animated_sheet(self, sheet_path: str) -> pg.Surface:
@@ -126,7 +128,7 @@ class AssetManager:
         try:
             return pg.image.load(sheet_path).convert_alpha()
         except Exception as e:
-            print(f"Error loading animated sheet {sheet_path}: {e}")
+            ASSETS.error("Error loading animated sheet %s: %s", sheet_path, e)
             return self.create_placeholder("anim", "general")
     
     def find_table_coordinates(self, tileset_path: str):
@@ -144,10 +146,10 @@ class AssetManager:
         for i, (x, y, w, h) in enumerate(possible_coordinates):
             try:
                 table = self.extract_from_tileset(tileset_path, x, y, w, h)
-                print(f"Successfully extracted table {i+1} from coordinates ({x}, {y}, {w}, {h})")
+                ASSETS.debug("Extracted table %d from coordinates (%d, %d, %d, %d)", i + 1, x, y, w, h)
                 return table
             except Exception as e:
-                print(f"Failed to extract table {i+1} from ({x}, {y}, {w}, {h}): {e}")
+                ASSETS.warning("Failed to extract table %d from (%d, %d, %d, %d): %s", i + 1, x, y, w, h, e)
                 continue
         
         # If none work, return a placeholder
@@ -162,7 +164,7 @@ def load_image_for_cutscene(name: str) -> pg.Surface | None:
     try:
         return pg.image.load(path).convert_alpha()
     except Exception as e:
-        print(f"Could not load cutscene image {name}: {e}")
+        ASSETS.warning("Could not load cutscene image %s: %s", name, e)
         return None
     
 
@@ -170,5 +172,5 @@ def debug_extract(self, screen: pg.Surface, tileset_path: str, x: int, y: int, w
     """Overlay the extracted image onto the given screen for debugging"""
     extracted = self.extract_from_tileset(tileset_path, x, y, width, height)
     screen.blit(extracted, position)
-    print(f"Overlayed extraction at {position} on screen")
+    ASSETS.debug("Overlayed extraction at %s on screen", position)
     return extracted
\ No newline at end of file
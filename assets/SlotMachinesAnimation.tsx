@@ -0,0 +1,51 @@
+<?xml version="1.0" encoding="UTF-8"?>
+<tileset version="1.10" tiledversion="1.11.2" name="SlotMachinesAnimation" tilewidth="16" tileheight="48" tilecount="40" columns="16">
+ <image source="2D Top Down Pixel Art Tileset Casino/Animated Sprite Sheets/SlotMachinesAnimationSheet_1.png" width="256" height="256"/>
+ <tile id="0">
+  <properties>
+   <property name="replaces" value="114,116"/>
+  </properties>
+  <animation>
+   <frame tileid="0" duration="1200"/>
+   <frame tileid="1" duration="120"/>
+   <frame tileid="2" duration="120"/>
+   <frame tileid="3" duration="120"/>
+   <frame tileid="4" duration="120"/>
+   <frame tileid="5" duration="120"/>
+   <frame tileid="6" duration="400"/>
+   <frame tileid="7" duration="400"/>
+   <frame tileid="8" duration="120"/>
+   <frame tileid="9" duration="120"/>
+   <frame tileid="10" duration="120"/>
+   <frame tileid="11" duration="120"/>
+   <frame tileid="12" duration="120"/>
+   <frame tileid="13" duration="120"/>
+   <frame tileid="14" duration="120"/>
+   <frame tileid="15" duration="120"/>
+   <frame tileid="16" duration="120"/>
+   <frame tileid="17" duration="120"/>
+   <frame tileid="18" duration="120"/>
+   <frame tileid="19" duration="120"/>
+   <frame tileid="20" duration="120"/>
+   <frame tileid="21" duration="120"/>
+   <frame tileid="22" duration="120"/>
+   <frame tileid="23" duration="120"/>
+   <frame tileid="24" duration="120"/>
+   <frame tileid="25" duration="120"/>
+   <frame tileid="26" duration="120"/>
+   <frame tileid="27" duration="120"/>
+   <frame tileid="28" duration="120"/>
+   <frame tileid="29" duration="120"/>
+   <frame tileid="30" duration="120"/>
+   <frame tileid="31" duration="120"/>
+   <frame tileid="32" duration="120"/>
+   <frame tileid="33" duration="120"/>
+   <frame tileid="34" duration="120"/>
+   <frame tileid="35" duration="120"/>
+   <frame tileid="36" duration="120"/>
+   <frame tileid="37" duration="120"/>
+   <frame tileid="38" duration="400"/>
+   <frame tileid="39" duration="400"/>
+  </animation>
+ </tile>
+</tileset>
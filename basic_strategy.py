@@ -0,0 +1,317 @@
+"""
+Basic-strategy chart and per-action expected values for the table rules.
+
+Computes, for every player hand (hard total, soft total or pair) against every
+dealer upcard, the EV of standing, hitting, doubling and splitting, using
+memoized recursion over the dealer's final-total distribution. Card odds come
+from the NUM_DECKS shoe with the dealer upcard removed; naturals are settled
+right after the deal, so EVs against an ace or ten are conditioned on the
+dealer not having blackjack.
+
+Results are cached as JSON under cache/, keyed by the rule parameters, so only
+a rule change pays for a recompute.
+
+Run: python basic_strategy.py
+"""
+import argparse
+import json
+import os
+
+from blackjack_core import NUM_DECKS, BLACKJACK_PAYOUT
+from cards import CARD_HARD_VALUES
+from gamelog import GAME
+
+CACHE_VERSION = 1
+CACHE_DIR = os.path.join(os.path.dirname(__file__), 'cache')
+
+# Card values 1..10 (1 = ace); dealer upcards are keyed 2..11 (11 = ace)
+CARD_VALUES = range(1, 11)
+UPCARDS = range(2, 12)
+DEALER_OUTCOMES = (17, 18, 19, 20, 21, 22)  # 22 = bust
+
+HARD_TOTALS = range(5, 21)
+SOFT_TOTALS = range(13, 21)
+PAIRS = range(2, 12)  # pair of card value, 11 = aces
+
+ACTION_NAMES = {"S": "stand", "H": "hit", "D": "double", "P": "split"}
+
+
+def best_total(hard: int, has_ace: bool) -> int:
+    return hard + 10 if has_ace and hard <= 11 else hard
+
+
+def shoe_probabilities(num_decks: int, removed=()) -> list:
+    """Draw probability of each card value 1..10 (index 0 unused)."""
+    counts = [0] * 11
+    for value in CARD_HARD_VALUES:
+        counts[value] += num_decks
+    for value in removed:
+        counts[value] -= 1
+    n = sum(counts)
+    return [c / n for c in counts]
+
+
+class _UpcardEV:
+    """Memoized EVs of every player state against one dealer upcard."""
+
+    def __init__(self, upcard: int, probs: list, hits_soft_17: bool):
+        self.up = 1 if upcard == 11 else upcard
+        self.p = probs
+        self.hits_soft_17 = hits_soft_17
+        self._dealer_memo = {}
+        self._hit_memo = {}
+        self.dealer_dist = self._dealer_start()
+        self._stand = {t: self._stand_ev(t) for t in range(4, 22)}
+
+    # --- dealer ---
+    def _dealer_final(self, hard: int, has_ace: bool) -> tuple:
+        key = (hard, has_ace)
+        if key in self._dealer_memo:
+            return self._dealer_memo[key]
+        total = best_total(hard, has_ace)
+        soft = has_ace and hard <= 11
+        if total > 21:
+            dist = (0, 0, 0, 0, 0, 1)
+        elif total >= 17 and not (self.hits_soft_17 and total == 17 and soft):
+            dist = tuple(1 if total == o else 0 for o in DEALER_OUTCOMES)
+        else:
+            dist = [0.0] * len(DEALER_OUTCOMES)
+            for v in CARD_VALUES:
+                sub = self._dealer_final(hard + v, has_ace or v == 1)
+                for i, q in enumerate(sub):
+                    dist[i] += self.p[v] * q
+            dist = tuple(dist)
+        self._dealer_memo[key] = dist
+        return dist
+
+    def _hole_probabilities(self) -> list:
+        """Hole-card odds given the dealer does not have a natural."""
+        q = list(self.p)
+        if self.up == 1:
+            q[10] = 0.0
+        elif self.up == 10:
+            q[1] = 0.0
+        n = sum(q)
+        return [x / n for x in q]
+
+    def _dealer_start(self) -> tuple:
+        q = self._hole_probabilities()
+        dist = [0.0] * len(DEALER_OUTCOMES)
+        for v in CARD_VALUES:
+            sub = self._dealer_final(self.up + v, self.up == 1 or v == 1)
+            for i, x in enumerate(sub):
+                dist[i] += q[v] * x
+        return tuple(dist)
+
+    @property
+    def dealer_blackjack_probability(self) -> float:
+        if self.up == 1:
+            return self.p[10]
+        if self.up == 10:
+            return self.p[1]
+        return 0.0
+
+    # --- player ---
+    def _stand_ev(self, total: int) -> float:
+        ev = 0.0
+        for outcome, prob in zip(DEALER_OUTCOMES, self.dealer_dist):
+            if outcome == 22 or total > outcome:
+                ev += prob
+            elif total < outcome:
+                ev -= prob
+        return ev
+
+    def stand(self, hard: int, has_ace: bool) -> float:
+        total = best_total(hard, has_ace)
+        return -1.0 if total > 21 else self._stand[max(total, 4)]
+
+    def hit(self, hard: int, has_ace: bool) -> float:
+        """EV of hitting now and then playing on optimally (hit or stand)."""
+        key = (hard, has_ace)
+        if key in self._hit_memo:
+            return self._hit_memo[key]
+        ev = 0.0
+        for v in CARD_VALUES:
+            h, a = hard + v, has_ace or v == 1
+            if best_total(h, a) > 21:
+                ev -= self.p[v]
+            else:
+                ev += self.p[v] * max(self.stand(h, a), self.hit(h, a))
+        self._hit_memo[key] = ev
+        return ev
+
+    def double(self, hard: int, has_ace: bool) -> float:
+        return 2 * sum(self.p[v] * self.stand(hard + v, has_ace or v == 1) for v in CARD_VALUES)
+
+    def split(self, value: int) -> float:
+        """Split a pair of card value (1 = aces); each hand may hit, stand or double."""
+        ev = 0.0
+        for v in CARD_VALUES:
+            h, a = value + v, value == 1 or v == 1
+            ev += self.p[v] * max(self.stand(h, a), self.hit(h, a), self.double(h, a))
+        return 2 * ev
+
+    def evs(self, hard: int, has_ace: bool, pair_value: int = 0) -> dict:
+        """EV of every legal action on a two-card hand."""
+        evs = {
+            "S": self.stand(hard, has_ace),
+            "H": self.hit(hard, has_ace),
+            "D": self.double(hard, has_ace),
+        }
+        if pair_value:
+            evs["P"] = self.split(pair_value)
+        return evs
+
+
+def _entry(evs: dict) -> dict:
+    action = max(evs, key=evs.get)
+    return {"action": action, "ev": {k: round(v, 6) for k, v in evs.items()}}
+
+
+def compute_strategy(num_decks: int = NUM_DECKS, hits_soft_17: bool = False,
+                     blackjack_payout: float = BLACKJACK_PAYOUT) -> dict:
+    """Compute the full chart and per-action EVs for one rule set."""
+    data = {
+        "version": CACHE_VERSION,
+        "rules": {"num_decks": num_decks, "hits_soft_17": hits_soft_17,
+                  "blackjack_payout": blackjack_payout},
+        "hard": {}, "soft": {}, "pairs": {},
+    }
+    calcs = {}
+    for up in UPCARDS:
+        removed = (1 if up == 11 else up,)
+        calcs[up] = calc = _UpcardEV(up, shoe_probabilities(num_decks, removed), hits_soft_17)
+        key = str(up)
+        for total in HARD_TOTALS:
+            data["hard"].setdefault(str(total), {})[key] = _entry(calc.evs(total, False))
+        for total in SOFT_TOTALS:
+            data["soft"].setdefault(str(total), {})[key] = _entry(calc.evs(total - 10, True))
+        for value in PAIRS:
+            v = 1 if value == 11 else value
+            data["pairs"].setdefault(str(value), {})[key] = _entry(calc.evs(2 * v, v == 1, v))
+
+    data["overall_ev"] = round(_overall_ev(num_decks, calcs, blackjack_payout), 6)
+    return data
+
+
+def _overall_ev(num_decks: int, calcs: dict, blackjack_payout: float) -> float:
+    """EV of a whole hand played by the chart, including naturals."""
+    p = shoe_probabilities(num_decks)
+    ev = 0.0
+    for up in UPCARDS:
+        u = 1 if up == 11 else up
+        calc = calcs[up]
+        dealer_bj = calc.dealer_blackjack_probability
+        for c1 in CARD_VALUES:
+            for c2 in CARD_VALUES:
+                prob = p[u] * p[c1] * p[c2]
+                hard, has_ace = c1 + c2, c1 == 1 or c2 == 1
+                if best_total(hard, has_ace) == 21:
+                    ev += prob * (1 - dealer_bj) * blackjack_payout
+                    continue
+                best = max(calc.evs(hard, has_ace, c1 if c1 == c2 else 0).values())
+                ev += prob * ((1 - dealer_bj) * best - dealer_bj)
+    return ev
+
+
+def cache_path(num_decks: int = NUM_DECKS, hits_soft_17: bool = False,
+               blackjack_payout: float = BLACKJACK_PAYOUT, cache_dir: str = CACHE_DIR) -> str:
+    rules = f"{num_decks}d_{'h17' if hits_soft_17 else 's17'}_bj{blackjack_payout:g}"
+    return os.path.join(cache_dir, f"strategy_v{CACHE_VERSION}_{rules}.json")
+
+
+class StrategyTable:
+    """Chart lookups for a hand in play, e.g. for hint overlays or bots."""
+
+    def __init__(self, data: dict):
+        self.data = data
+        self.rules = data["rules"]
+        self.overall_ev = data["overall_ev"]
+
+    def entry(self, hand, upcard: int) -> dict:
+        """Chart entry for a HandState (or card ids) against a dealer upcard card id."""
+        cards = list(hand)
+        up = str(CARD_HARD_VALUES[upcard] if upcard % 13 else 11)
+        values = [CARD_HARD_VALUES[c] for c in cards]
+        hard = sum(values)
+        if len(values) == 2 and values[0] == values[1]:
+            return self.data["pairs"][str(11 if values[0] == 1 else values[0])][up]
+        if 1 in values and hard <= 11:
+            return self.data["soft"][str(min(max(hard + 10, 13), 20))][up]
+        return self.data["hard"][str(min(max(hard, 5), 20))][up]
+
+    def action(self, hand, upcard: int, can_double: bool = True, can_split: bool = True) -> str:
+        """Best legal action: 'H', 'S', 'D' or 'P'."""
+        entry = self.entry(hand, upcard)
+        evs = dict(entry["ev"])
+        if len(hand) != 2 or not can_double:
+            evs.pop("D", None)
+        if len(hand) != 2 or not can_split:
+            evs.pop("P", None)
+        if len(hand) > 2:
+            # Multi-card hands fall back to the hard/soft row of their total
+            return "S" if evs["S"] >= evs["H"] else "H"
+        return max(evs, key=evs.get)
+
+    def ev(self, hand, upcard: int) -> dict:
+        """EV of each action, keyed by action name."""
+        return {ACTION_NAMES[k]: v for k, v in self.entry(hand, upcard)["ev"].items()}
+
+
+def load_strategy(num_decks: int = NUM_DECKS, hits_soft_17: bool = False,
+                  blackjack_payout: float = BLACKJACK_PAYOUT, cache_dir: str = CACHE_DIR,
+                  rebuild: bool = False) -> StrategyTable:
+    """Load the chart for a rule set from the cache, computing it on a miss."""
+    path = cache_path(num_decks, hits_soft_17, blackjack_payout, cache_dir)
+    if not rebuild and os.path.exists(path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == CACHE_VERSION:
+                return StrategyTable(data)
+        except (OSError, ValueError) as e:
+            GAME.warning("Ignoring unreadable strategy cache %s: %s", path, e)
+
+    data = compute_strategy(num_decks, hits_soft_17, blackjack_payout)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+    except OSError as e:
+        GAME.warning("Could not write strategy cache %s: %s", path, e)
+    return StrategyTable(data)
+
+
+def format_chart(table: StrategyTable) -> str:
+    header = "       " + " ".join(f"{('A' if u == 11 else str(u)):>3}" for u in UPCARDS)
+    lines = []
+    for section, rows, label in (("hard", HARD_TOTALS, "{}"), ("soft", SOFT_TOTALS, "A{}"),
+                                 ("pairs", PAIRS, "{0},{0}")):
+        lines.append(f"{section.upper()}")
+        lines.append(header)
+        for row in rows:
+            if section == "soft":
+                name = label.format(row - 11)
+            elif section == "pairs":
+                name = label.format("A" if row == 11 else row)
+            else:
+                name = label.format(row)
+            cells = " ".join(f"{table.data[section][str(row)][str(u)]['action']:>3}" for u in UPCARDS)
+            lines.append(f"{name:>6} {cells}")
+        lines.append("")
+    lines.append(f"Overall EV with this chart: {table.overall_ev:+.4%} per hand")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Basic strategy chart for the casino blackjack rules")
+    parser.add_argument("--decks", type=int, default=NUM_DECKS)
+    parser.add_argument("--h17", action="store_true", help="dealer hits soft 17")
+    parser.add_argument("--payout", type=float, default=BLACKJACK_PAYOUT, help="blackjack payout")
+    parser.add_argument("--rebuild", action="store_true", help="ignore the cache and recompute")
+    args = parser.parse_args()
+    print(format_chart(load_strategy(args.decks, args.h17, args.payout, rebuild=args.rebuild)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+"""
+Pygame-free blackjack rules engine shared by every table UI.
+
+Owns the shoe, the player hands, the dealer hand and the bankroll, and
+implements the actions (hit / stand / double / split), the dealer policy and
+settlement. The pygame tables only animate and draw what it decides, so the
+engine can be imported by simulations and worker processes without SDL.
+"""
+import random
+
+from cards import Shoe, HandState
+
+NUM_DECKS = 6
+STARTING_BANKROLL = 200
+MIN_BET = 10
+MAX_BET = 500
+DEALER_STANDS_ON = 17   # dealer stands on all 17s
+BLACKJACK_PAYOUT = 1.5  # 3:2
+PENETRATION = 0.75      # fraction of the shoe dealt before the cut card
+
+# Settlement outcomes (same names as blackjack_sim.OUTCOME_NAMES)
+PUSH_BLACKJACK = "push_blackjack"
+PLAYER_BLACKJACK = "player_blackjack"
+DEALER_BLACKJACK = "dealer_blackjack"
+PLAYER_BUST = "player_bust"
+DEALER_BUST = "dealer_bust"
+WIN = "win"
+LOSS = "loss"
+PUSH = "push"
+RIGGED_WIN = "rigged_win"  # a loss flipped by dealer_loss_rate
+
+# Table messages shown by the pygame views, formatted with the hand's delta
+OUTCOME_MESSAGES = {
+    PUSH_BLACKJACK: "Both blackjack — Push.",
+    PLAYER_BLACKJACK: "Blackjack! You win ${delta}.",
+    DEALER_BLACKJACK: "Dealer blackjack. You lose.",
+    PLAYER_BUST: "You bust.",
+    DEALER_BUST: "Dealer busts. You win!",
+    WIN: "You win!",
+    LOSS: "Dealer wins.",
+    PUSH: "Push.",
+    RIGGED_WIN: "Lucky streak! Dealer loses.",
+}
+
+
+def outcome_message(hand) -> str:
+    """Table message for a settled hand."""
+    return OUTCOME_MESSAGES[hand.outcome].format(delta=hand.delta)
+
+
+class PlayerHand(HandState):
+    """A player hand plus its wager and play state."""
+    __slots__ = ("bet", "doubled", "from_split", "finished", "outcome", "delta")
+
+    def __init__(self, bet: int = 0, cards=(), from_split: bool = False):
+        super().__init__(cards)
+        self.bet = bet
+        self.doubled = False
+        self.from_split = from_split
+        self.finished = False
+        self.outcome = None
+        self.delta = 0
+
+    @property
+    def natural(self) -> bool:
+        """Two-card 21 that pays 3:2 (not after a split)."""
+        return self.blackjack and not self.from_split
+
+
+class BlackjackEngine:
+    """One seat at a blackjack table.
+
+    Phases: betting -> player -> dealer -> settle -> done. start_hand() deals
+    immediately; naturals and all-bust hands skip straight to settle.
+    dealer_loss_rate > 0 flips that fraction of player losses into wins (the
+    rigged table in "Manipulated blackjack code.py").
+
+    Every engine owns a seeded random.Random (a fresh seed is drawn when none
+    is given), so a table's shoes and rigging rolls can be reproduced from
+    engine.seed. An optional recorder (see hand_log.HandLog) is told about
+    every shuffle, bet, action and settlement.
+    """
+
+    def __init__(self, num_decks: int = NUM_DECKS, bankroll: int = STARTING_BANKROLL,
+                 min_bet: int = MIN_BET, max_bet: int = MAX_BET, rng=None,
+                 allow_double: bool = True, allow_split: bool = True,
+                 dealer_loss_rate: float = 0.0, seed=None, penetration: float = PENETRATION):
+        if rng is None:
+            seed = seed if seed is not None else random.getrandbits(63)
+            rng = random.Random(seed)
+        self.seed = seed
+        self.rng = rng
+        self.recorder = None
+        self.shoe = Shoe(num_decks, self.rng, penetration)
+        self.bankroll = bankroll
+        self.min_bet = min_bet
+        self.max_bet = max_bet
+        self.allow_double = allow_double
+        self.allow_split = allow_split
+        self.dealer_loss_rate = dealer_loss_rate
+        self.hands = []
+        self.active_i = 0
+        self.dealer = HandState()
+        self.phase = "betting"
+
+    # --- Shoe ---
+    def draw_card(self) -> int:
+        shoe = self.shoe
+        if not shoe.remaining:
+            # Only reachable with a very deep cut card
+            shoe.reshuffle_discards()
+            self._shuffled()
+        return shoe.deal()
+
+    def _shuffled(self):
+        if self.recorder:
+            self.recorder.shuffled(self.shoe)
+
+    def prepare_shoe(self):
+        """Clear the last hand into the discard tray; reshuffle if the cut card is out."""
+        self.shoe.discard()
+        if self.shoe.needs_shuffle:
+            self.shoe.shuffle()
+            self._shuffled()
+
+    # --- Betting / dealing ---
+    def can_bet(self, bet: int) -> bool:
+        return self.min_bet <= bet <= min(self.max_bet, self.bankroll)
+
+    def start_hand(self, bet: int) -> list:
+        """Deal a new hand; returns the four dealt cards as (who, index, card)."""
+        if self.recorder:
+            self.recorder.hand_started(bet)
+        self.prepare_shoe()
+        self.hands = [PlayerHand(bet)]
+        self.active_i = 0
+        self.dealer.clear()
+        dealt = []
+        for who, idx in (("player", 0), ("dealer", 0), ("player", 1), ("dealer", 1)):
+            card = self.draw_card()
+            (self.hands[0] if who == "player" else self.dealer).add(card)
+            dealt.append((who, idx, card))
+        if self.hands[0].natural or self.dealer.blackjack:
+            self.hands[0].finished = True
+            self.phase = "settle"
+        else:
+            self.phase = "player"
+        return dealt
+
+    def reset(self):
+        """Clear the table for the next bet."""
+        self.hands = []
+        self.active_i = 0
+        self.dealer.clear()
+        self.phase = "betting"
+
+    # --- Player actions ---
+    @property
+    def active_hand(self):
+        return self.hands[self.active_i] if self.hands else None
+
+    @property
+    def committed(self) -> int:
+        """Total wagered on the table this hand."""
+        return sum(h.bet for h in self.hands)
+
+    def can_double(self, hand=None) -> bool:
+        hand = hand or self.active_hand
+        return (self.allow_double and self.phase == "player" and hand is not None
+                and len(hand) == 2 and not hand.doubled
+                and self.bankroll >= self.committed + hand.bet)
+
+    def can_split(self, hand=None) -> bool:
+        hand = hand or self.active_hand
+        return (self.allow_split and self.phase == "player" and hand is not None
+                and len(hand) == 2 and hand[0] % 13 == hand[1] % 13
+                and self.bankroll >= self.committed + hand.bet)
+
+    def _record(self, action: str):
+        if self.recorder:
+            self.recorder.action(action)
+
+    def hit(self) -> int:
+        self._record("H")
+        hand = self.active_hand
+        card = self.draw_card()
+        hand.add(card)
+        if hand.bust:
+            hand.finished = True
+            self._advance()
+        return card
+
+    def stand(self):
+        self._record("S")
+        self.active_hand.finished = True
+        self._advance()
+
+    def double(self) -> int:
+        """Double the bet, take exactly one card and stand."""
+        self._record("D")
+        hand = self.active_hand
+        hand.bet *= 2
+        hand.doubled = True
+        card = self.draw_card()
+        hand.add(card)
+        hand.finished = True
+        self._advance()
+        return card
+
+    def split(self):
+        """Split a pair into two hands, each dealt a second card."""
+        self._record("P")
+        hand = self.active_hand
+        first, second = hand.cards
+        hand.clear()
+        hand.from_split = True
+        hand.add(first)
+        new_hand = PlayerHand(hand.bet, (second,), from_split=True)
+        hand.add(self.draw_card())
+        new_hand.add(self.draw_card())
+        self.hands.insert(self.active_i + 1, new_hand)
+
+    def _advance(self):
+        """Move to the next unfinished hand, or on to the dealer."""
+        for i, hand in enumerate(self.hands):
+            if not hand.finished:
+                self.active_i = i
+                return
+        if all(h.bust for h in self.hands):
+            self.phase = "settle"
+        else:
+            self.phase = "dealer"
+
+    # --- Dealer ---
+    def dealer_needs_card(self) -> bool:
+        return self.dealer.total < DEALER_STANDS_ON
+
+    def dealer_step(self) -> bool:
+        """Draw one dealer card or stand. Returns True while the dealer keeps drawing."""
+        if self.dealer_needs_card():
+            self.dealer.add(self.draw_card())
+            return True
+        self.phase = "settle"
+        return False
+
+    def play_dealer(self):
+        while self.phase == "dealer":
+            self.dealer_step()
+
+    # --- Settlement ---
+    def settle(self) -> list:
+        """Pay every hand, update the bankroll and return the hands."""
+        dealer = self.dealer
+        for hand in self.hands:
+            bet = hand.bet
+            if hand.natural and dealer.blackjack:
+                outcome, delta = PUSH_BLACKJACK, 0
+            elif hand.natural:
+                outcome, delta = PLAYER_BLACKJACK, int(bet * BLACKJACK_PAYOUT)
+            elif dealer.blackjack:
+                outcome, delta = DEALER_BLACKJACK, -bet
+            elif hand.bust:
+                outcome, delta = PLAYER_BUST, -bet
+            elif dealer.bust:
+                outcome, delta = DEALER_BUST, bet
+            elif hand.total > dealer.total:
+                outcome, delta = WIN, bet
+            elif hand.total < dealer.total:
+                outcome, delta = LOSS, -bet
+            else:
+                outcome, delta = PUSH, 0
+
+            if delta < 0 and self.dealer_loss_rate and self.rng.random() < self.dealer_loss_rate:
+                outcome, delta = RIGGED_WIN, bet
+
+            hand.outcome = outcome
+            hand.delta = delta
+            self.bankroll += delta
+        self.phase = "done"
+        if self.recorder:
+            self.recorder.settled(self)
+        return self.hands
+
+    @property
+    def last_delta(self) -> int:
+        return sum(h.delta for h in self.hands)
+
+    # --- Headless play ---
+    def play_hand(self, bet: int, policy) -> int:
+        """Play a whole hand with policy(engine) -> 'H'/'S'/'D'/'P'; returns the net result."""
+        self.start_hand(bet)
+        while self.phase == "player":
+            action = policy(self)
+            if action == "D" and self.can_double():
+                self.double()
+            elif action == "P" and self.can_split():
+                self.split()
+            elif action == "H":
+                self.hit()
+            else:
+                self.stand()
+        self.play_dealer()
+        self.settle()
+        return self.last_delta
@@ -0,0 +1,344 @@
+"""
+Headless, vectorized Monte Carlo simulator for the blackjack table rules.
+
+Plays the same game as ``BlackjackEngine`` in blackjack_core.py
+(NUM_DECKS shoe, dealer stands on all 17s, naturals settled right after the
+deal, 3:2 blackjack) but evaluates thousands of hands per NumPy step instead
+of one hand per frame.
+
+Run: python blackjack_sim.py --hands 10000000
+"""
+import argparse
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from blackjack_core import NUM_DECKS, DEALER_STANDS_ON, BLACKJACK_PAYOUT
+from cards import CARD_HARD_VALUES
+
+# Every hand is dealt from its own window of consecutive cards in a freshly
+# shuffled shoe (19 hands per 6-deck shoe). 16 cards covers every realistic
+# player + dealer hand; the draw pointer is clamped at the last card.
+CARDS_PER_HAND = 16
+
+# Outcome codes (index into SimulationResult.outcomes)
+OUTCOME_NAMES = (
+    "push_blackjack",    # both have a natural
+    "player_blackjack",  # player natural, paid 3:2
+    "dealer_blackjack",  # dealer natural
+    "player_bust",
+    "dealer_bust",
+    "win",
+    "loss",
+    "push",
+    "rigged_win",        # a loss flipped to a win by dealer_loss_rate
+)
+(PUSH_BJ, PLAYER_BJ, DEALER_BJ, PLAYER_BUST,
+ DEALER_BUST, WIN, LOSS, PUSH, RIGGED_WIN) = range(len(OUTCOME_NAMES))
+
+# Net result (in bets) for each outcome code
+OUTCOME_PAYOFF = np.array([0.0, BLACKJACK_PAYOUT, -1.0, -1.0, 1.0, 1.0, -1.0, 0.0, 1.0])
+LOSING_OUTCOMES = np.array([DEALER_BJ, PLAYER_BUST, LOSS])
+
+# Dealer final totals histogram: 17, 18, 19, 20, 21, bust
+DEALER_TOTAL_LABELS = ("17", "18", "19", "20", "21", "bust")
+
+
+def shoe_values(num_decks: int = NUM_DECKS) -> np.ndarray:
+    """Blackjack values of an unshuffled shoe, aces counted as 1."""
+    return np.tile(np.array(CARD_HARD_VALUES, dtype=np.int8), num_decks)
+
+
+def deal_windows(rng: np.random.Generator, n_hands: int, num_decks: int = NUM_DECKS) -> np.ndarray:
+    """Shuffle enough shoes for n_hands and cut them into per-hand card windows.
+
+    Returns an (n_hands, CARDS_PER_HAND) int8 array of card values.
+    """
+    shoe = shoe_values(num_decks)
+    hands_per_shoe = len(shoe) // CARDS_PER_HAND
+    n_shoes = -(-n_hands // hands_per_shoe)
+    shoes = rng.permuted(np.broadcast_to(shoe, (n_shoes, len(shoe))), axis=1)
+    windows = shoes[:, :hands_per_shoe * CARDS_PER_HAND].reshape(-1, CARDS_PER_HAND)
+    return windows[:n_hands]
+
+
+def soft_total(hard: np.ndarray, has_ace: np.ndarray) -> np.ndarray:
+    """Best total of a hand, like hand_total(): one ace counts 11 if it fits."""
+    return hard + 10 * (has_ace & (hard <= 11))
+
+
+def _draw_until(cards, rows, ptr, hard, has_ace, stop_at):
+    """Draw cards for `rows` until each of their totals reaches stop_at."""
+    total = soft_total(hard[rows], has_ace[rows])
+    rows = rows[total < stop_at]
+    while rows.size:
+        card = cards[rows, ptr[rows]]
+        ptr[rows] = np.minimum(ptr[rows] + 1, CARDS_PER_HAND - 1)
+        hard[rows] += card
+        has_ace[rows] |= card == 1
+        rows = rows[soft_total(hard[rows], has_ace[rows]) < stop_at]
+
+
+def play_batch(cards: np.ndarray, player_stands_on: int = DEALER_STANDS_ON):
+    """Play one batch of hands.
+
+    cards: (n, CARDS_PER_HAND) card values dealt player, dealer, player, dealer, ...
+    player_stands_on: the player hits below this total and stands at or above it.
+
+    Returns (outcome codes, dealer final totals) as int arrays.
+    """
+    n = cards.shape[0]
+    cards = cards.astype(np.int16, copy=False)
+
+    p_hard = cards[:, 0] + cards[:, 2]
+    p_ace = (cards[:, 0] == 1) | (cards[:, 2] == 1)
+    d_hard = cards[:, 1] + cards[:, 3]
+    d_ace = (cards[:, 1] == 1) | (cards[:, 3] == 1)
+
+    p_natural = soft_total(p_hard, p_ace) == 21
+    d_natural = soft_total(d_hard, d_ace) == 21
+    natural = p_natural | d_natural
+
+    # Player acts (hit below threshold), then dealer draws to 17 unless the
+    # player already busted; naturals end the hand straight after the deal.
+    ptr = np.full(n, 4, dtype=np.int64)
+    _draw_until(cards, np.flatnonzero(~natural), ptr, p_hard, p_ace, player_stands_on)
+    p_total = soft_total(p_hard, p_ace)
+    p_bust = p_total > 21
+
+    _draw_until(cards, np.flatnonzero(~natural & ~p_bust), ptr, d_hard, d_ace, DEALER_STANDS_ON)
+    d_total = soft_total(d_hard, d_ace)
+    d_bust = d_total > 21
+
+    # Same precedence as settle_hand()
+    outcome = np.select(
+        [p_natural & d_natural, p_natural, d_natural, p_bust, d_bust,
+         p_total > d_total, p_total < d_total],
+        [PUSH_BJ, PLAYER_BJ, DEALER_BJ, PLAYER_BUST, DEALER_BUST, WIN, LOSS],
+        default=PUSH,
+    )
+    return outcome, d_total
+
+
+def rig_outcomes(rng: np.random.Generator, outcome: np.ndarray, dealer_loss_rate: float) -> np.ndarray:
+    """Flip losses to RIGGED_WIN with probability dealer_loss_rate, like BlackjackEngine.settle()."""
+    if dealer_loss_rate <= 0:
+        return outcome
+    flip = np.isin(outcome, LOSING_OUTCOMES) & (rng.random(outcome.size) < dealer_loss_rate)
+    return np.where(flip, RIGGED_WIN, outcome)
+
+
+def payoff_amounts(bet: int) -> np.ndarray:
+    """Bankroll change for each outcome code at a flat bet (blackjack pays int(bet * 1.5))."""
+    return np.trunc(OUTCOME_PAYOFF * bet).astype(np.int64)
+
+
+@dataclass
+class SimulationResult:
+    """Aggregated results of a simulation run (all money values in bets)."""
+    hands: int = 0
+    total: float = 0.0
+    total_sq: float = 0.0
+    outcomes: np.ndarray = field(default_factory=lambda: np.zeros(len(OUTCOME_NAMES), dtype=np.int64))
+    dealer_totals: np.ndarray = field(default_factory=lambda: np.zeros(len(DEALER_TOTAL_LABELS), dtype=np.int64))
+    seconds: float = 0.0
+
+    def add_batch(self, outcome: np.ndarray, dealer_total: np.ndarray, dealer_played: np.ndarray):
+        """Fold one batch of played hands into the running totals."""
+        counts = np.bincount(outcome, minlength=len(OUTCOME_NAMES))
+        self.hands += outcome.size
+        self.outcomes += counts
+        self.total += float(counts @ OUTCOME_PAYOFF)
+        self.total_sq += float(counts @ (OUTCOME_PAYOFF ** 2))
+        totals = np.minimum(dealer_total[dealer_played], 22) - 17
+        self.dealer_totals += np.bincount(totals, minlength=len(DEALER_TOTAL_LABELS))
+
+    @property
+    def ev(self) -> float:
+        """Expected value per hand; the house edge is -ev."""
+        return self.total / self.hands if self.hands else 0.0
+
+    @property
+    def std(self) -> float:
+        """Standard deviation of the result of a single hand."""
+        if not self.hands:
+            return 0.0
+        return max(self.total_sq / self.hands - self.ev ** 2, 0.0) ** 0.5
+
+    @property
+    def stderr(self) -> float:
+        """Standard error of the EV estimate."""
+        return self.std / self.hands ** 0.5 if self.hands else 0.0
+
+    @property
+    def hands_per_second(self) -> float:
+        return self.hands / self.seconds if self.seconds else 0.0
+
+    def summary(self) -> str:
+        lines = [
+            f"Hands:        {self.hands:,}",
+            f"EV per hand:  {self.ev:+.5f} bets (house edge {-self.ev * 100:.3f}% ± {1.96 * self.stderr * 100:.3f}%)",
+            f"Std dev:      {self.std:.4f} bets",
+            f"Speed:        {self.hands_per_second:,.0f} hands/s",
+            "Outcomes:",
+        ]
+        for name, count in zip(OUTCOME_NAMES, self.outcomes):
+            lines.append(f"  {name:<17} {count:>12,}  {count / max(self.hands, 1):7.2%}")
+        lines.append("Dealer final totals (hands the dealer played out):")
+        dealer_hands = max(int(self.dealer_totals.sum()), 1)
+        for name, count in zip(DEALER_TOTAL_LABELS, self.dealer_totals):
+            lines.append(f"  {name:<17} {count:>12,}  {count / dealer_hands:7.2%}")
+        return "\n".join(lines)
+
+
+def simulate(num_hands: int, num_decks: int = NUM_DECKS, player_stands_on: int = DEALER_STANDS_ON,
+             batch_size: int = 200_000, seed=None, dealer_loss_rate: float = 0.0) -> SimulationResult:
+    """Simulate num_hands hands and return the aggregated result."""
+    rng = np.random.default_rng(seed)
+    result = SimulationResult()
+    start = time.perf_counter()
+    remaining = num_hands
+    while remaining > 0:
+        n = min(batch_size, remaining)
+        cards = deal_windows(rng, n, num_decks)
+        outcome, d_total = play_batch(cards, player_stands_on)
+        dealer_played = (outcome != PLAYER_BUST) & (outcome > DEALER_BJ)
+        outcome = rig_outcomes(rng, outcome, dealer_loss_rate)
+        result.add_batch(outcome, d_total, dealer_played)
+        remaining -= n
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+@dataclass
+class SessionResult:
+    """Aggregated bankroll sessions: play flat bets until broke or max_hands.
+
+    A session is ruined once the bankroll can no longer cover the bet. Hand
+    results (in bets) feed the same EV statistics as SimulationResult.
+    """
+    sessions: int = 0
+    ruined: int = 0
+    length: int = 0          # sum of session lengths (hands)
+    length_sq: int = 0
+    final: float = 0.0       # sum of final bankrolls
+    final_sq: float = 0.0
+    hands: SimulationResult = field(default_factory=SimulationResult)
+
+    def merge(self, other: "SessionResult"):
+        """Fold another (independently seeded) result into this one."""
+        self.sessions += other.sessions
+        self.ruined += other.ruined
+        self.length += other.length
+        self.length_sq += other.length_sq
+        self.final += other.final
+        self.final_sq += other.final_sq
+        hands = self.hands
+        hands.hands += other.hands.hands
+        hands.total += other.hands.total
+        hands.total_sq += other.hands.total_sq
+        hands.outcomes += other.hands.outcomes
+        hands.dealer_totals += other.hands.dealer_totals
+        hands.seconds += other.hands.seconds
+
+    @property
+    def ruin_probability(self) -> float:
+        return self.ruined / self.sessions if self.sessions else 0.0
+
+    @property
+    def ruin_stderr(self) -> float:
+        p = self.ruin_probability
+        return (p * (1 - p) / self.sessions) ** 0.5 if self.sessions else 0.0
+
+    @property
+    def mean_length(self) -> float:
+        return self.length / self.sessions if self.sessions else 0.0
+
+    @property
+    def length_stderr(self) -> float:
+        if not self.sessions:
+            return 0.0
+        var = max(self.length_sq / self.sessions - self.mean_length ** 2, 0.0)
+        return (var / self.sessions) ** 0.5
+
+    @property
+    def mean_final(self) -> float:
+        return self.final / self.sessions if self.sessions else 0.0
+
+    @property
+    def final_stderr(self) -> float:
+        if not self.sessions:
+            return 0.0
+        var = max(self.final_sq / self.sessions - self.mean_final ** 2, 0.0)
+        return (var / self.sessions) ** 0.5
+
+
+def simulate_sessions(num_sessions: int, bankroll: int, bet: int, max_hands: int = 1000,
+                      num_decks: int = NUM_DECKS, player_stands_on: int = DEALER_STANDS_ON,
+                      dealer_loss_rate: float = 0.0, seed=None, hands_per_round: int = 128) -> SessionResult:
+    """Play num_sessions flat-bet sessions side by side.
+
+    Every round deals hands_per_round hands to each live session at once;
+    a session's bankroll path is the cumulative sum of its hand results, so
+    the first point below the bet (or max_hands) ends it.
+    """
+    rng = np.random.default_rng(seed)
+    amounts = payoff_amounts(bet)
+    result = SessionResult()
+    hands = result.hands
+    start = time.perf_counter()
+
+    money = np.full(num_sessions, bankroll, dtype=np.int64)
+    played = np.zeros(num_sessions, dtype=np.int64)
+    live = np.flatnonzero(money >= bet)
+    ruined = np.zeros(num_sessions, dtype=bool)
+    ruined[money < bet] = True
+    while live.size:
+        k = int(min(hands_per_round, max_hands - played[live].max()))
+        n = live.size
+        outcome, d_total = play_batch(deal_windows(rng, n * k, num_decks), player_stands_on)
+        dealer_played = (outcome != PLAYER_BUST) & (outcome > DEALER_BJ)
+        outcome = rig_outcomes(rng, outcome, dealer_loss_rate).reshape(n, k)
+
+        path = money[live, None] + np.cumsum(amounts[outcome], axis=1)
+        broke = path < bet
+        # Hands this round per session: up to and including the one that broke it
+        taken = np.where(broke.any(axis=1), broke.argmax(axis=1) + 1, k)
+        taken = np.minimum(taken, max_hands - played[live])
+        used = np.arange(k) < taken[:, None]
+
+        hands.add_batch(outcome[used], d_total.reshape(n, k)[used], dealer_played.reshape(n, k)[used])
+        money[live] = path[np.arange(n), taken - 1]
+        played[live] += taken
+        ruined[live] = money[live] < bet
+        live = live[~ruined[live] & (played[live] < max_hands)]
+
+    result.sessions = num_sessions
+    result.ruined = int(ruined.sum())
+    result.length = int(played.sum())
+    result.length_sq = int((played ** 2).sum())
+    result.final = float(money.sum())
+    result.final_sq = float((money.astype(np.float64) ** 2).sum())
+    hands.seconds = time.perf_counter() - start
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo house edge for the casino blackjack rules")
+    parser.add_argument("--hands", type=int, default=1_000_000, help="number of hands to simulate")
+    parser.add_argument("--decks", type=int, default=NUM_DECKS, help="decks per shoe")
+    parser.add_argument("--stand-on", type=int, default=DEALER_STANDS_ON,
+                        help="player hits below this total (default mimics the dealer)")
+    parser.add_argument("--batch", type=int, default=200_000, help="hands per NumPy step")
+    parser.add_argument("--seed", type=int, default=None, help="RNG seed")
+    parser.add_argument("--loss-rate", type=float, default=0.0,
+                        help="fraction of player losses flipped to wins (rigged table)")
+    args = parser.parse_args()
+
+    result = simulate(args.hands, args.decks, args.stand_on, args.batch, args.seed, args.loss_rate)
+    print(result.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Parallel parameter sweep over the blackjack table rules.
+
+Runs bankroll sessions (see blackjack_sim.simulate_sessions) for every
+combination of dealer loss rate, deck count, bet size and starting bankroll,
+split into independently seeded chunks across a ProcessPoolExecutor, and
+writes one row per combination with 95% confidence intervals to CSV and/or
+JSON. Workers only import NumPy and blackjack_sim, never pygame.
+
+Run: python blackjack_sweep.py --loss-rates 0,0.5,0.95 --bets 10,25 --sessions 20000
+"""
+import argparse
+import csv
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from blackjack_core import NUM_DECKS, STARTING_BANKROLL, MIN_BET, DEALER_STANDS_ON
+from blackjack_sim import OUTCOME_NAMES, SessionResult, simulate_sessions
+
+Z95 = 1.96
+
+
+@dataclass(frozen=True)
+class SweepPoint:
+    """One combination of swept parameters."""
+    dealer_loss_rate: float
+    num_decks: int
+    bet: int
+    bankroll: int
+
+
+def _run_chunk(task) -> tuple:
+    """Worker entry point: play one seeded chunk of sessions for one point."""
+    index, point, sessions, max_hands, stands_on, seed = task
+    result = simulate_sessions(sessions, point.bankroll, point.bet, max_hands, point.num_decks,
+                               stands_on, point.dealer_loss_rate, seed)
+    return index, result
+
+
+def make_tasks(points, sessions: int, chunk_sessions: int, max_hands: int, stands_on: int, seed=None) -> list:
+    """Cut every point into chunks of at most chunk_sessions, each with its own seed."""
+    chunks = []
+    for index, point in enumerate(points):
+        for start in range(0, sessions, chunk_sessions):
+            chunks.append((index, point, min(chunk_sessions, sessions - start)))
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+    return [(index, point, n, max_hands, stands_on, child)
+            for (index, point, n), child in zip(chunks, seeds)]
+
+
+def run_sweep(points, sessions: int, max_hands: int = 1000, stands_on: int = DEALER_STANDS_ON,
+              workers=None, chunk_sessions: int = 2000, seed=None) -> list:
+    """Run every point and return one merged SessionResult per point, in order."""
+    tasks = make_tasks(points, sessions, chunk_sessions, max_hands, stands_on, seed)
+    results = [SessionResult() for _ in points]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for index, result in pool.map(_run_chunk, tasks):
+            results[index].merge(result)
+    return results
+
+
+def result_row(point: SweepPoint, result: SessionResult) -> dict:
+    """Flat record for CSV/JSON; money values are in dollars, EV in bets."""
+    hands = result.hands
+    ev, ev_ci = hands.ev, Z95 * hands.stderr
+    ruin, ruin_ci = result.ruin_probability, Z95 * result.ruin_stderr
+    length, length_ci = result.mean_length, Z95 * result.length_stderr
+    final, final_ci = result.mean_final, Z95 * result.final_stderr
+    row = {
+        "dealer_loss_rate": point.dealer_loss_rate,
+        "num_decks": point.num_decks,
+        "bet": point.bet,
+        "bankroll": point.bankroll,
+        "sessions": result.sessions,
+        "hands": hands.hands,
+        "ev_per_hand": ev,
+        "ev_ci_low": ev - ev_ci,
+        "ev_ci_high": ev + ev_ci,
+        "payout_rate": 1.0 + ev,  # money returned per unit wagered
+        "ruin_probability": ruin,
+        "ruin_ci_low": max(ruin - ruin_ci, 0.0),
+        "ruin_ci_high": min(ruin + ruin_ci, 1.0),
+        "mean_session_hands": length,
+        "session_hands_ci_low": length - length_ci,
+        "session_hands_ci_high": length + length_ci,
+        "mean_final_bankroll": final,
+        "final_bankroll_ci_low": final - final_ci,
+        "final_bankroll_ci_high": final + final_ci,
+    }
+    for name, count in zip(OUTCOME_NAMES, hands.outcomes):
+        row[f"rate_{name}"] = count / max(hands.hands, 1)
+    return row
+
+
+def write_csv(path: str, rows: list):
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_json(path: str, rows: list, meta: dict):
+    with open(path, 'w') as f:
+        json.dump({"meta": meta, "results": rows}, f, indent=2)
+
+
+def _floats(text: str) -> list:
+    return [float(v) for v in text.split(',') if v]
+
+
+def _ints(text: str) -> list:
+    return [int(v) for v in text.split(',') if v]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep rigging, shoe, bet and bankroll settings in parallel")
+    parser.add_argument("--loss-rates", type=_floats, default=[0.0, 0.95],
+                        help="comma-separated DEALER_LOSS_RATE values")
+    parser.add_argument("--decks", type=_ints, default=[NUM_DECKS], help="comma-separated NUM_DECKS values")
+    parser.add_argument("--bets", type=_ints, default=[MIN_BET], help="comma-separated flat bet sizes")
+    parser.add_argument("--bankrolls", type=_ints, default=[STARTING_BANKROLL],
+                        help="comma-separated STARTING_BANKROLL values")
+    parser.add_argument("--sessions", type=int, default=10_000, help="sessions per parameter combination")
+    parser.add_argument("--max-hands", type=int, default=1000, help="hands before a session walks away")
+    parser.add_argument("--stand-on", type=int, default=DEALER_STANDS_ON,
+                        help="player hits below this total (default mimics the dealer)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--chunk", type=int, default=2000, help="sessions per worker task")
+    parser.add_argument("--seed", type=int, default=None, help="root seed; every chunk gets its own stream")
+    parser.add_argument("--csv", default=None, help="write results to this CSV file")
+    parser.add_argument("--json", default=None, help="write results to this JSON file")
+    args = parser.parse_args()
+
+    points = [SweepPoint(*combo) for combo in
+              itertools.product(args.loss_rates, args.decks, args.bets, args.bankrolls)]
+    workers = args.workers or os.cpu_count()
+    start = time.perf_counter()
+    results = run_sweep(points, args.sessions, args.max_hands, args.stand_on, workers, args.chunk, args.seed)
+    seconds = time.perf_counter() - start
+
+    rows = [result_row(p, r) for p, r in zip(points, results)]
+    total_hands = sum(r["hands"] for r in rows)
+    for row in rows:
+        print(f"loss_rate={row['dealer_loss_rate']:<5g} decks={row['num_decks']:<2} "
+              f"bet={row['bet']:<4} bankroll={row['bankroll']:<6} "
+              f"EV {row['ev_per_hand']:+.4f} ± {row['ev_per_hand'] - row['ev_ci_low']:.4f}  "
+              f"ruin {row['ruin_probability']:6.2%}  "
+              f"hands/session {row['mean_session_hands']:7.1f}")
+    print(f"{total_hands:,} hands on {workers} workers in {seconds:.1f}s "
+          f"({total_hands / seconds:,.0f} hands/s)")
+
+    meta = {"sessions": args.sessions, "max_hands": args.max_hands, "stand_on": args.stand_on,
+            "seed": args.seed, "workers": workers, "seconds": seconds, "hands": total_hands}
+    if args.csv:
+        write_csv(args.csv, rows)
+    if args.json:
+        write_json(args.json, rows, meta)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Pre-rendered card faces for the blackjack tables.
+
+A CardAtlas renders all 52 faces and the card back into one surface the
+first time a size is requested; drawing a card is then a single blit of a
+cell. get_atlas() keeps one atlas per card size, so split hands and scaled
+layouts share them.
+"""
+import pygame
+
+from cards import CARD_LABELS, RED_SUITS
+from fonts import get_font
+
+CARD_W, CARD_H = 80, 112
+BACK = 52  # atlas cell of the card back
+
+WHITE = (245, 245, 245)
+RED = (220, 60, 60)
+BLACK = (0, 0, 0)
+BACK_COLOR = (30, 60, 130)
+BACK_EMBLEM = (200, 220, 255)
+
+# Font sizes at the standard 80 x 112 card; scaled with the card width
+RANK_FONT_SIZE = 18
+SUIT_FONT_SIZE = 28
+
+
+class CardAtlas:
+    """All 53 card images of one size, laid out in a single row."""
+
+    def __init__(self, width: int = CARD_W, height: int = CARD_H):
+        self.width = width
+        self.height = height
+        self.cells = [pygame.Rect(i * width, 0, width, height) for i in range(53)]
+        self.surface = pygame.Surface((53 * width, height), pygame.SRCALPHA)
+        self._render()
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+
+    def _render(self):
+        w, h = self.width, self.height
+        scale = w / CARD_W
+        radius = max(2, round(10 * scale))
+        rank_font = get_font("arial", max(8, round(RANK_FONT_SIZE * scale)))
+        suit_font = get_font("arial", max(10, round(SUIT_FONT_SIZE * scale)), bold=True)
+        pad_x, pad_y = round(8 * scale), round(6 * scale)
+
+        for card, (rank, suit) in enumerate(CARD_LABELS):
+            cell = self.surface.subsurface(self.cells[card])
+            r = cell.get_rect()
+            pygame.draw.rect(cell, WHITE, r, border_radius=radius)
+            pygame.draw.rect(cell, BLACK, r, width=2, border_radius=radius)
+            col = RED if card // 13 in RED_SUITS else BLACK
+            rank_surf = rank_font.render(rank, True, col)
+            cell.blit(rank_surf, (pad_x, pad_y))
+            cell.blit(rank_surf, rank_surf.get_rect(bottomright=(w - pad_x, h - pad_y)))
+            suit_surf = suit_font.render(suit, True, col)
+            cell.blit(suit_surf, suit_surf.get_rect(center=(w // 2, h // 2)))
+
+        cell = self.surface.subsurface(self.cells[BACK])
+        r = cell.get_rect()
+        pygame.draw.rect(cell, BACK_COLOR, r, border_radius=radius)
+        pygame.draw.rect(cell, WHITE, r, width=max(1, round(3 * scale)), border_radius=radius)
+        pygame.draw.circle(cell, BACK_EMBLEM, (w // 2, h // 2), max(3, round(18 * scale)))
+
+    def blit(self, surface, x, y, card, face_up=True):
+        """Draw one card at (x, y); returns the rect drawn on surface."""
+        area = self.cells[card if face_up else BACK]
+        return surface.blit(self.surface, (x, y), area)
+
+
+_atlases = {}
+
+
+def get_atlas(width: int = CARD_W, height: int = CARD_H) -> CardAtlas:
+    """Shared atlas for a card size, rendered on first use (needs pygame.font)."""
+    atlas = _atlases.get((width, height))
+    if atlas is None:
+        atlas = _atlases[(width, height)] = CardAtlas(width, height)
+    return atlas
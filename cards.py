@@ -0,0 +1,259 @@
+"""
+Compact card encoding and array-backed shoe shared by the blackjack tables.
+
+A card is a single int 0..51 (stored as a uint8 in the shoe):
+rank index = card % 13 (0 = ace ... 12 = king), suit index = card // 13.
+"""
+import random
+from array import array
+
+SUITS = ["♠", "♥", "♦", "♣"]
+RANKS = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
+RED_SUITS = (1, 2)  # hearts, diamonds
+
+# Per-card lookup tables, indexed by card id
+CARD_VALUES = tuple(11 if r == 0 else min(r + 1, 10) for _ in SUITS for r in range(13))
+CARD_HARD_VALUES = tuple(1 if v == 11 else v for v in CARD_VALUES)  # aces counted as 1
+CARD_LABELS = tuple((rank, suit) for suit in SUITS for rank in RANKS)
+CARD_HILO = tuple(1 if 2 <= v <= 6 else -1 if v in (1, 10) else 0 for v in CARD_HARD_VALUES)  # Hi-Lo tags
+
+
+def make_card(rank_index: int, suit_index: int) -> int:
+    """Card id for a rank index (0 = ace) and suit index."""
+    return suit_index * 13 + rank_index
+
+
+def card_rank(card: int) -> int:
+    return card % 13
+
+
+def card_suit(card: int) -> int:
+    return card // 13
+
+
+def card_label(card: int) -> tuple:
+    """(rank, suit) strings for drawing, e.g. ("10", "♥")."""
+    return CARD_LABELS[card]
+
+
+def is_ace(card: int) -> bool:
+    return card % 13 == 0
+
+
+def is_red(card: int) -> bool:
+    return card // 13 in RED_SUITS
+
+
+def hand_total(cards):
+    """Best blackjack total of a sequence of card ids."""
+    total = 0
+    aces = 0
+    for c in cards:
+        total += CARD_VALUES[c]
+        if c % 13 == 0:
+            aces += 1
+    while total > 21 and aces:
+        total -= 10
+        aces -= 1
+    return total
+
+
+class Shoe:
+    """Multi-deck shoe stored as a flat uint8 array with a dealing cursor.
+
+    Cards are never removed from the buffer: dealing advances the cursor and
+    shuffling permutes the same buffer in place, so a hand allocates nothing.
+    The buffer is laid out as [discard tray | cards on the table | undealt];
+    discard() clears the table into the tray between hands, and the cut card
+    sits at penetration * len(shoe), so needs_shuffle tells the table to
+    reshuffle before the next hand rather than in the middle of one.
+
+    The composition of the undealt cards is tracked as it is dealt: per-rank
+    and per-value counts plus the Hi-Lo running count, so count and bust-odds
+    queries never scan the shoe.
+    """
+
+    def __init__(self, num_decks: int = 6, rng=None, penetration: float = 0.75):
+        if not 0.0 < penetration <= 1.0:
+            raise ValueError("penetration must be in (0, 1]")
+        self.num_decks = num_decks
+        self.rng = rng if rng is not None else random
+        self.penetration = penetration
+        self.cards = array('B', range(52)) * num_decks
+        self.cursor = 0
+        self.discard_mark = 0  # cards before this index are in the discard tray
+        self.rank_counts = [0] * 13   # undealt cards per rank index
+        self.value_counts = [0] * 11  # undealt cards per hard value (1 = ace ... 10)
+        self.running_count = 0        # Hi-Lo count of the cards dealt since the shuffle
+        self.shuffle()
+
+    def shuffle(self):
+        """Shuffle the whole shoe in place, emptying the discard tray."""
+        self.rng.shuffle(self.cards)
+        self.cursor = 0
+        self.discard_mark = 0
+        n = self.num_decks
+        self.rank_counts[:] = [4 * n] * 13
+        self.value_counts[:] = [0] + [4 * n] * 9 + [16 * n]
+        self.running_count = 0
+
+    def _recount(self):
+        """Rebuild the composition from the undealt cards (after reshuffle_discards)."""
+        self.rank_counts[:] = [0] * 13
+        self.value_counts[:] = [0] * 11
+        running = 0
+        for card in self.cards[self.cursor:]:
+            self.rank_counts[card % 13] += 1
+            self.value_counts[CARD_HARD_VALUES[card]] += 1
+            running -= CARD_HILO[card]  # a full shoe's tags sum to zero
+        self.running_count = running
+
+    def deal(self) -> int:
+        """Deal the next card id."""
+        card = self.cards[self.cursor]
+        self.cursor += 1
+        self.rank_counts[card % 13] -= 1
+        self.value_counts[CARD_HARD_VALUES[card]] -= 1
+        self.running_count += CARD_HILO[card]
+        return card
+
+    def deal_many(self, n: int) -> memoryview:
+        """Deal n cards at once as a read-only view into the shoe buffer."""
+        start = self.cursor
+        self.cursor += n
+        dealt = memoryview(self.cards)[start:self.cursor].toreadonly()
+        for card in dealt:
+            self.rank_counts[card % 13] -= 1
+            self.value_counts[CARD_HARD_VALUES[card]] -= 1
+            self.running_count += CARD_HILO[card]
+        return dealt
+
+    def discard(self):
+        """Move every card dealt so far into the discard tray (call between hands)."""
+        self.discard_mark = self.cursor
+
+    def reshuffle_discards(self):
+        """Emergency refill when the shoe runs dry mid-hand.
+
+        The cards still on the table move to the front of the buffer and the
+        shuffled discard tray goes in behind them; only happens with a very
+        deep cut card.
+        """
+        cards = self.cards
+        in_play = cards[self.discard_mark:self.cursor]
+        tray = cards[:self.discard_mark]
+        self.rng.shuffle(tray)
+        n = len(in_play)
+        cards[:n] = in_play
+        cards[n:n + len(tray)] = tray
+        self.cursor = n
+        self.discard_mark = 0
+        self._recount()
+
+    @property
+    def cut_index(self) -> int:
+        """Position of the cut card."""
+        return int(len(self.cards) * self.penetration)
+
+    @property
+    def needs_shuffle(self) -> bool:
+        """True once the cut card has come out."""
+        return self.cursor >= self.cut_index
+
+    @property
+    def discards(self) -> memoryview:
+        """Read-only view of the discard tray."""
+        return memoryview(self.cards)[:self.discard_mark].toreadonly()
+
+    @property
+    def remaining(self) -> int:
+        return len(self.cards) - self.cursor
+
+    def true_count(self, hidden=()) -> float:
+        """Running count per deck remaining.
+
+        hidden: dealt cards the players cannot see yet (the dealer's hole
+        card); they are counted as still in the shoe.
+        """
+        running = self.running_count
+        remaining = self.remaining
+        for card in hidden:
+            running -= CARD_HILO[card]
+            remaining += 1
+        return running * 52 / remaining if remaining else 0.0
+
+    def bust_probability(self, hard: int, hidden=()) -> float:
+        """Chance that the next card busts a hand with this hard total (aces as 1)."""
+        need = 21 - hard  # any card worth more than this busts
+        if need >= 10:
+            return 0.0
+        busting = sum(self.value_counts[max(need + 1, 1):])
+        remaining = self.remaining
+        for card in hidden:
+            remaining += 1
+            if CARD_HARD_VALUES[card] > need:
+                busting += 1
+        return busting / remaining if remaining else 0.0
+
+    def __len__(self):
+        return self.remaining
+
+    def as_numpy(self):
+        """Zero-copy NumPy uint8 view of the cards not yet dealt."""
+        import numpy as np
+        return np.frombuffer(self.cards, dtype=np.uint8)[self.cursor:]
+
+
+class HandState:
+    """A blackjack hand whose total and flags are updated in O(1) per card.
+
+    hard counts every ace as 1; at most one ace can count as 11, and
+    soft_aces (0 or 1) says whether one currently does.
+    """
+    __slots__ = ("cards", "count", "hard", "aces", "soft_aces", "total", "blackjack", "bust")
+
+    def __init__(self, cards=()):
+        self.cards = []
+        self.clear()
+        for card in cards:
+            self.add(card)
+
+    def clear(self):
+        """Empty the hand, keeping the card list allocated."""
+        self.cards.clear()
+        self.count = 0
+        self.hard = 0
+        self.aces = 0
+        self.soft_aces = 0
+        self.total = 0
+        self.blackjack = False
+        self.bust = False
+
+    def add(self, card: int):
+        """Add a card and update the running totals."""
+        self.cards.append(card)
+        self.count += 1
+        self.hard += CARD_HARD_VALUES[card]
+        if card % 13 == 0:
+            self.aces += 1
+        if self.aces and self.hard <= 11:
+            self.soft_aces = 1
+            self.total = self.hard + 10
+        else:
+            self.soft_aces = 0
+            self.total = self.hard
+        self.blackjack = self.total == 21 and self.count == 2
+        self.bust = self.total > 21
+
+    @property
+    def soft(self) -> bool:
+        return self.soft_aces > 0
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return iter(self.cards)
+
+    def __getitem__(self, index):
+        return self.cards[index]
@@ -0,0 +1,213 @@
+"""
+Compact collision grid.
+
+One byte per tile in a flat bytearray (row-major, stride = width) holding
+bit flags: SOLID plus INTERACTABLE, SLOW and TRIGGER for gameplay zones.
+Scalar lookups are a bounds check and an index; the batched queries take
+arrays of pixel positions and answer for all of them in one NumPy pass
+(falling back to a Python loop when NumPy is missing). move_box() sweeps an
+axis-aligned box through the grid so movers slide along walls and cannot
+tunnel through them on a long frame.
+"""
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Tile flags
+SOLID = 1
+INTERACTABLE = 2
+SLOW = 4
+TRIGGER = 8
+
+# Tiled tile properties that set a flag (see World.load_tmx_only)
+FLAG_PROPERTIES = {'collision': SOLID, 'interactable': INTERACTABLE, 'slow': SLOW, 'trigger': TRIGGER}
+
+# Flags reported for positions outside the map: out of bounds is solid
+OUTSIDE = SOLID
+
+# Keeps a box flush against a wall from counting as overlapping it
+EPSILON = 1e-6
+
+
+class CollisionGrid:
+    """width x height tiles of bit flags, tilesize pixels each."""
+
+    def __init__(self, width: int, height: int, tilesize: int, cells: bytearray = None):
+        self.width = width
+        self.height = height
+        self.stride = width
+        self.tilesize = tilesize
+        self.cells = cells if cells is not None else bytearray(width * height)
+        if len(self.cells) != width * height:
+            raise ValueError(f"expected {width * height} cells, got {len(self.cells)}")
+
+    @classmethod
+    def from_rows(cls, rows, tilesize: int) -> "CollisionGrid":
+        """Grid from a list of rows of booleans (True = solid) or flag ints."""
+        height = len(rows)
+        width = len(rows[0]) if rows else 0
+        cells = bytearray(width * height)
+        for y, row in enumerate(rows):
+            cells[y * width:(y + 1) * width] = bytes(int(v) for v in row)
+        return cls(width, height, tilesize, cells)
+
+    def rows(self) -> list:
+        """List of rows of bools (solid or not), for code that wants the old layout."""
+        w = self.width
+        return [[bool(c & SOLID) for c in self.cells[y * w:(y + 1) * w]] for y in range(self.height)]
+
+    def __len__(self):
+        return len(self.cells)
+
+    # --- tile coordinates -------------------------------------------------
+
+    def in_bounds(self, tx: int, ty: int) -> bool:
+        return 0 <= tx < self.width and 0 <= ty < self.height
+
+    def tile_flags(self, tx: int, ty: int) -> int:
+        if 0 <= tx < self.width and 0 <= ty < self.height:
+            return self.cells[ty * self.stride + tx]
+        return OUTSIDE
+
+    def set_flags(self, tx: int, ty: int, flags: int):
+        self.cells[ty * self.stride + tx] = flags
+
+    def add_flags(self, tx: int, ty: int, flags: int):
+        self.cells[ty * self.stride + tx] |= flags
+
+    def clear_flags(self, tx: int, ty: int, flags: int):
+        self.cells[ty * self.stride + tx] &= ~flags & 0xFF
+
+    def count(self, flag: int = SOLID) -> int:
+        """Number of tiles with flag set."""
+        if NUMPY_AVAILABLE:
+            return int(np.count_nonzero(self.as_numpy() & flag))
+        return sum(1 for c in self.cells if c & flag)
+
+    def as_numpy(self):
+        """Zero-copy (height, width) uint8 view of the flags."""
+        return np.frombuffer(self.cells, dtype=np.uint8).reshape(self.height, self.width)
+
+    # --- pixel coordinates ------------------------------------------------
+
+    def flags_at(self, x: float, y: float) -> int:
+        """Flags of the tile under pixel (x, y)."""
+        ts = self.tilesize
+        return self.tile_flags(int(x // ts), int(y // ts))
+
+    def is_solid(self, x: float, y: float) -> bool:
+        return bool(self.flags_at(x, y) & SOLID)
+
+    def flags_at_many(self, positions):
+        """Flags under every (x, y) pixel position; a uint8 array (list without NumPy)."""
+        if not NUMPY_AVAILABLE:
+            return [self.flags_at(x, y) for x, y in positions]
+        pos = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        tiles = np.floor_divide(pos, self.tilesize).astype(np.intp)
+        tx, ty = tiles[:, 0], tiles[:, 1]
+        inside = (tx >= 0) & (tx < self.width) & (ty >= 0) & (ty < self.height)
+        flags = np.full(len(pos), OUTSIDE, dtype=np.uint8)
+        flags[inside] = np.frombuffer(self.cells, dtype=np.uint8)[ty[inside] * self.stride + tx[inside]]
+        return flags
+
+    def solid_many(self, positions):
+        """Boolean per position: is it blocked?"""
+        flags = self.flags_at_many(positions)
+        if NUMPY_AVAILABLE:
+            return (flags & SOLID).astype(bool)
+        return [bool(f & SOLID) for f in flags]
+
+    def box_corners_solid(self, centers, half_w: float, half_h: float):
+        """Per box centre: does a (2*half_w x 2*half_h) box there touch a solid tile?
+
+        Boxes no larger than a tile are fully covered by their four corners,
+        so this is one batched query of 4 points per box.
+        """
+        right, bottom = half_w - EPSILON, half_h - EPSILON
+        corners = []
+        for x, y in centers:
+            corners += ((x - half_w, y - half_h), (x + right, y - half_h),
+                        (x - half_w, y + bottom), (x + right, y + bottom))
+        solid = self.solid_many(corners)
+        if NUMPY_AVAILABLE:
+            return solid.reshape(-1, 4).any(axis=1)
+        return [any(solid[i:i + 4]) for i in range(0, len(solid), 4)]
+
+    # --- swept boxes ------------------------------------------------------
+
+    def _column_blocked(self, col: int, row0: int, row1: int) -> bool:
+        if col < 0 or col >= self.width or row0 < 0 or row1 >= self.height:
+            return True
+        cells, stride = self.cells, self.stride
+        for row in range(row0, row1 + 1):
+            if cells[row * stride + col] & SOLID:
+                return True
+        return False
+
+    def _row_blocked(self, row: int, col0: int, col1: int) -> bool:
+        if row < 0 or row >= self.height or col0 < 0 or col1 >= self.width:
+            return True
+        cells = self.cells
+        start = row * self.stride
+        for col in range(col0, col1 + 1):
+            if cells[start + col] & SOLID:
+                return True
+        return False
+
+    def sweep_x(self, x: float, y: float, half_w: float, half_h: float, dx: float) -> float:
+        """New centre x after moving the box by dx, stopped flush at the first solid column."""
+        ts = self.tilesize
+        row0, row1 = int((y - half_h) // ts), int((y + half_h - EPSILON) // ts)
+        if dx > 0:
+            first = int((x + half_w - EPSILON) // ts) + 1
+            last = int((x + half_w + dx - EPSILON) // ts)
+            for col in range(first, last + 1):
+                if self._column_blocked(col, row0, row1):
+                    return col * ts - half_w
+        elif dx < 0:
+            first = int((x - half_w) // ts) - 1
+            last = int((x - half_w + dx) // ts)
+            for col in range(first, last - 1, -1):
+                if self._column_blocked(col, row0, row1):
+                    return (col + 1) * ts + half_w
+        return x + dx
+
+    def sweep_y(self, x: float, y: float, half_w: float, half_h: float, dy: float) -> float:
+        """New centre y after moving the box by dy, stopped flush at the first solid row."""
+        ts = self.tilesize
+        col0, col1 = int((x - half_w) // ts), int((x + half_w - EPSILON) // ts)
+        if dy > 0:
+            first = int((y + half_h - EPSILON) // ts) + 1
+            last = int((y + half_h + dy - EPSILON) // ts)
+            for row in range(first, last + 1):
+                if self._row_blocked(row, col0, col1):
+                    return row * ts - half_h
+        elif dy < 0:
+            first = int((y - half_h) // ts) - 1
+            last = int((y - half_h + dy) // ts)
+            for row in range(first, last - 1, -1):
+                if self._row_blocked(row, col0, col1):
+                    return (row + 1) * ts + half_h
+        return y + dy
+
+    def move_box(self, x: float, y: float, half_w: float, half_h: float, dx: float, dy: float):
+        """Move a box centred at (x, y) by (dx, dy), sliding along solid tiles.
+
+        Each axis is swept separately so a blocked axis doesn't stop the
+        other one. Moves longer than half a tile are split into equal
+        sub-steps so diagonal moves can't cut corners on a long frame.
+        Returns the new centre (x, y).
+        """
+        half_tile = self.tilesize / 2
+        distance = max(abs(dx), abs(dy))
+        steps = int(distance // half_tile) + 1 if distance > half_tile else 1
+        dx /= steps
+        dy /= steps
+        for _ in range(steps):
+            if dx:
+                x = self.sweep_x(x, y, half_w, half_h, dx)
+            if dy:
+                y = self.sweep_y(x, y, half_w, half_h, dy)
+        return x, y
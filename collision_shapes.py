@@ -0,0 +1,127 @@
+"""
+Collision shapes from the Tiled object layer.
+
+Rects and polygons are normalised once at load: polygon vertices become plain
+(x, y) tuples with a precomputed edge list and bounding box. ShapeIndex buckets
+the shapes into a uniform grid of cells so a point query only tests the few
+shapes whose bounds overlap its cell, and rasterize() fills the tile collision
+grid one shape at a time, testing all the tile centres under a shape's
+bounds in one NumPy pass (a scalar loop over the same tiles without NumPy).
+"""
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+INDEX_CELL_SIZE = 128  # pixels per side of a ShapeIndex bucket
+
+
+def _xy(p) -> tuple:
+    return (p.x, p.y) if hasattr(p, 'x') else (p[0], p[1])
+
+
+def rect_shape(x: float, y: float, width: float, height: float) -> dict:
+    return {'type': 'rect', 'x': x, 'y': y, 'width': width, 'height': height,
+            'bounds': (x, y, x + width, y + height)}
+
+
+def polygon_shape(x: float, y: float, points) -> dict:
+    """Polygon from absolute vertices (pytmx Points or (x, y) pairs)."""
+    points = [_xy(p) for p in points]
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    return {'type': 'polygon', 'x': x, 'y': y, 'points': points,
+            'edges': polygon_edges(points),
+            'bounds': (min(xs), min(ys), max(xs), max(ys))}
+
+
+def polygon_edges(points) -> list:
+    """(x1, y1, x2, y2) for every edge, closing the polygon."""
+    points = [_xy(p) for p in points]
+    return [(x1, y1, x2, y2) for (x1, y1), (x2, y2) in zip(points, points[1:] + points[:1])]
+
+
+def point_in_polygon(x: float, y: float, edges) -> bool:
+    """Ray casting against a precomputed edge list."""
+    inside = False
+    for x1, y1, x2, y2 in edges:
+        if ((y1 > y) != (y2 > y)) and (x < (x2 - x1) * (y - y1) / (y2 - y1) + x1):
+            inside = not inside
+    return inside
+
+
+def shape_contains(shape: dict, x: float, y: float) -> bool:
+    left, top, right, bottom = shape['bounds']
+    if not (left <= x <= right and top <= y <= bottom):
+        return False
+    if shape['type'] == 'rect':
+        return True
+    return point_in_polygon(x, y, shape['edges'])
+
+
+def _contains_many(shape: dict, xs, ys):
+    """Vectorised shape_contains over arrays of points (all inside the bounds)."""
+    if shape['type'] == 'rect':
+        return np.ones(np.broadcast(xs, ys).shape, dtype=bool)
+    inside = np.zeros(np.broadcast(xs, ys).shape, dtype=bool)
+    for x1, y1, x2, y2 in shape['edges']:
+        if y1 == y2:
+            continue  # horizontal edges never cross the ray
+        crosses = (y1 > ys) != (y2 > ys)
+        inside ^= crosses & (xs < (x2 - x1) * (ys - y1) / (y2 - y1) + x1)
+    return inside
+
+
+class ShapeIndex:
+    """Uniform-grid broadphase over collision shapes."""
+
+    def __init__(self, shapes, cell_size: int = INDEX_CELL_SIZE):
+        self.shapes = list(shapes)
+        self.cell_size = cell_size
+        self._cells = {}  # (cx, cy) -> [shape, ...]
+        for shape in self.shapes:
+            left, top, right, bottom = shape['bounds']
+            for cy in range(int(top // cell_size), int(bottom // cell_size) + 1):
+                for cx in range(int(left // cell_size), int(right // cell_size) + 1):
+                    self._cells.setdefault((cx, cy), []).append(shape)
+
+    def __len__(self):
+        return len(self.shapes)
+
+    def candidates(self, x: float, y: float) -> list:
+        """Shapes whose bucket holds (x, y); a superset of the shapes containing it."""
+        size = self.cell_size
+        return self._cells.get((int(x // size), int(y // size)), ())
+
+    def contains(self, x: float, y: float) -> bool:
+        """Is (x, y) inside any shape?"""
+        for shape in self.candidates(x, y):
+            if shape_contains(shape, x, y):
+                return True
+        return False
+
+    def rasterize(self, width: int, height: int, tilesize: int) -> bytearray:
+        """width x height cells, 1 where the tile centre is inside a shape."""
+        cells = bytearray(width * height)
+        view = np.frombuffer(cells, dtype=np.uint8).reshape(height, width) if NUMPY_AVAILABLE else None
+        for shape in self.shapes:
+            left, top, right, bottom = shape['bounds']
+            # Tiles whose centre (t + 0.5) * tilesize falls within the bounds
+            x0 = max(int(-(-(left / tilesize - 0.5) // 1)), 0)
+            y0 = max(int(-(-(top / tilesize - 0.5) // 1)), 0)
+            x1 = min(int((right / tilesize - 0.5) // 1), width - 1)
+            y1 = min(int((bottom / tilesize - 0.5) // 1), height - 1)
+            if x0 > x1 or y0 > y1:
+                continue
+            if view is not None:
+                xs = (np.arange(x0, x1 + 1) + 0.5) * tilesize
+                ys = (np.arange(y0, y1 + 1)[:, None] + 0.5) * tilesize
+                view[y0:y1 + 1, x0:x1 + 1] |= _contains_many(shape, xs, ys)
+            else:
+                for ty in range(y0, y1 + 1):
+                    cy = (ty + 0.5) * tilesize
+                    for tx in range(x0, x1 + 1):
+                        if shape_contains(shape, (tx + 0.5) * tilesize, cy):
+                            cells[ty * width + tx] = 1
+        return cells
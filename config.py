@@ -3,6 +3,8 @@ Game configuration constants and settings.
 """
 import os
 
+from gamelog import ASSETS
+
 # Screen constants
 TILE_SIZE = 16
 WIDTH = 512   # 32 tiles (512 ÷ 16) - matches the map size
@@ -21,16 +23,17 @@ TILESET_IMAGE = os.path.join(CASINO_TILESET_DIR, '2D_TopDown_Tileset_Casino_1024
 # Map settings
 USE_TILED_MAP = True  # Using your Tiled map design
 TILED_MAP_FILE = "map1.tmx"  # Your existing TMX file
+# Sprite-sheet tilesets whose <animation> tiles replace static map tiles (see animated_tiles.py)
+ANIMATION_TILESETS = [os.path.join(ASSET_DIR, 'SlotMachinesAnimation.tsx')]
 
 # Music settings
 MUSIC_FILE = "lobby_music.mp3" 
 MUSIC_ENABLED = False
 
-# Debug print paths
-print(f"Asset directory: {ASSET_DIR}")
-print(f"Casino tileset directory: {CASINO_TILESET_DIR}")
-print(f"Looking for tileset at: {TILESET_IMAGE}")
-print(f"File exists: {os.path.exists(TILESET_IMAGE)}")
-print("Directory contents:")
-if os.path.exists(CASINO_TILESET_DIR):
-    print(os.listdir(CASINO_TILESET_DIR))
\ No newline at end of file
+# Asset paths, checked on disk only when asset debugging is on (CASINO_LOG=assets=debug)
+if ASSETS.debug_enabled:
+    ASSETS.debug("Asset directory: %s", ASSET_DIR)
+    ASSETS.debug("Casino tileset directory: %s", CASINO_TILESET_DIR)
+    ASSETS.debug("Looking for tileset at: %s (exists: %s)", TILESET_IMAGE, os.path.exists(TILESET_IMAGE))
+    if os.path.exists(CASINO_TILESET_DIR):
+        ASSETS.debug("Directory contents: %s", os.listdir(CASINO_TILESET_DIR))
\ No newline at end of file
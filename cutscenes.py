@@ -5,6 +5,7 @@ import pygame as pg
 from dataclasses import dataclass
 from assets import load_image_for_cutscene
 from config import WIDTH, HEIGHT
+from text_cache import render_text
 
 
 @dataclass
@@ -17,7 +18,13 @@ class Slide:
 
 
 class Cutscene:
-    """Manages cutscene playback with slides."""
+    """Manages cutscene playback with slides.
+
+    Each slide's background, scaled image and text bubble are composited into
+    one surface when the slide is entered (and the next slide is prepared
+    while the current one is showing), so a frame is one blit plus the
+    countdown prompt.
+    """
     
     def __init__(self, slides: list[Slide], font: pg.font.Font):
         self.slides = slides
@@ -25,6 +32,7 @@ class Cutscene:
         self.time_in_slide = 0.0
         self.font = font
         self.image_cache: dict[str, pg.Surface] = {}
+        self.frame_cache: dict[int, pg.Surface] = {}  # slide index -> composited slide
 
     def _get_image(self, name: str | None) -> pg.Surface | None:
         """Get cached image for slide."""
@@ -55,6 +63,9 @@ class Cutscene:
         """Move to next slide."""
         self.index += 1
         self.time_in_slide = 0.0
+        # Slides behind us are not shown again unless reset()
+        for index in [i for i in self.frame_cache if i < self.index]:
+            del self.frame_cache[index]
 
     def update(self, dt: float):
         """Update cutscene timing."""
@@ -67,16 +78,26 @@ class Cutscene:
         # Auto-advance if duration > 0
         if slide.duration > 0 and self.time_in_slide >= slide.duration:
             self.advance()
+        elif self.index in self.frame_cache:
+            # The current slide is on screen; get the next one ready so the transition is instant
+            self.prepare(self.index + 1)
+
+    def prepare(self, index: int) -> pg.Surface | None:
+        """Composite slide index (background, image, text bubble) once and cache it."""
+        if index >= len(self.slides):
+            return None
+        frame = self.frame_cache.get(index)
+        if frame is None:
+            frame = self.frame_cache[index] = self._render_slide(self.slides[index])
+        return frame
+
+    def _render_slide(self, slide: Slide) -> pg.Surface:
+        frame = pg.Surface((WIDTH, HEIGHT))
+        if pg.display.get_surface() is not None:
+            frame = frame.convert()
 
-    def draw(self, surface: pg.Surface):
-        """Draw current slide."""
-        if self.done:
-            return
-        
-        slide = self.slides[self.index]
-        
         # Clear with background color
-        surface.fill(slide.bg_color)
+        frame.fill(slide.bg_color)
         
         # Draw image if available
         image = self._get_image(slide.image_name)
@@ -89,11 +110,11 @@ class Cutscene:
             
             new_size = (int(img_rect.width * scale), int(img_rect.height * scale))
             scaled = pg.transform.scale(image, new_size)
-            surface.blit(scaled, scaled.get_rect(center=(WIDTH//2, HEIGHT//2)))
+            frame.blit(scaled, scaled.get_rect(center=(WIDTH//2, HEIGHT//2)))
         
         # Draw text with background bubble
         if slide.text:
-            # Create text surface
+            # Lines are laid out with font.size; only the final lines are rendered
             lines = self._wrap_text(slide.text, WIDTH - 80)
             text_surfaces = [self.font.render(line, True, (255, 255, 255)) for line in lines]
             
@@ -111,21 +132,30 @@ class Cutscene:
             bubble = pg.Surface((bubble_width, bubble_height), pg.SRCALPHA)
             pg.draw.rect(bubble, (0, 0, 0, 180), bubble.get_rect(), border_radius=15)
             pg.draw.rect(bubble, (255, 255, 255), bubble.get_rect(), width=2, border_radius=15)
-            surface.blit(bubble, bubble_rect.topleft)
+            frame.blit(bubble, bubble_rect.topleft)
             
             # Draw text lines
             y_offset = bubble_rect.top + 15
             for text_surf in text_surfaces:
                 text_rect = text_surf.get_rect(centerx=bubble_rect.centerx, y=y_offset)
-                surface.blit(text_surf, text_rect)
+                frame.blit(text_surf, text_rect)
                 y_offset += text_surf.get_height() + 5
+        return frame
+
+    def draw(self, surface: pg.Surface):
+        """Draw current slide."""
+        if self.done:
+            return
+        
+        slide = self.slides[self.index]
+        surface.blit(self.prepare(self.index), (0, 0))
         
-        # Draw prompt
+        # Draw prompt (the countdown text repeats, so it comes from the text cache)
         if slide.duration == 0:  # Manual advance
-            prompt = self.font.render("Press any key to continue...", True, (200, 200, 200))
+            prompt = render_text(self.font, "Press any key to continue...", (200, 200, 200))
         else:  # Auto advance
             remaining = max(0, slide.duration - self.time_in_slide)
-            prompt = self.font.render(f"Next in {remaining:.1f}s (or press any key)", True, (200, 200, 200))
+            prompt = render_text(self.font, f"Next in {remaining:.1f}s (or press any key)", (200, 200, 200))
         
         surface.blit(prompt, (WIDTH - prompt.get_width() - 14, HEIGHT - prompt.get_height() - 10))
 
@@ -137,9 +167,8 @@ class Cutscene:
         
         for word in words:
             test_line = ' '.join(current_line + [word])
-            test_surface = self.font.render(test_line, True, (255, 255, 255))
             
-            if test_surface.get_width() <= max_width:
+            if self.font.size(test_line)[0] <= max_width:
                 current_line.append(word)
             else:
                 if current_line:
@@ -0,0 +1,102 @@
+"""
+Baked collision debug overlay.
+
+Solid tiles, collision shapes and NPC interaction radii are drawn once into
+translucent per-chunk surfaces (the same ChunkCache the map uses), so showing
+the overlay costs one blit per visible chunk instead of one per solid tile.
+Call invalidate() whenever the collision data or the mode changes.
+"""
+import pygame as pg
+
+from collision_grid import SOLID
+from map_renderer import ChunkCache
+from npc import INTERACTION_DISTANCE
+
+# Overlay layers, combined into the modes cycled with F1
+DEBUG_TILES = 1      # solid cells of the collision map
+DEBUG_SHAPES = 2     # outlines of the Tiled collision objects
+DEBUG_NPC_RADII = 4  # interaction radius around each NPC
+
+DEBUG_MODES = (
+    ("off", 0),
+    ("solid tiles", DEBUG_TILES),
+    ("solid tiles + collision shapes", DEBUG_TILES | DEBUG_SHAPES),
+    ("all", DEBUG_TILES | DEBUG_SHAPES | DEBUG_NPC_RADII),
+)
+
+TILE_COLOR = (255, 0, 0, 90)
+SHAPE_COLOR = (255, 255, 0, 220)
+RADIUS_COLOR = (0, 200, 255, 200)
+
+
+class DebugOverlay(ChunkCache):
+    """Translucent overlay chunks for one World's collision data."""
+
+    def __init__(self, world, layers: int = DEBUG_TILES):
+        grid = world.collision_grid
+        super().__init__(grid.width, grid.height, world.tilesize)
+        self.world = world
+        self.layers = layers
+        self._shapes = None  # (bounding rect, kind, points or rect) in map pixels
+        self._circles = None  # (centre, radius)
+
+    def set_layers(self, layers: int):
+        if layers != self.layers:
+            self.layers = layers
+            self.clear()
+
+    def invalidate(self):
+        """Re-bake from the world's current collision map, objects and NPCs."""
+        self._shapes = self._circles = None
+        self.clear()
+
+    def shapes(self) -> list:
+        if self._shapes is None:
+            self._shapes = []
+            for obj in getattr(self.world, 'collision_objects', ()):
+                if obj['type'] == 'polygon':
+                    left, top, right, bottom = obj['bounds']  # precomputed, see collision_shapes.py
+                    bounds = pg.Rect(left, top, right - left + 1, bottom - top + 1)
+                    self._shapes.append((bounds, 'polygon', obj['points']))
+                else:
+                    rect = pg.Rect(obj['x'], obj['y'], obj['width'], obj['height'])
+                    self._shapes.append((rect, 'rect', rect))
+        return self._shapes
+
+    def circles(self) -> list:
+        if self._circles is None:
+            self._circles = [((npc['x'] + npc['width'] / 2, npc['y'] - npc['height'] / 2), INTERACTION_DISTANCE)
+                             for npc in self.world.npc_objects]
+        return self._circles
+
+    def render_chunk(self, cx: int, cy: int) -> pg.Surface:
+        ts = self.tilesize
+        x0, y0, x1, y1 = self.chunk_bounds(cx, cy)
+        ox, oy = x0 * ts, y0 * ts
+        chunk = pg.Surface(((x1 - x0) * ts, (y1 - y0) * ts), pg.SRCALPHA)
+        area = pg.Rect(ox, oy, chunk.get_width(), chunk.get_height())
+
+        if self.layers & DEBUG_TILES:
+            grid = self.world.collision_grid
+            cells, stride = grid.cells, grid.stride
+            for y in range(y0, y1):
+                row = y * stride
+                for x in range(x0, x1):
+                    if cells[row + x] & SOLID:
+                        chunk.fill(TILE_COLOR, ((x - x0) * ts, (y - y0) * ts, ts, ts))
+        if self.layers & DEBUG_SHAPES:
+            for bounds, kind, shape in self.shapes():
+                if not bounds.colliderect(area):
+                    continue
+                if kind == 'polygon':
+                    pg.draw.polygon(chunk, SHAPE_COLOR, [(x - ox, y - oy) for x, y in shape], 1)
+                else:
+                    pg.draw.rect(chunk, SHAPE_COLOR, shape.move(-ox, -oy), 1)
+        if self.layers & DEBUG_NPC_RADII:
+            for (x, y), radius in self.circles():
+                if area.colliderect((x - radius, y - radius, 2 * radius, 2 * radius)):
+                    pg.draw.circle(chunk, RADIUS_COLOR, (x - ox, y - oy), radius, 1)
+
+        if pg.display.get_surface() is not None:
+            chunk = chunk.convert_alpha()
+        return chunk
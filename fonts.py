@@ -0,0 +1,78 @@
+"""
+Central font registry.
+
+Fonts are resolved once per (family, size, bold, italic) and reused, so no
+frame ever pays for a fontconfig lookup. TTF/OTF files dropped into
+assets/fonts are preferred over system fonts (and skip the system font scan
+entirely); name them <family>.ttf, <family>-bold.ttf, <family>-italic.ttf or
+<family>-bolditalic.ttf. family=None is pygame's built-in default font.
+"""
+import os
+
+import pygame
+
+FONT_DIR = os.path.join(os.path.dirname(__file__), 'assets', 'fonts')
+FONT_EXTENSIONS = ('.ttf', '.otf')
+
+
+class FontRegistry:
+    """Lazily built, cached pygame fonts."""
+
+    def __init__(self, font_dir: str = FONT_DIR):
+        self.font_dir = font_dir
+        self._fonts = {}
+        self._files = None  # bundled font files by lower-case stem, scanned on first use
+
+    def _bundled_files(self) -> dict:
+        if self._files is None:
+            self._files = {}
+            if os.path.isdir(self.font_dir):
+                for name in os.listdir(self.font_dir):
+                    stem, ext = os.path.splitext(name)
+                    if ext.lower() in FONT_EXTENSIONS:
+                        self._files[stem.lower()] = os.path.join(self.font_dir, name)
+        return self._files
+
+    def _find_bundled(self, family: str, bold: bool, italic: bool):
+        """(path, style already in the file) for a bundled family, or (None, False)."""
+        files = self._bundled_files()
+        style = ("bold" if bold else "") + ("italic" if italic else "")
+        if style and f"{family}-{style}" in files:
+            return files[f"{family}-{style}"], True
+        return files.get(family), False
+
+    def get(self, family=None, size: int = 24, bold: bool = False, italic: bool = False):
+        """Font for (family, size, style), built on first request."""
+        family = family.lower() if family else None
+        key = (family, size, bold, italic)
+        font = self._fonts.get(key)
+        if font is not None:
+            return font
+
+        if not pygame.font.get_init():
+            pygame.font.init()
+        path, styled = self._find_bundled(family, bold, italic) if family else (None, False)
+        if path or family is None:
+            font = pygame.font.Font(path, size)
+            if not styled:
+                font.set_bold(bold)
+                font.set_italic(italic)
+        else:
+            font = pygame.font.SysFont(family, size, bold, italic)
+        self._fonts[key] = font
+        return font
+
+    def clear(self):
+        self._fonts.clear()
+        self._files = None
+
+    def __len__(self):
+        return len(self._fonts)
+
+
+FONTS = FontRegistry()
+
+
+def get_font(family=None, size: int = 24, bold: bool = False, italic: bool = False):
+    """Shared registry lookup; use this instead of pygame.font.SysFont."""
+    return FONTS.get(family, size, bold, italic)
@@ -0,0 +1,114 @@
+"""
+Categorised, rate-limited logging for the game.
+
+Each subsystem logs through a Category (COLLISION, ASSETS, TMX, NPC, GAME)
+with the usual levels. A category keeps its threshold as a plain int, so a
+call below it returns after one comparison and never formats its message;
+hot paths can skip even the call with `if COLLISION.debug_enabled:`. Messages
+are %-style templates formatted only when emitted, and each template is
+limited to RATE_LIMIT lines per RATE_WINDOW seconds; the count of suppressed
+repeats is reported when the window reopens.
+
+Levels are set with configure() or the CASINO_LOG environment variable, e.g.
+CASINO_LOG=debug or CASINO_LOG=warning,collision=debug,tmx=info. Output goes
+through the standard logging module (logger "casino.<category>").
+"""
+import logging
+import os
+import sys
+import time
+
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARNING = logging.WARNING
+ERROR = logging.ERROR
+OFF = logging.CRITICAL + 10
+
+LEVEL_NAMES = {'debug': DEBUG, 'info': INFO, 'warning': WARNING, 'error': ERROR, 'off': OFF}
+
+DEFAULT_LEVEL = INFO
+RATE_LIMIT = 5      # lines per message template per window
+RATE_WINDOW = 1.0   # seconds
+
+_root = logging.getLogger('casino')
+if not _root.handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter('[%(levelname)s] %(name)s: %(message)s'))
+    _root.addHandler(_handler)
+    _root.setLevel(DEBUG)  # filtering happens in Category
+    _root.propagate = False
+
+
+class Category:
+    """One log category with its own threshold and rate limiter."""
+
+    def __init__(self, name: str, level: int = DEFAULT_LEVEL):
+        self.name = name
+        self.logger = logging.getLogger(f'casino.{name}')
+        self._rates = {}  # template -> [window start, lines in window, suppressed]
+        self.set_level(level)
+
+    def set_level(self, level: int):
+        self.level = level
+        self.debug_enabled = level <= DEBUG
+
+    def enabled(self, level: int) -> bool:
+        return level >= self.level
+
+    def debug(self, msg: str, *args):
+        if DEBUG >= self.level:
+            self._emit(DEBUG, msg, args)
+
+    def info(self, msg: str, *args):
+        if INFO >= self.level:
+            self._emit(INFO, msg, args)
+
+    def warning(self, msg: str, *args):
+        if WARNING >= self.level:
+            self._emit(WARNING, msg, args)
+
+    def error(self, msg: str, *args, exc_info: bool = False):
+        if ERROR >= self.level:
+            self._emit(ERROR, msg, args, exc_info)
+
+    def _emit(self, level: int, msg: str, args: tuple, exc_info: bool = False):
+        now = time.monotonic()
+        rate = self._rates.get(msg)
+        if rate is None or now - rate[0] >= RATE_WINDOW:
+            suppressed = rate[2] if rate else 0
+            self._rates[msg] = [now, 1, 0]
+            if suppressed:
+                msg = f"{msg} (%d similar messages suppressed)"
+                args = args + (suppressed,)
+        elif rate[1] < RATE_LIMIT:
+            rate[1] += 1
+        else:
+            rate[2] += 1
+            return
+        self.logger.log(level, msg, *args, exc_info=exc_info)
+
+
+COLLISION = Category('collision')
+ASSETS = Category('assets')
+TMX = Category('tmx')
+NPC = Category('npc')
+GAME = Category('game')
+
+CATEGORIES = {c.name: c for c in (COLLISION, ASSETS, TMX, NPC, GAME)}
+
+
+def configure(spec: str):
+    """Set levels from a spec like "info" or "warning,collision=debug"; bad entries raise ValueError."""
+    for part in filter(None, (p.strip().lower() for p in spec.split(','))):
+        name, _, level = part.rpartition('=')
+        if level not in LEVEL_NAMES or (name and name not in CATEGORIES):
+            raise ValueError(f"bad log setting: {part!r}")
+        for category in ([CATEGORIES[name]] if name else CATEGORIES.values()):
+            category.set_level(LEVEL_NAMES[level])
+
+
+if os.environ.get('CASINO_LOG'):
+    try:
+        configure(os.environ['CASINO_LOG'])
+    except ValueError as e:
+        GAME.warning("Ignoring CASINO_LOG: %s", e)
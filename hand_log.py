@@ -0,0 +1,277 @@
+"""
+Compact binary hand log and deterministic headless replay.
+
+A HandLog attached to a seeded BlackjackEngine records the seed, every shoe
+order, each bet, each player action and each settlement. replay() feeds a
+recorded session back through ad_casino_adapter.BlackjackTable with pacing
+set to instant (no animation, no delays) and checks that the shoes and
+settlements come out byte-for-byte the same.
+
+File layout (little-endian):
+    header   b"BJLG", version u8, num_decks u8, seed i64, bankroll i32,
+             dealer_loss_rate f64, penetration f64
+    b"S"     shoe order: cursor u16 + one byte per card
+    b"B"     new hand: bet u32
+    b"A"     player action: one byte, H / S / D / P
+    b"R"     settlement: hand count u8, (outcome u8, delta i32) per hand, bankroll i64
+
+Run: python hand_log.py record session.bjlog --hands 10000 --seed 1
+     python hand_log.py replay session.bjlog
+"""
+import argparse
+import struct
+import sys
+import time
+from dataclasses import dataclass, field
+
+from blackjack_core import (
+    MIN_BET, PUSH_BLACKJACK, PLAYER_BLACKJACK, DEALER_BLACKJACK,
+    PLAYER_BUST, DEALER_BUST, WIN, LOSS, PUSH, RIGGED_WIN,
+)
+
+MAGIC = b"BJLG"
+VERSION = 2
+HEADER = struct.Struct("<4sBBqidd")
+SHOE = struct.Struct("<H")
+BET = struct.Struct("<I")
+COUNT = struct.Struct("<B")
+RESULT = struct.Struct("<Bi")
+BANKROLL = struct.Struct("<q")
+
+# Outcome codes stored in b"R" records
+OUTCOMES = (PUSH_BLACKJACK, PLAYER_BLACKJACK, DEALER_BLACKJACK, PLAYER_BUST,
+            DEALER_BUST, WIN, LOSS, PUSH, RIGGED_WIN)
+OUTCOME_CODES = {name: i for i, name in enumerate(OUTCOMES)}
+
+
+class HandLog:
+    """Recorder for one engine; attach it before the first hand is dealt."""
+
+    def __init__(self, engine):
+        if engine.seed is None:
+            raise ValueError("HandLog needs an engine created with a seed, not a custom rng")
+        if engine.phase != "betting" or engine.hands:
+            raise ValueError("attach the HandLog before the first hand")
+        self.data = bytearray(HEADER.pack(MAGIC, VERSION, engine.shoe.num_decks, engine.seed,
+                                          engine.bankroll, engine.dealer_loss_rate,
+                                          engine.shoe.penetration))
+        self.shuffled(engine.shoe)
+        engine.recorder = self
+
+    def shuffled(self, shoe):
+        self.data += b"S" + SHOE.pack(shoe.cursor) + shoe.cards.tobytes()
+
+    def hand_started(self, bet: int):
+        self.data += b"B" + BET.pack(bet)
+
+    def action(self, action: str):
+        self.data += b"A" + action.encode("ascii")
+
+    def settled(self, engine):
+        data = self.data
+        data += b"R" + COUNT.pack(len(engine.hands))
+        for hand in engine.hands:
+            data += RESULT.pack(OUTCOME_CODES[hand.outcome], hand.delta)
+        data += BANKROLL.pack(engine.bankroll)
+
+    def save(self, path: str):
+        with open(path, "wb") as f:
+            f.write(self.data)
+
+
+@dataclass
+class LoggedHand:
+    bet: int
+    actions: str = ""
+    results: list = field(default_factory=list)  # (outcome, delta) per player hand
+    bankroll: int = 0
+    shoes: list = field(default_factory=list)    # (cursor, order) of reshuffles during the hand
+
+
+@dataclass
+class LoggedSession:
+    num_decks: int
+    seed: int
+    bankroll: int
+    dealer_loss_rate: float
+    penetration: float
+    first_shoe: tuple
+    hands: list
+
+
+def parse_log(data: bytes) -> LoggedSession:
+    """Decode a hand log produced by HandLog."""
+    magic, version, num_decks, seed, bankroll, loss_rate, penetration = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("not a version %d hand log" % VERSION)
+    shoe_size = 52 * num_decks
+    pos = HEADER.size
+    first_shoe = None
+    hands = []
+    view = memoryview(data)
+    while pos < len(data):
+        tag = data[pos:pos + 1]
+        pos += 1
+        if tag == b"S":
+            (cursor,) = SHOE.unpack_from(data, pos)
+            pos += SHOE.size
+            shoe = (cursor, bytes(view[pos:pos + shoe_size]))
+            pos += shoe_size
+            if hands:
+                hands[-1].shoes.append(shoe)
+            else:
+                first_shoe = shoe
+        elif tag == b"B":
+            (bet,) = BET.unpack_from(data, pos)
+            pos += BET.size
+            hands.append(LoggedHand(bet))
+        elif tag == b"A":
+            hands[-1].actions += chr(data[pos])
+            pos += 1
+        elif tag == b"R":
+            (count,) = COUNT.unpack_from(data, pos)
+            pos += COUNT.size
+            for _ in range(count):
+                code, delta = RESULT.unpack_from(data, pos)
+                pos += RESULT.size
+                hands[-1].results.append((OUTCOMES[code], delta))
+            (hands[-1].bankroll,) = BANKROLL.unpack_from(data, pos)
+            pos += BANKROLL.size
+        else:
+            raise ValueError(f"bad record tag {tag!r} at byte {pos - 1}")
+    return LoggedSession(num_decks, seed, bankroll, loss_rate, penetration, first_shoe, hands)
+
+
+def load_log(path: str) -> LoggedSession:
+    with open(path, "rb") as f:
+        return parse_log(f.read())
+
+
+@dataclass
+class ReplayResult:
+    hands: int
+    seconds: float
+    mismatches: list  # indices of hands whose shoes, settlement or displayed count differ from the log
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches
+
+    @property
+    def hands_per_second(self) -> float:
+        return self.hands / self.seconds if self.seconds else 0.0
+
+
+def _count_matches(table) -> bool:
+    """Once the hole card is face up, the table's displayed count must be the shoe's."""
+    return table.hole_card_hidden() or table.displayed_running_count() == table.shoe.running_count
+
+
+def replay(session: LoggedSession) -> ReplayResult:
+    """Re-run a logged session through BlackjackTable with no animation or delays."""
+    import pygame
+    from ad_casino_adapter import BlackjackTable, NUM_DECKS
+
+    if session.num_decks != NUM_DECKS:
+        raise ValueError(f"log uses {session.num_decks} decks, BlackjackTable deals {NUM_DECKS}")
+    pygame.font.init()  # the table renders text; no display is needed
+    table = BlackjackTable((0, 0), instant=True, seed=session.seed, bankroll=session.bankroll)
+    table.engine.dealer_loss_rate = session.dealer_loss_rate
+    table.engine.shoe.penetration = session.penetration
+    recorder = HandLog(table.engine)
+    actions = {"H": table.hit, "S": table.stand}
+
+    start = time.perf_counter()
+    table.start_game()
+    played = []      # indices of logged hands the table actually dealt, in replay order
+    mismatches = []  # logged hands the table refused to deal are mismatches outright
+    for i, hand in enumerate(session.hands):
+        table.bet = hand.bet
+        table.place_bet()
+        if table.hand_phase == "betting":
+            mismatches.append(i)
+            continue
+        played.append(i)
+        for action in hand.actions:
+            if action not in actions:
+                raise ValueError(f"BlackjackTable cannot replay action {action!r}")
+            actions[action]()
+            table.update(0.0)
+            if not _count_matches(table):
+                mismatches.append(i)
+        table.update(0.0)  # runs the dealer and settles
+        if not _count_matches(table):
+            mismatches.append(i)
+        table.restart()
+    seconds = time.perf_counter() - start
+
+    replayed = parse_log(recorder.data)
+    # A replay that records fewer (or more) hands than it dealt fails on the missing ones
+    for j, i in enumerate(played):
+        if j >= len(replayed.hands) or replayed.hands[j] != session.hands[i]:
+            mismatches.append(i)
+    if len(replayed.hands) > len(played):
+        mismatches.append(len(session.hands))
+    if replayed.first_shoe != session.first_shoe:
+        mismatches.append(0)
+    mismatches = sorted(set(mismatches))
+    return ReplayResult(len(session.hands), seconds, mismatches)
+
+
+def record(num_hands: int, seed: int, bet: int = MIN_BET, stand_on: int = 17,
+           dealer_loss_rate: float = 0.0) -> HandLog:
+    """Play num_hands through a headless BlackjackTable (hit below stand_on) and log them."""
+    import pygame
+    from ad_casino_adapter import BlackjackTable
+
+    pygame.font.init()
+    table = BlackjackTable((0, 0), instant=True, seed=seed)
+    table.engine.dealer_loss_rate = dealer_loss_rate
+    log = HandLog(table.engine)
+    table.start_game()
+    for _ in range(num_hands):
+        if table.bankroll < bet:
+            break
+        table.bet = bet
+        table.place_bet()
+        while table.hand_phase == "player":
+            if table.player.total < stand_on:
+                table.hit()
+            else:
+                table.stand()
+            table.update(0.0)
+        table.update(0.0)
+        table.restart()
+    return log
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record or replay blackjack hand logs")
+    sub = parser.add_subparsers(dest="command", required=True)
+    rec = sub.add_parser("record", help="play a seeded headless session and save its log")
+    rec.add_argument("path")
+    rec.add_argument("--hands", type=int, default=1000, help="hands to play (stops early if broke)")
+    rec.add_argument("--seed", type=int, default=1, help="table seed")
+    rec.add_argument("--bet", type=int, default=MIN_BET, help="flat bet")
+    rec.add_argument("--loss-rate", type=float, default=0.0, help="rigged dealer loss rate")
+    rep = sub.add_parser("replay", help="replay a log and check it settles identically")
+    rep.add_argument("path")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        log = record(args.hands, args.seed, args.bet, dealer_loss_rate=args.loss_rate)
+        log.save(args.path)
+        session = parse_log(log.data)
+        print(f"Recorded {len(session.hands)} hands ({len(log.data):,} bytes) to {args.path}")
+    else:
+        result = replay(load_log(args.path))
+        print(f"Replayed {result.hands} hands in {result.seconds:.3f}s "
+              f"({result.hands_per_second:,.0f} hands/s)")
+        if not result.ok:
+            print(f"Mismatch in {len(result.mismatches)} hands, first at hand {result.mismatches[0]}")
+            sys.exit(1)
+        print("All shoes and settlements match the log.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Heads-up display for main.py.
+
+The HUD strip (translucent backdrop, controls hint) and the player coordinate
+readout keep their surfaces between frames. A widget is re-rendered only when
+the value it shows changes, and the whole HUD is composited with a single
+blits() call, so a steady-state frame allocates no surfaces.
+"""
+import pygame as pg
+
+from text_cache import render_text
+
+HUD_HEIGHT = 40
+HUD_ALPHA = 128
+CONTROLS_COLOR = (255, 230, 150)  # Warm yellow
+COORDS_COLOR = (255, 255, 0)
+COORDS_ALPHA = 150
+
+
+class Hud:
+    """Persistent HUD widgets, composited in one pass."""
+
+    def __init__(self, width: int, font, coord_font):
+        self.rect = pg.Rect(0, 0, width, HUD_HEIGHT)
+        self.font = font
+        self.coord_font = coord_font
+        self.backdrop = pg.Surface(self.rect.size)
+        self.backdrop.fill((0, 0, 0))
+        self.backdrop.set_alpha(HUD_ALPHA)
+
+        self.controls = None  # hint text currently shown
+        self.coords = None    # (x, y) currently shown, or None when hidden
+        self._controls_surf = None
+        self._controls_pos = (0, 0)
+        self._coords_surf = None
+        self._coords_bg = None
+        self._blits = []      # the composited HUD, rebuilt only when a widget changes
+
+    def set_controls(self, text: str) -> bool:
+        """Show text as the controls hint; returns True if it changed."""
+        if text == self.controls:
+            return False
+        self.controls = text
+        self._controls_surf = render_text(self.font, text, CONTROLS_COLOR)
+        self._controls_pos = self._controls_surf.get_rect(midtop=(self.rect.centerx, 10)).topleft
+        self._layout()
+        return True
+
+    def set_coords(self, pos) -> bool:
+        """Show the player position (rounded to pixels), or hide it with None."""
+        coords = None if pos is None else (int(pos[0]), int(pos[1]))
+        if coords == self.coords:
+            return False
+        self.coords = coords
+        if coords is not None:
+            self._coords_surf = render_text(self.coord_font, f"Position: ({coords[0]}, {coords[1]})", COORDS_COLOR)
+            # Background for readability; only reallocated when the text width changes
+            size = (self._coords_surf.get_width() + 10, self._coords_surf.get_height() + 4)
+            if self._coords_bg is None or self._coords_bg.get_size() != size:
+                self._coords_bg = pg.Surface(size)
+                self._coords_bg.fill((0, 0, 0))
+                self._coords_bg.set_alpha(COORDS_ALPHA)
+        self._layout()
+        return True
+
+    def _layout(self):
+        blits = []
+        if self.coords is not None:
+            blits.append((self._coords_bg, (5, 5)))
+            blits.append((self._coords_surf, (10, 7)))
+        blits.append((self.backdrop, self.rect.topleft))
+        if self._controls_surf is not None:
+            blits.append((self._controls_surf, self._controls_pos))
+            blits.append((self._controls_surf, (10, 10)))
+        self._blits = blits
+
+    def draw(self, surface: pg.Surface):
+        surface.blits(self._blits, doreturn=False)
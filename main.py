@@ -15,6 +15,11 @@ from cutscenes import Cutscene, Slide
 from game_states import GameState
 from ad_casino_adapter import BlackjackTable
 from npc import NPCManager
+from sprite_batch import SpriteBatch
+from hud import Hud
+from text_cache import render_text
+from fonts import get_font
+from gamelog import COLLISION, NPC as NPC_LOG
 
 def main():
     pg.init()
@@ -48,10 +53,15 @@ def main():
     start_pos = pg.math.Vector2(TILE_SIZE * 15, TILE_SIZE * 20)  # Center-bottom area
     player = AnimatedPlayer(pos=start_pos)
 
+    # Characters are drawn depth-sorted in one blit call (see sprite_batch.py)
+    sprite_batch = SpriteBatch()
+
     state = GameState.PLAYING
 
-    # preload font
-    font = pg.font.SysFont(None, 24)
+    # preload fonts (text itself is rendered through the shared text cache)
+    font = get_font(None, 24)
+    coord_font = get_font('Arial', 16, bold=True)
+    prompt_font = get_font(None, 24)
 
     # Define cutscene slides (customize your text/images here)
     slides = [
@@ -64,11 +74,17 @@ def main():
     state = GameState.CUTSCENE
     running = True
 
+    # The HUD keeps its surfaces between frames (see hud.py); in blackjack it
+    # is only repainted where the table reports dirty regions
+    hud = Hud(WIDTH, font, coord_font)
+
     while running:
         dt = clock.tick(FPS) / 1000.0
         for event in pg.event.get():
             if event.type == pg.QUIT:
                 running = False
+            elif event.type in (pg.VIDEOEXPOSE, pg.WINDOWEXPOSED):
+                blackjack_table.invalidate()
 
             if state == GameState.CUTSCENE:
                 cutscene.handle_event(event)
@@ -76,7 +92,9 @@ def main():
                     state = GameState.PLAYING
 
             elif event.type == pg.KEYDOWN:
-                if event.key == pg.K_ESCAPE:
+                if event.key == pg.K_F1:
+                    COLLISION.info("Collision debug: %s", world.cycle_debug_mode())
+                elif event.key == pg.K_ESCAPE:
                     if state == GameState.PLAYING:
                         state = GameState.PAUSED
                     elif state == GameState.PAUSED:
@@ -88,9 +106,6 @@ def main():
                 # Handle mouse clicks
                 if state == GameState.BLACKJACK:
                     blackjack_table.handle_click(pg.mouse.get_pos())
-            elif event.type == pg.KEYDOWN and event.key == pg.K_F1:
-                world.show_collision_debug = not world.show_collision_debug
-                print(f"Collision debug: {'ON' if world.show_collision_debug else 'OFF'}")
 
         # Get keyboard state
         keys = pg.key.get_pressed()
@@ -103,6 +118,7 @@ def main():
         elif state == GameState.PLAYING:
             player.handle_input(dt, world)
             npc_manager.update(dt, world)
+            world.update(dt)
 
         if state == GameState.CUTSCENE:
             cutscene.draw(screen)
@@ -122,16 +138,17 @@ def main():
             if near_table and keys[pg.K_SPACE]:
                 state = GameState.BLACKJACK
                 blackjack_table.start_game()
+                blackjack_table.invalidate()
             
             # Check for NPC interactions
             if keys[pg.K_e]:  # Press E to talk to NPCs
                 npc_dialogue = npc_manager.check_interactions(player.pos)
                 if npc_dialogue:
-                    print(f"NPC says: {npc_dialogue}")  # For now, print to console
+                    NPC_LOG.info("NPC says: %s", npc_dialogue)  # For now, log to console
         
         elif state == GameState.BLACKJACK:
-            # Update the blackjack game logic
-            blackjack_table.update()
+            # Update the blackjack game logic (dealer pacing runs on frame time)
+            blackjack_table.update(dt)
             
             keys = pg.key.get_pressed()
             
@@ -150,10 +167,6 @@ def main():
                 elif keys[pg.K_s]:  # Stand
                     blackjack_table.stand()
             
-            elif blackjack_table.hand_phase == 'dealer':
-                blackjack_table.dealer_play()
-                blackjack_table.handle_game_over()
-            
             elif blackjack_table.hand_phase == 'done':
                 if keys[pg.K_r]:  # Restart
                     blackjack_table.restart()
@@ -162,48 +175,6 @@ def main():
                     state = GameState.PLAYING
                     blackjack_table.state = 'waiting'
 
-        # Draw based on current state
-        if state == GameState.CUTSCENE:
-            cutscene.draw(screen)
-        else:
-            # Draw world and game elements
-            screen.fill((30, 30, 30))
-            
-            # Always draw the world and player when not in blackjack
-            if state != GameState.BLACKJACK:
-                world.draw(screen)
-                npc_manager.draw(screen)
-                player.draw(screen)
-                
-                # Real-time player coordinates display (top-left corner)
-                coord_font = pg.font.SysFont('Arial', 16, bold=True)
-                coord_text = f"Position: ({int(player.pos.x)}, {int(player.pos.y)})"
-                coord_surface = coord_font.render(coord_text, True, (255, 255, 0))
-                # Add background for better readability
-                coord_bg = pg.Surface((coord_surface.get_width() + 10, coord_surface.get_height() + 4))
-                coord_bg.fill((0, 0, 0))
-                coord_bg.set_alpha(150)
-                screen.blit(coord_bg, (5, 5))
-                screen.blit(coord_surface, (10, 7))
-                
-                # Check for interaction with blackjack table and show prompt
-                distance_to_table = player.pos.distance_to(table_pos)
-                near_table = distance_to_table < interaction_distance
-                if near_table:
-                    prompt_font = pg.font.SysFont(None, 24)
-                    prompt = prompt_font.render("Press SPACE to play Blackjack", True, (255, 255, 255))
-                    screen.blit(prompt, (table_pos.x - 100, table_pos.y - 60))
-            
-            if state == GameState.BLACKJACK:
-                blackjack_table.draw(screen)
-
-        # Enhanced HUD
-        # Create a semi-transparent overlay for the HUD
-        hud_surface = pg.Surface((WIDTH, 40))
-        hud_surface.fill((0, 0, 0))
-        hud_surface.set_alpha(128)
-        screen.blit(hud_surface, (0, 0))
-        
         # Game state and controls
         if state == GameState.PLAYING:
             controls_text = ""
@@ -218,11 +189,48 @@ def main():
                 controls_text = "Watch the dealer play..."
         else:
             controls_text = f"State: {state.name}"
-            
-        text = font.render(controls_text, True, (255, 230, 150))  # Warm yellow color
-        text_rect = text.get_rect(midtop=(WIDTH // 2, 10))
-        screen.blit(text, text_rect)
-        screen.blit(text, (10, 10))
+        hud_changed = hud.set_controls(controls_text)
+
+        # Draw based on current state
+        if state == GameState.CUTSCENE:
+            cutscene.draw(screen)
+            hud.set_coords(None)
+        elif state == GameState.BLACKJACK:
+            # The table keeps its felt cached and repaints only what changed;
+            # an idle table costs no blits and no display update
+            if hud.set_coords(None) or hud_changed:
+                blackjack_table.invalidate(hud.rect)
+            dirty = blackjack_table.draw(screen)
+            for rect in dirty:
+                if rect.colliderect(hud.rect):
+                    screen.set_clip(rect.clip(hud.rect))
+                    hud.draw(screen)
+            screen.set_clip(None)
+            pg.display.update(dirty)
+            continue
+        else:
+            # Draw world and game elements
+            screen.fill((30, 30, 30))
+            world.draw(screen)
+            # Tiled NPC objects, NPCs and the player, sorted by foot y
+            sprite_batch.extend(world.sprites())
+            sprite_batch.extend(npc_manager.sprites())
+            sprite_batch.add(*player.sprite())
+            sprite_batch.draw(screen)
+            world.draw_debug(screen)
+
+            # Real-time player coordinates display (top-left corner, part of the HUD)
+            hud.set_coords(player.pos)
+
+            # Check for interaction with blackjack table and show prompt
+            distance_to_table = player.pos.distance_to(table_pos)
+            near_table = distance_to_table < interaction_distance
+            if near_table:
+                prompt = render_text(prompt_font, "Press SPACE to play Blackjack", (255, 255, 255))
+                screen.blit(prompt, (table_pos.x - 100, table_pos.y - 60))
+
+        # Enhanced HUD (semi-transparent overlay), composited in one pass
+        hud.draw(screen)
 
         pg.display.flip()
 
@@ -0,0 +1,199 @@
+"""
+Disk cache of baked Tiled map data.
+
+The first launch parses the TMX with pytmx and then saves everything the game
+needs into cache/maps/<map>_<tilesize>px_<key>/: the collision grid as raw
+bytes, the collision shapes and NPC spawns as JSON, and the map chunks, NPC
+images and tile animations as PNGs. The key is a hash of the TMX, every TSX
+and image it references and the animation tilesets, so editing any of them
+invalidates the entry automatically; bakes at other tile sizes are kept. A
+later launch with the same key loads the baked files and skips pytmx entirely.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import xml.etree.ElementTree as ET
+
+import pygame as pg
+
+from animated_tiles import Animation, AnimatedTileLayer, slice_sheet
+from collision_grid import CollisionGrid
+from collision_shapes import ShapeIndex, rect_shape, polygon_shape
+from gamelog import TMX
+from map_renderer import BakedChunkRenderer, chunk_filename
+
+CACHE_VERSION = 1  # bump when the baked format or the baking itself changes
+CACHE_DIR = os.path.join(os.path.dirname(__file__), 'cache', 'maps')
+
+
+def map_inputs(tmx_path: str, extra=()) -> list:
+    """The TMX, the TSX files it references and every image either of them uses, plus extra TSX files."""
+    inputs = []
+    pending = [tmx_path, *extra]
+    while pending:
+        path = os.path.normpath(pending.pop(0))
+        if path in inputs or not os.path.exists(path):
+            continue
+        inputs.append(path)
+        if not path.endswith(('.tmx', '.tsx')):
+            continue
+        base = os.path.dirname(path)
+        root = ET.parse(path).getroot()
+        for tileset in root.iter('tileset'):
+            if tileset.get('source'):
+                pending.append(os.path.join(base, tileset.get('source')))
+        for image in root.iter('image'):
+            if image.get('source'):
+                pending.append(os.path.join(base, image.get('source')))
+    return inputs
+
+
+def map_key(tmx_path: str, tilesize: int, extra=()) -> str:
+    """Hash of the cache version, the tile size and the contents of every map input."""
+    digest = hashlib.sha256(f"v{CACHE_VERSION} tilesize={tilesize}".encode())
+    root = os.path.dirname(os.path.abspath(tmx_path))
+    for path in map_inputs(tmx_path, extra):
+        digest.update(os.path.relpath(os.path.abspath(path), root).encode())
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+def cache_path(tmx_path: str, tilesize: int, key: str, cache_dir: str = CACHE_DIR) -> str:
+    name = os.path.splitext(os.path.basename(tmx_path))[0]
+    return os.path.join(cache_dir, f"{name}_{tilesize}px_{key}")
+
+
+def _save_animation(animation: Animation, directory: str, name: str) -> dict:
+    """Frames side by side in one PNG; returns the JSON entry that _load_animation reads."""
+    w, h = animation.frames[0].get_size()
+    strip = pg.Surface((w * len(animation.frames), h), pg.SRCALPHA)
+    for i, frame in enumerate(animation.frames):
+        strip.blit(frame, (i * w, 0))
+    pg.image.save(strip, os.path.join(directory, name))
+    return {'file': name, 'width': w, 'height': h, 'durations': animation.durations}
+
+
+def _load_image(path: str) -> pg.Surface:
+    image = pg.image.load(path)
+    if pg.display.get_surface() is not None:
+        image = image.convert_alpha()
+    return image
+
+
+def _load_animation(directory: str, entry: dict) -> Animation:
+    strip = _load_image(os.path.join(directory, entry['file']))
+    count = len(entry['durations'])
+    return Animation(slice_sheet(strip, entry['width'], entry['height'], count, count), entry['durations'])
+
+
+def save_baked_map(path: str, world):
+    """Bake a freshly loaded World's map data into path, replacing older bakes of the same map and tile size."""
+    cache_dir = os.path.dirname(path)
+    os.makedirs(cache_dir, exist_ok=True)
+    work = tempfile.mkdtemp(dir=cache_dir)
+    try:
+        renderer = world.map_renderer
+        for cy in range(renderer.chunks_y):
+            for cx in range(renderer.chunks_x):
+                pg.image.save(renderer.render_chunk(cx, cy), os.path.join(work, chunk_filename(cx, cy)))
+
+        grid = world.collision_grid
+        with open(os.path.join(work, 'collision.bin'), 'wb') as f:
+            f.write(grid.cells)
+
+        shapes = []
+        for shape in world.collision_objects:
+            if shape['type'] == 'polygon':
+                shapes.append({'type': 'polygon', 'x': shape['x'], 'y': shape['y'], 'points': shape['points']})
+            else:
+                shapes.append({key: shape[key] for key in ('type', 'x', 'y', 'width', 'height')})
+
+        npcs = []
+        for i, npc in enumerate(world.npc_objects):
+            entry = {key: value for key, value in npc.items() if key not in ('image', 'animation')}
+            if 'image' in npc:
+                entry['image'] = f"npc_{i}.png"
+                pg.image.save(npc['image'], os.path.join(work, entry['image']))
+            if 'animation' in npc:
+                entry['animation'] = _save_animation(npc['animation'], work, f"npc_{i}_anim.png")
+            npcs.append(entry)
+
+        animations = []
+        if world.animated_tiles:
+            for i, (animation, tiles) in enumerate(world.animated_tiles.groups):
+                entry = _save_animation(animation, work, f"anim_{i}.png")
+                entry['tiles'] = tiles
+                animations.append(entry)
+
+        meta = {
+            'version': CACHE_VERSION,
+            'width': grid.width,
+            'height': grid.height,
+            'tilesize': grid.tilesize,
+            'chunk_size': renderer.chunk_size,
+            'collision_objects': shapes,
+            'npc_objects': npcs,
+            'animations': animations,
+        }
+        # Written last: a directory without meta.json is never treated as a bake
+        with open(os.path.join(work, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, default=str)
+
+        # "<map>_<tilesize>px": stale bakes share it, other tile sizes don't
+        name = os.path.basename(path).rsplit('_', 1)[0]
+        for old in os.listdir(cache_dir):
+            if old.rsplit('_', 1)[0] == name:
+                shutil.rmtree(os.path.join(cache_dir, old), ignore_errors=True)
+        os.replace(work, path)
+    except (OSError, pg.error) as e:
+        shutil.rmtree(work, ignore_errors=True)
+        TMX.warning("Could not write map cache %s: %s", path, e)
+
+
+def load_baked_map(path: str, tilesize: int):
+    """Baked map data from path as a dict of World attributes, or None on a miss."""
+    meta_path = os.path.join(path, 'meta.json')
+    if not os.path.exists(meta_path):
+        return None
+    try:
+        with open(meta_path, encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('version') != CACHE_VERSION or meta['tilesize'] != tilesize:
+            return None
+        width, height = meta['width'], meta['height']
+        with open(os.path.join(path, 'collision.bin'), 'rb') as f:
+            grid = CollisionGrid(width, height, tilesize, bytearray(f.read()))
+
+        shapes = []
+        for shape in meta['collision_objects']:
+            if shape['type'] == 'polygon':
+                shapes.append(polygon_shape(shape['x'], shape['y'], shape['points']))
+            else:
+                shapes.append(rect_shape(shape['x'], shape['y'], shape['width'], shape['height']))
+
+        npcs = []
+        for npc in meta['npc_objects']:
+            if 'image' in npc:
+                npc['image'] = _load_image(os.path.join(path, npc['image']))
+            if 'animation' in npc:
+                npc['animation'] = _load_animation(path, npc['animation'])
+            npcs.append(npc)
+
+        groups = [(_load_animation(path, entry), [tuple(tile) for tile in entry['tiles']])
+                  for entry in meta['animations']]
+    except (OSError, ValueError, KeyError, pg.error) as e:
+        TMX.warning("Ignoring unreadable map cache %s: %s", path, e)
+        return None
+
+    return {
+        'map_renderer': BakedChunkRenderer(path, width, height, tilesize, meta['chunk_size']),
+        'animated_tiles': AnimatedTileLayer(tilesize, groups),
+        'collision_grid': grid,
+        'collision_objects': shapes,
+        'collision_index': ShapeIndex(shapes),
+        'npc_objects': npcs,
+    }
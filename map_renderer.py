@@ -0,0 +1,168 @@
+"""
+Chunked, camera-culled renderer for Tiled maps.
+
+The map is cut into fixed-size square chunks (256 px by default). A chunk is
+rendered from the TMX tile layers the first time it becomes visible and
+kept in an LRU cache bounded by a byte budget, so memory stays flat no
+matter how large the map is. Each frame only the chunks that intersect the
+camera viewport are blitted. ChunkCache holds the chunking and caching and
+is shared with other baked map layers (see debug_overlay.py).
+BakedChunkRenderer serves chunks saved by map_cache.py instead of rendering
+them from the TMX.
+"""
+import os
+from collections import OrderedDict
+
+import pygame as pg
+
+CHUNK_SIZE = 256
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+class ChunkCache:
+    """LRU of chunk surfaces covering a map of width x height tiles.
+
+    Subclasses implement render_chunk(cx, cy).
+    """
+
+    def __init__(self, width: int, height: int, tilesize: int, chunk_size: int = CHUNK_SIZE,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.width = width
+        self.height = height
+        self.tilesize = tilesize
+        # Chunks hold a whole number of tiles
+        self.chunk_tiles = max(1, chunk_size // tilesize)
+        self.chunk_size = self.chunk_tiles * tilesize
+        self.map_width = width * tilesize
+        self.map_height = height * tilesize
+        self.chunks_x = -(-width // self.chunk_tiles)
+        self.chunks_y = -(-height // self.chunk_tiles)
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._chunks = OrderedDict()  # (cx, cy) -> (surface, size in bytes)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.blits = 0  # chunk blits in the last draw()
+
+    def chunk_bounds(self, cx: int, cy: int) -> tuple:
+        """Tile range (x0, y0, x1, y1) covered by a chunk, clipped to the map."""
+        n = self.chunk_tiles
+        x0, y0 = cx * n, cy * n
+        return x0, y0, min(x0 + n, self.width), min(y0 + n, self.height)
+
+    def render_chunk(self, cx: int, cy: int) -> pg.Surface:
+        raise NotImplementedError
+
+    def get_chunk(self, cx: int, cy: int) -> pg.Surface:
+        key = (cx, cy)
+        entry = self._chunks.get(key)
+        if entry is not None:
+            self._chunks.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        chunk = self.render_chunk(cx, cy)
+        size = chunk.get_width() * chunk.get_height() * chunk.get_bytesize()
+        self._chunks[key] = (chunk, size)
+        self.bytes += size
+        while self.bytes > self.max_bytes and len(self._chunks) > 1:
+            _, (_, old_size) = self._chunks.popitem(last=False)
+            self.bytes -= old_size
+            self.evictions += 1
+        return chunk
+
+    def visible_chunks(self, viewport: pg.Rect):
+        """(cx, cy) of every chunk intersecting viewport, row by row."""
+        cs = self.chunk_size
+        cx0 = max(viewport.left // cs, 0)
+        cy0 = max(viewport.top // cs, 0)
+        cx1 = min((viewport.right - 1) // cs, self.chunks_x - 1)
+        cy1 = min((viewport.bottom - 1) // cs, self.chunks_y - 1)
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                yield cx, cy
+
+    def prerender(self, viewport: pg.Rect = None):
+        """Render the chunks under viewport (the whole map when None) ahead of time."""
+        if viewport is None:
+            viewport = pg.Rect(0, 0, self.map_width, self.map_height)
+        for cx, cy in self.visible_chunks(viewport):
+            self.get_chunk(cx, cy)
+
+    def draw(self, surface: pg.Surface, camera: pg.Rect):
+        """Blit the chunks visible through camera (a viewport in map pixels)."""
+        cs = self.chunk_size
+        blits = [(self.get_chunk(cx, cy), (cx * cs - camera.x, cy * cs - camera.y))
+                 for cx, cy in self.visible_chunks(camera)]
+        surface.blits(blits, doreturn=False)
+        self.blits = len(blits)
+
+    def clear(self):
+        """Drop every cached chunk; they are re-rendered when next visible."""
+        self._chunks.clear()
+        self.bytes = 0
+
+    def stats(self) -> dict:
+        return {"chunks": len(self._chunks), "bytes": self.bytes, "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions, "blits": self.blits}
+
+
+class ChunkedMapRenderer(ChunkCache):
+    """Renders a pytmx map through an LRU of pre-rendered chunk surfaces."""
+
+    def __init__(self, tmx_data, tile_layers, tilesize: int, chunk_size: int = CHUNK_SIZE,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        super().__init__(tmx_data.width, tmx_data.height, tilesize, chunk_size, max_bytes)
+        self.tmx_data = tmx_data
+        self.layers = [layer.data for layer in tile_layers]
+        self._tiles = {}  # gid -> tile image scaled to tilesize
+
+    def tile_image(self, gid):
+        """Tile image for a gid, scaled to tilesize once."""
+        tile = self._tiles.get(gid)
+        if tile is None and gid not in self._tiles:
+            tile = self.tmx_data.get_tile_image_by_gid(gid)
+            if tile and (tile.get_width() != self.tilesize or tile.get_height() != self.tilesize):
+                tile = pg.transform.scale(tile, (self.tilesize, self.tilesize))
+            self._tiles[gid] = tile
+        return tile
+
+    def render_chunk(self, cx: int, cy: int) -> pg.Surface:
+        """Render one chunk from every tile layer, bottom layer first."""
+        ts = self.tilesize
+        x0, y0, x1, y1 = self.chunk_bounds(cx, cy)
+        chunk = pg.Surface(((x1 - x0) * ts, (y1 - y0) * ts))
+        if pg.display.get_surface() is not None:
+            chunk = chunk.convert()
+        for data in self.layers:
+            for y in range(y0, y1):
+                row = data[y]
+                py = (y - y0) * ts
+                for x in range(x0, x1):
+                    gid = row[x]
+                    if gid:
+                        tile = self.tile_image(gid)
+                        if tile:
+                            chunk.blit(tile, ((x - x0) * ts, py))
+        return chunk
+
+
+def chunk_filename(cx: int, cy: int) -> str:
+    return f"chunk_{cx}_{cy}.png"
+
+
+class BakedChunkRenderer(ChunkCache):
+    """Chunks loaded lazily from PNGs baked by map_cache.save_baked_map."""
+
+    def __init__(self, directory: str, width: int, height: int, tilesize: int, chunk_size: int = CHUNK_SIZE,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        super().__init__(width, height, tilesize, chunk_size, max_bytes)
+        self.directory = directory
+
+    def render_chunk(self, cx: int, cy: int) -> pg.Surface:
+        chunk = pg.image.load(os.path.join(self.directory, chunk_filename(cx, cy)))
+        if pg.display.get_surface() is not None:
+            chunk = chunk.convert()
+        return chunk
@@ -5,6 +5,11 @@ import pygame as pg
 import random
 from typing import List, Tuple
 
+from gamelog import NPC as NPC_LOG
+
+INTERACTION_DISTANCE = 50  # pixels between player and NPC to start a conversation
+COLLISION_HALF_SIZE = 4    # half the side of the square collision box centred on pos
+
 class NPC:
     """Base NPC class."""
     
@@ -43,7 +48,7 @@ class NPC:
                 sprite = asset_manager.extract_from_tileset(TILESET_IMAGE, x, y, w, h)
                 return pg.transform.scale(sprite, (int(self.size.x), int(self.size.y)))
         except Exception as e:
-            print(f"Could not load sprite for {self.npc_type}: {e}")
+            NPC_LOG.warning("Could not load sprite for %s: %s", self.npc_type, e)
         
         # Fallback: create a simple colored sprite
         return self.create_fallback_sprite()
@@ -118,11 +123,19 @@ class NPC:
     
     def update(self, dt: float, world):
         """Update NPC behavior."""
+        move = self.next_move(dt)
+        # Swept against the world so a long frame can't carry it through a wall
+        if move is not None:
+            world.move_box(self.pos, COLLISION_HALF_SIZE, COLLISION_HALF_SIZE, move[0], move[1])
+
+    def next_move(self, dt: float):
+        """(dx, dy) this NPC wants to move this frame, or None if it stays put."""
         if self.npc_type == "patron":
-            self.wander(dt, world)
+            return self.wander(dt)
+        return None
     
-    def wander(self, dt: float, world):
-        """Simple wandering behavior for patrons."""
+    def wander(self, dt: float):
+        """Simple wandering behavior for patrons; returns the proposed (dx, dy)."""
         self.move_timer -= dt
         
         if self.move_timer <= 0:
@@ -138,12 +151,11 @@ class NPC:
             self.move_timer = random.uniform(1.0, 3.0)  # Move for 1-3 seconds
         
         # Move in current direction
-        if self.move_direction.length() > 0:
-            new_pos = self.pos + self.move_direction * self.move_speed * dt
-            
-            # Check collision with world
-            if not world.is_solid_at(new_pos):
-                self.pos = new_pos
+        direction = self.move_direction
+        if direction.x or direction.y:
+            step = self.move_speed * dt
+            return direction.x * step, direction.y * step
+        return None
     
     def draw(self, surface: pg.Surface):
         """Draw the NPC."""
@@ -158,11 +170,16 @@ class NPC:
         # text_rect = text.get_rect(center=(int(self.pos.x), int(self.pos.y - 15)))
         # surface.blit(text, text_rect)
     
+    def sprite(self):
+        """(image, top-left) for the sprite batch; the sprite is centred on pos."""
+        rect = self.sprite_image.get_rect(center=(int(self.pos.x), int(self.pos.y)))
+        return self.sprite_image, rect.topleft
+
     def interact(self) -> str:
         """Return dialogue when player interacts."""
         return self.dialogue
     
-    def is_near_player(self, player_pos: pg.math.Vector2, distance: float = 50) -> bool:
+    def is_near_player(self, player_pos: pg.math.Vector2, distance: float = INTERACTION_DISTANCE) -> bool:
         """Check if player is close enough to interact."""
         return self.pos.distance_to(player_pos) < distance
 
@@ -217,10 +234,33 @@ class NPCManager:
                 self.add_npc(npc)
     
     def update(self, dt: float, world):
-        """Update all NPCs."""
+        """Update all NPCs.
+
+        Every proposed move is checked in one batched query; short moves into
+        free space are applied directly and only the rest (near a wall, or
+        longer than half a tile after a frame hitch) are swept individually.
+        """
+        moves = []
         for npc in self.npcs:
-            npc.update(dt, world)
+            move = npc.next_move(dt)
+            if move is not None:
+                moves.append((npc, move))
+        if not moves:
+            return
+        half = COLLISION_HALF_SIZE
+        max_step = world.tilesize / 2
+        blocked = world.boxes_blocked([(npc.pos.x + dx, npc.pos.y + dy) for npc, (dx, dy) in moves], half, half)
+        for (npc, (dx, dy)), solid in zip(moves, blocked):
+            if solid or abs(dx) > max_step or abs(dy) > max_step:
+                world.move_box(npc.pos, half, half, dx, dy)
+            else:
+                npc.pos.x += dx
+                npc.pos.y += dy
     
+    def sprites(self):
+        """(image, pos) of every NPC, for the sprite batch."""
+        return [npc.sprite() for npc in self.npcs]
+
     def draw(self, surface: pg.Surface):
         """Draw all NPCs."""
         for npc in self.npcs:
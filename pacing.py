@@ -0,0 +1,51 @@
+"""
+Frame-time scheduler for paced game actions (dealer draws, reveals, ...).
+
+Time only advances through update(dt), so nothing ever blocks the main loop,
+and headless code can run the same logic instantly.
+"""
+from collections import deque
+
+
+class ActionScheduler:
+    """Runs queued callbacks once enough accumulated frame time has passed.
+
+    speed scales time (2.0 = twice as fast); instant runs every queued action
+    on the next update regardless of its delay, for headless runs.
+    """
+
+    def __init__(self, speed: float = 1.0, instant: bool = False):
+        self.speed = speed
+        self.instant = instant
+        self.clock = 0.0  # scaled seconds since creation
+        self._queue = deque()  # (due time, callback), kept sorted by due time
+
+    def schedule(self, delay: float, callback):
+        """Run callback after delay seconds of (scaled) game time."""
+        due = self.clock + delay
+        if not self._queue or due >= self._queue[-1][0]:
+            self._queue.append((due, callback))
+        else:
+            items = sorted([*self._queue, (due, callback)], key=lambda item: item[0])
+            self._queue = deque(items)
+
+    def clear(self):
+        self._queue.clear()
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._queue)
+
+    def update(self, dt: float):
+        """Advance time by dt seconds and run every action that came due."""
+        queue = self._queue
+        if self.instant:
+            # Actions may schedule follow-ups; run until the queue drains
+            while queue:
+                due, callback = queue.popleft()
+                self.clock = max(self.clock, due)
+                callback()
+            return
+        self.clock += dt * self.speed
+        while queue and queue[0][0] <= self.clock:
+            queue.popleft()[1]()
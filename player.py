@@ -4,6 +4,9 @@ Player character class with animation and movement.
 import pygame as pg
 from config import TILE_SIZE
 
+# Half the side of the square collision box centred on the player's position
+COLLISION_HALF_SIZE = 4
+
 
 class AnimatedPlayer:
     """Animated player character with walking animations for all directions."""
@@ -162,37 +165,26 @@ class AnimatedPlayer:
     def handle_input(self, dt: float, world):
         """Handle player input for movement"""
         keys = pg.key.get_pressed()
-        
-        # Store old position for collision checking
-        old_pos = pg.math.Vector2(self.pos)
-        self.moving = False
+        step = self.speed * dt
+        dx = dy = 0.0
         
         # Movement input
         if keys[pg.K_w] or keys[pg.K_UP]:
             self.direction = 'up'
-            new_pos = pg.math.Vector2(self.pos.x, self.pos.y - self.speed * dt)
-            if not world.is_solid_at(new_pos):
-                self.pos.y = new_pos.y
-                self.moving = True
+            dy = -step
         elif keys[pg.K_s] or keys[pg.K_DOWN]:
             self.direction = 'down'
-            new_pos = pg.math.Vector2(self.pos.x, self.pos.y + self.speed * dt)
-            if not world.is_solid_at(new_pos):
-                self.pos.y = new_pos.y
-                self.moving = True
+            dy = step
         
         if keys[pg.K_a] or keys[pg.K_LEFT]:
             self.direction = 'left'
-            new_pos = pg.math.Vector2(self.pos.x - self.speed * dt, self.pos.y)
-            if not world.is_solid_at(new_pos):
-                self.pos.x = new_pos.x
-                self.moving = True
+            dx = -step
         elif keys[pg.K_d] or keys[pg.K_RIGHT]:
             self.direction = 'right'
-            new_pos = pg.math.Vector2(self.pos.x + self.speed * dt, self.pos.y)
-            if not world.is_solid_at(new_pos):
-                self.pos.x = new_pos.x
-                self.moving = True
+            dx = step
+        
+        # Swept box collision: slides along walls, sub-steps long frames
+        self.moving = bool(dx or dy) and world.move_box(self.pos, COLLISION_HALF_SIZE, COLLISION_HALF_SIZE, dx, dy)
         
         # Update animation
         self.update_animation(dt)
@@ -200,6 +192,10 @@ class AnimatedPlayer:
         # Update collision rect
         self.rect.center = (round(self.pos.x), round(self.pos.y))
     
+    def sprite(self):
+        """(image, top-left) for the sprite batch."""
+        return self.current_sprite, self.rect.topleft
+
     def draw(self, surface: pg.Surface):
         """Draw the player sprite"""
         surface.blit(self.current_sprite, self.rect)
\ No newline at end of file
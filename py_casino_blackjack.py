@@ -2,9 +2,17 @@
 # A small arcade-y casino: character enters, lobby music (optional), then blackjack.
 # Run: python py_casino_blackjack.py
 import sys
-import random
 import pygame
 
+from blackjack_core import (
+    NUM_DECKS, STARTING_BANKROLL, MIN_BET, MAX_BET,
+    BlackjackEngine, PlayerHand, outcome_message,
+)
+from card_atlas import get_atlas
+from pacing import ActionScheduler
+from text_cache import SHADOW_OFFSET, render_text
+from fonts import get_font
+
 # ------------- Config -------------
 WIDTH, HEIGHT = 900, 600
 FPS = 60
@@ -17,77 +25,45 @@ GRAY = (120, 120, 130)
 BLACK = (0, 0, 0)
 ACCENT = (160, 90, 255)
 
-STARTING_BANKROLL = 200
-MIN_BET = 10
-MAX_BET = 500
-NUM_DECKS = 6
+DEALER_STEP_DELAY = 0.35  # seconds between dealer actions
 
 MUSIC_FILE = "lobby_music.mp3"  # optional; put any mp3 with this name near the script
 
 # ------------- Pygame init -------------
-pygame.init()
-pygame.display.set_caption("PY Casino — Blackjack")
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-clock = pygame.time.Clock()
-
-try:
-    pygame.mixer.init()
-    MUSIC_ENABLED = True
-except pygame.error:
-    MUSIC_ENABLED = False
-
-# Fonts
-FONT_BIG = pygame.font.SysFont("arialblack", 48)
-FONT_MED = pygame.font.SysFont("arial", 28, bold=True)
-FONT = pygame.font.SysFont("arial", 22)
-FONT_SMALL = pygame.font.SysFont("arial", 18)
-
-# ------------- Cards / Blackjack Logic -------------
-SUITS = ["♠", "♥", "♦", "♣"]
-RANKS = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
-VALUES = {**{str(i): i for i in range(2, 11)}, "J": 10, "Q": 10, "K": 10, "A": 11}
-
-def build_shoe(num_decks=6):
-    shoe = []
-    for _ in range(num_decks):
-        for s in SUITS:
-            for r in RANKS:
-                shoe.append((r, s))
-    random.shuffle(shoe)
-    return shoe
-
-def hand_total(cards):
-    # cards: list of (rank, suit)
-    total = 0
-    aces = 0
-    for r, _ in cards:
-        total += VALUES[r]
-        if r == "A":
-            aces += 1
-    while total > 21 and aces:
-        total -= 10
-        aces -= 1
-    return total
-
-def is_blackjack(cards):
-    return len(cards) == 2 and hand_total(cards) == 21
-
-def is_bust(cards):
-    return hand_total(cards) > 21
+# Display, mixer and fonts are created by init_display(), not at import time
+screen = None
+clock = None
+MUSIC_ENABLED = False
+FONT_BIG = FONT_MED = FONT = FONT_SMALL = None
+
+def init_display():
+    global screen, clock, MUSIC_ENABLED, FONT_BIG, FONT_MED, FONT, FONT_SMALL
+    pygame.init()
+    pygame.display.set_caption("PY Casino — Blackjack")
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    clock = pygame.time.Clock()
+
+    try:
+        pygame.mixer.init()
+        MUSIC_ENABLED = True
+    except pygame.error:
+        MUSIC_ENABLED = False
+
+    # Fonts
+    FONT_BIG = get_font("arialblack", 48)
+    FONT_MED = get_font("arial", 28, bold=True)
+    FONT = get_font("arial", 22)
+    FONT_SMALL = get_font("arial", 18)
 
 # ------------- UI Helpers -------------
 def draw_text(text, font, color, x, y, center=False, shadow=False):
-    if shadow:
-        sh = font.render(text, True, BLACK)
-        rect = sh.get_rect()
-        rect.topleft = (x + 2, y + 2)
-        if center:
-            rect.center = (x + 2, y + 2)
-        screen.blit(sh, rect)
-    surf = font.render(text, True, color)
+    # Rendered surfaces come from the shared LRU cache (text_cache.py)
+    surf = render_text(font, text, color, shadow=shadow)
     rect = surf.get_rect()
     if center:
-        rect.center = (x, y)
+        # a shadowed surface is SHADOW_OFFSET larger; keep the text itself centred
+        off = SHADOW_OFFSET // 2 if shadow else 0
+        rect.center = (x + off, y + off)
     else:
         rect.topleft = (x, y)
     screen.blit(surf, rect)
@@ -108,21 +84,9 @@ def point_in_rect(pos, rect):
     rx, ry, rw, rh = rect
     return (rx <= x <= rx+rw) and (ry <= y <= ry+rh)
 
-def draw_card(x, y, rank, suit, face_up=True):
-    w, h = 80, 112
-    r = pygame.Rect(x, y, w, h)
-    if face_up:
-        pygame.draw.rect(screen, WHITE, r, border_radius=10)
-        pygame.draw.rect(screen, BLACK, r, width=2, border_radius=10)
-        col = RED if suit in ("♥", "♦") else BLACK
-        draw_text(rank, FONT_SMALL, col, x + 8, y + 6)
-        draw_text(suit, FONT_MED, col, x + w//2, y + h//2, center=True)
-        draw_text(rank, FONT_SMALL, col, x + w - 8, y + h - 20)
-    else:
-        pygame.draw.rect(screen, (30, 60, 130), r, border_radius=10)
-        pygame.draw.rect(screen, WHITE, r, width=3, border_radius=10)
-        pygame.draw.circle(screen, (200, 220, 255), (x + w//2, y + h//2), 18)
-    return r
+def draw_card(x, y, card, face_up=True):
+    # Faces are pre-rendered once per size (card_atlas.py); this is one blit
+    return get_atlas().blit(screen, x, y, card, face_up)
 
 # ------------- Game States -------------
 STATE_INTRO = "intro"
@@ -133,15 +97,17 @@ STATE_GAMEOVER = "gameover"
 class Game:
     def __init__(self):
         self.state = STATE_INTRO
-        self.bankroll = STARTING_BANKROLL
+        # Rules, shoe, hands and bankroll live in the pygame-free engine
+        self.engine = BlackjackEngine(NUM_DECKS, STARTING_BANKROLL, MIN_BET, MAX_BET,
+                                      allow_double=False, allow_split=False)
         self.bet = MIN_BET
         self.message = ""
-        self.shoe = build_shoe(NUM_DECKS)
-        self.player = []
-        self.dealer = []
         self.revealed = False
         self.hand_phase = "betting"  # betting -> dealing -> player -> dealer -> settle
         self.anim_cards = []  # list of dicts with animation info
+        self.landed = {"player": 0, "dealer": 0}  # cards shown per hand while dealing
+        self._no_hand = PlayerHand()
+        self.pacer = ActionScheduler()  # paces dealer draws on frame time
         self.character_x = -60
         self.character_y = HEIGHT - 140
         self.music_loaded = False
@@ -154,9 +120,17 @@ class Game:
             except Exception:
                 self.music_loaded = False
 
-    def reshoe_if_needed(self):
-        if len(self.shoe) < 20:
-            self.shoe = build_shoe(NUM_DECKS)
+    @property
+    def bankroll(self):
+        return self.engine.bankroll
+
+    @property
+    def player(self):
+        return self.engine.hands[0] if self.engine.hands else self._no_hand
+
+    @property
+    def dealer(self):
+        return self.engine.dealer
 
     def draw_intro(self):
         screen.fill(BG_COLOR)
@@ -205,20 +179,15 @@ class Game:
 
     def start_hand(self):
         self.message = ""
-        self.player = []
-        self.dealer = []
         self.revealed = False
-        self.reshoe_if_needed()
+        dealt = self.engine.start_hand(self.bet)
         # dealing animation
         self.hand_phase = "dealing"
         self.anim_cards = []
-        deal_order = [
-            ("player", 0), ("dealer", 0),
-            ("player", 1), ("dealer", 1)
-        ]
+        self.landed = {"player": 0, "dealer": 0}
         # animation spawn times
         t = 0
-        for who, idx in deal_order:
+        for who, idx, card in dealt:
             self.anim_cards.append({
                 "who": who,
                 "idx": idx,
@@ -226,7 +195,7 @@ class Game:
                 "from": (WIDTH//2, -140),
                 "to": self.card_target_pos(who, idx),
                 "arrived": False,
-                "card": self.shoe.pop()
+                "card": card
             })
             t += 220
 
@@ -246,17 +215,11 @@ class Game:
         for c in self.anim_cards:
             if c["arrived"] or now < c["t_start"]:
                 continue
-            # lerp
-            fx, fy = c["from"]
-            tx, ty = c["to"]
             dt = (now - c["t_start"]) / 220.0
             if dt >= 1.0:
                 c["arrived"] = True
-                # actually add the card
-                if c["who"] == "player":
-                    self.player.append(c["card"])
-                else:
-                    self.dealer.append(c["card"])
+                # the engine already holds the card; just show it
+                self.landed[c["who"]] += 1
             else:
                 still_animating = True
         # remove fully arrived ones from animation list to draw them as real cards
@@ -266,46 +229,14 @@ class Game:
             # done
             self.anim_cards.clear()
             # next phase
-            if is_blackjack(self.player) or is_blackjack(self.dealer):
+            if self.engine.phase == "settle":
                 self.hand_phase = "settle"
                 self.revealed = True
             else:
                 self.hand_phase = "player"
 
     def settle_hand(self):
-        p = hand_total(self.player)
-        d = hand_total(self.dealer)
-
-        # Natural blackjack first
-        if is_blackjack(self.player) and is_blackjack(self.dealer):
-            self.message = "Both blackjack — Push."
-            delta = 0
-        elif is_blackjack(self.player):
-            win = int(self.bet * 1.5)
-            self.message = f"Blackjack! You win ${win}."
-            delta = win
-        elif is_blackjack(self.dealer):
-            self.message = "Dealer blackjack. You lose."
-            delta = -self.bet
-        else:
-            if is_bust(self.player):
-                self.message = "You bust."
-                delta = -self.bet
-            elif is_bust(self.dealer):
-                self.message = "Dealer busts. You win!"
-                delta = self.bet
-            else:
-                if p > d:
-                    self.message = "You win!"
-                    delta = self.bet
-                elif p < d:
-                    self.message = "Dealer wins."
-                    delta = -self.bet
-                else:
-                    self.message = "Push."
-                    delta = 0
-
-        self.bankroll += delta
+        self.message = outcome_message(self.engine.settle()[0])
         self.hand_phase = "done"
 
     def handle_events(self):
@@ -345,12 +276,14 @@ class Game:
                     self.message = "Adjust your bet."
         elif self.hand_phase == "player":
             if point_in_rect((mx, my), rects["hit"]):
-                self.player.append(self.shoe.pop()); self.reshoe_if_needed()
-                if is_bust(self.player):
+                self.engine.hit()
+                if self.engine.phase == "settle":
                     self.revealed = True
                     self.hand_phase = "settle"
             elif point_in_rect((mx, my), rects["stand"]):
+                self.engine.stand()
                 self.hand_phase = "dealer"
+                self.pacer.schedule(DEALER_STEP_DELAY, self.dealer_step)
         elif self.hand_phase == "done":
             # next hand or end
             if self.bankroll <= 0:
@@ -358,7 +291,7 @@ class Game:
             else:
                 if point_in_rect((mx, my), rects["next"]):
                     self.message = ""
-                    self.player, self.dealer = [], []
+                    self.engine.reset()
                     self.revealed = False
                     self.hand_phase = "betting"
 
@@ -384,11 +317,13 @@ class Game:
 
         # Dealer area
         draw_text("Dealer", FONT_MED, WHITE, 80, 270)
-        self.draw_hand(self.dealer, x0=160, y0=300, hide_first=(not self.revealed and self.hand_phase in ("player","dealing")))
+        self.draw_hand(self.dealer, x0=160, y0=300, hide_first=(not self.revealed and self.hand_phase in ("player","dealing")),
+                       shown=self.landed["dealer"] if self.hand_phase == "dealing" else None)
 
         # Player area
         draw_text("You", FONT_MED, WHITE, 80, HEIGHT-230)
-        self.draw_hand(self.player, x0=160, y0=HEIGHT-200, hide_first=False)
+        self.draw_hand(self.player, x0=160, y0=HEIGHT-200, hide_first=False,
+                       shown=self.landed["player"] if self.hand_phase == "dealing" else None)
 
         # Buttons for actions
         if self.hand_phase == "player":
@@ -406,11 +341,11 @@ class Game:
 
         return rects
 
-    def draw_hand(self, cards, x0, y0, hide_first=False):
-        # live cards
-        for i, (r, s) in enumerate(cards):
+    def draw_hand(self, cards, x0, y0, hide_first=False, shown=None):
+        # live cards (only those that have landed while dealing)
+        for i, card in enumerate(cards[:shown]):
             face_up = not (hide_first and i == 0)
-            draw_card(x0 + i*90, y0, r, s, face_up=face_up)
+            draw_card(x0 + i*90, y0, card, face_up=face_up)
         # animating “in-flight” cards preview
         now = pygame.time.get_ticks()
         for a in self.anim_cards:
@@ -424,21 +359,24 @@ class Game:
                 x = fx + (tx - fx) * dt
                 y = fy + (ty - fy) * dt
                 # Face down while flying; final orientation when lands handled elsewhere
-                draw_card(int(x), int(y), a["card"][0], a["card"][1], face_up=False)
+                draw_card(int(x), int(y), a["card"], face_up=False)
+
+    def dealer_step(self):
+        # one paced dealer action; queues the next until the dealer stands
+        if self.hand_phase != "dealer":
+            return
+        if self.engine.dealer_step():
+            self.pacer.schedule(DEALER_STEP_DELAY, self.dealer_step)
+        else:
+            self.revealed = True
+            self.hand_phase = "settle"
 
-    def update(self):
+    def update(self, dt):
         # advance animations / phases
         if self.state == STATE_TABLE:
+            self.pacer.update(dt)
             if self.hand_phase == "dealing":
                 self.update_deal_anim()
-            elif self.hand_phase == "dealer":
-                # Dealer auto-plays, simple pacing
-                pygame.time.delay(350)
-                if hand_total(self.dealer) < 17:
-                    self.dealer.append(self.shoe.pop()); self.reshoe_if_needed()
-                else:
-                    self.revealed = True
-                    self.hand_phase = "settle"
             elif self.hand_phase == "settle":
                 self.settle_hand()
 
@@ -455,13 +393,15 @@ class Game:
             draw_text("Press R to restart", FONT_MED, WHITE, WIDTH//2, HEIGHT//2 + 30, center=True)
 
     def run(self):
+        dt = 0.0
         while True:
             self.handle_events()
-            self.update()
+            self.update(dt)
             self.draw()
             pygame.display.flip()
-            clock.tick(FPS)
+            dt = clock.tick(FPS) / 1000.0
 
 # ------------- Main -------------
 if __name__ == "__main__":
+    init_display()
     Game().run()
\ No newline at end of file
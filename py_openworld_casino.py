@@ -1,6 +1,10 @@
 # py_openworld_casino.py
 # 2D top-down "open-world-ish" -> enter casino -> sit and play blackjack (with sprite support)
-import sys, os, random, pygame
+import sys, os, pygame
+
+from cards import SUITS, RANKS, Shoe, make_card, card_label, hand_total
+from fonts import get_font
+from pacing import ActionScheduler
 
 # ---------------- Config ----------------
 WIN_W, WIN_H = 960, 540
@@ -27,6 +31,7 @@ STARTING_BANKROLL = 200
 MIN_BET = 10
 MAX_BET = 500
 NUM_DECKS = 6
+DEALER_STEP_DELAY = 0.35  # seconds between dealer draws
 
 MUSIC_FILE = "lobby_music.mp3"  # optional
 CARDS_DIR = "cards"
@@ -44,34 +49,17 @@ try:
 except pygame.error:
     MUSIC_ENABLED = False
 
-FONT_BIG = pygame.font.SysFont("arialblack", 42)
-FONT_HUD = pygame.font.SysFont("arial", 22, bold=True)
-FONT = pygame.font.SysFont("arial", 20)
-FONT_SMALL = pygame.font.SysFont("arial", 16)
+FONT_BIG = get_font("arialblack", 42)
+FONT_HUD = get_font("arial", 22, bold=True)
+FONT = get_font("arial", 20)
+FONT_SMALL = get_font("arial", 16)
 
 # ---------------- Blackjack Logic ----------------
-SUITS = ["♠", "♥", "♦", "♣"]
-RANKS = ["A","2","3","4","5","6","7","8","9","10","J","Q","K"]
-VALUES = {**{str(i): i for i in range(2, 11)}, "J":10, "Q":10, "K":10, "A":11}
 SUIT_LETTER = {"♠":"S","♥":"H","♦":"D","♣":"C"}
 
+# Cards are compact int ids (see cards.py); rank/suit strings only exist for drawing
 def build_shoe(num_decks=6):
-    shoe=[]
-    for _ in range(num_decks):
-        for s in SUITS:
-            for r in RANKS:
-                shoe.append((r,s))
-    random.shuffle(shoe)
-    return shoe
-
-def hand_total(cards):
-    t, aces = 0, 0
-    for r,_ in cards:
-        t += VALUES[r]
-        if r=="A": aces+=1
-    while t>21 and aces:
-        t -= 10; aces -= 1
-    return t
+    return Shoe(num_decks)
 
 def is_blackjack(cards): return len(cards)==2 and hand_total(cards)==21
 def is_bust(cards): return hand_total(cards)>21
@@ -91,22 +79,23 @@ def load_card_sprites():
         SPRITES_OK = False; return
     try:
         CARD_BACK = try_load_image(os.path.join(CARDS_DIR, "back.png"))
-        for r in RANKS:
-            for s in SUITS:
+        for si, s in enumerate(SUITS):
+            for ri, r in enumerate(RANKS):
                 name = f"{r}{SUIT_LETTER[s]}.png"
-                CARD_IMAGES[(r,s)] = try_load_image(os.path.join(CARDS_DIR, name))
+                CARD_IMAGES[make_card(ri, si)] = try_load_image(os.path.join(CARDS_DIR, name))
         SPRITES_OK = (len(CARD_IMAGES)==52 and CARD_BACK is not None)
     except Exception:
         SPRITES_OK = False
 
 load_card_sprites()
 
-def draw_card(surface, x, y, r, s, face_up=True):
+def draw_card(surface, x, y, card, face_up=True):
     if SPRITES_OK:
-        surface.blit(CARD_BACK if not face_up else CARD_IMAGES[(r,s)], (x,y))
+        surface.blit(CARD_BACK if not face_up else CARD_IMAGES[card], (x,y))
     else:
         rect = pygame.Rect(x,y,CARD_W,CARD_H)
         if face_up:
+            r, s = card_label(card)
             pygame.draw.rect(surface, WHITE, rect, border_radius=10)
             pygame.draw.rect(surface, BLACK, rect, 2, border_radius=10)
             col = RED if s in ("♥","♦") else BLACK
@@ -225,10 +214,13 @@ class BlackjackTable:
         self.phase="betting"  # betting, dealing, player, dealer, settle, done
         self.message=""
         self.anim=[]
+        self.pacer = ActionScheduler()  # paces dealer draws on frame time
 
     def reshoe(self):
-        if len(self.shoe)<20:
-            self.shoe = build_shoe(NUM_DECKS)
+        # between hands only: clear the table to the discard tray, shuffle once the cut card is out
+        self.shoe.discard()
+        if self.shoe.needs_shuffle:
+            self.shoe.shuffle()
 
     def card_to(self, who, idx):
         if who=="player":
@@ -238,7 +230,7 @@ class BlackjackTable:
 
     def start_hand(self):
         self.message=""; self.player=[]; self.dealer=[]; self.revealed=False; self.reshoe()
-        self.phase="dealing"; self.anim=[]
+        self.phase="dealing"; self.anim=[]; self.pacer.clear()
         order=[("player",0),("dealer",0),("player",1),("dealer",1)]
         t=0
         for who,idx in order:
@@ -248,7 +240,7 @@ class BlackjackTable:
                 "from":(WIN_W//2,-140),
                 "to":self.card_to(who,idx),
                 "arrived":False,
-                "card":self.shoe.pop()
+                "card":self.shoe.deal()
             })
             t+=220
 
@@ -323,9 +315,9 @@ class BlackjackTable:
         return btns
 
     def draw_hand(self, surf, cards, x0, y0, hide_first=False):
-        for i,(r,s) in enumerate(cards):
+        for i,card in enumerate(cards):
             face = not(hide_first and i==0)
-            draw_card(surf, x0+i*(CARD_W+10), y0, r, s, face_up=face)
+            draw_card(surf, x0+i*(CARD_W+10), y0, card, face_up=face)
         now = pygame.time.get_ticks()
         for a in self.anim:
             if now < a["t_start"]: continue
@@ -333,17 +325,22 @@ class BlackjackTable:
             dt = (now - a["t_start"])/220.0
             if dt<1.0:
                 x = fx+(tx-fx)*dt; y = fy+(ty-fy)*dt
-                draw_card(surf, int(x), int(y), a["card"][0], a["card"][1], face_up=False)
+                draw_card(surf, int(x), int(y), a["card"], face_up=False)
+
+    def dealer_step(self):
+        # one paced dealer draw; queues the next until the dealer stands
+        if self.phase!="dealer":
+            return
+        if hand_total(self.dealer)<17:
+            self.dealer.append(self.shoe.deal())
+            self.pacer.schedule(DEALER_STEP_DELAY, self.dealer_step)
+        else:
+            self.revealed=True; self.phase="settle"
 
-    def update(self):
+    def update(self, dt):
+        self.pacer.update(dt)
         if self.phase=="dealing":
             self.update_deal_anim()
-        elif self.phase=="dealer":
-            pygame.time.delay(350)
-            if hand_total(self.dealer)<17:
-                self.dealer.append(self.shoe.pop()); self.reshoe()
-            else:
-                self.revealed=True; self.phase="settle"
         elif self.phase=="settle":
             self.settle()
 
@@ -355,11 +352,12 @@ class BlackjackTable:
                 if MIN_BET<=self.bet<=min(MAX_BET,self.bankroll): self.start_hand()
         elif self.phase=="player":
             if point_in_rect(pos, btns.get("hit")):
-                self.player.append(self.shoe.pop()); self.reshoe()
+                self.player.append(self.shoe.deal())
                 if is_bust(self.player):
                     self.revealed=True; self.phase="settle"
             elif point_in_rect(pos, btns.get("stand")):
                 self.phase="dealer"
+                self.pacer.schedule(DEALER_STEP_DELAY, self.dealer_step)
         elif self.phase=="done":
             if self.bankroll>0 and point_in_rect(pos, btns.get("next")):
                 self.message=""; self.player=[]; self.dealer=[]; self.revealed=False; self.phase="betting"
@@ -481,8 +479,8 @@ class Game:
         self.inside_player.input_move()
         self.inside_player.move_and_collide(CASINO_MAP)
 
-    def update_table(self):
-        self.table.update()
+    def update_table(self, dt):
+        self.table.update(dt)
         if self.table.bankroll <= 0 and self.state==STATE_TABLE:
             self.state = STATE_GAMEOVER
 
@@ -526,6 +524,7 @@ class Game:
 
     # ----------- Event loop -----------
     def run(self):
+        dt = 0.0
         while True:
             for ev in pygame.event.get():
                 if ev.type==pygame.QUIT:
@@ -545,7 +544,7 @@ class Game:
             # update
             if self.state==STATE_WORLD: self.update_world()
             elif self.state==STATE_CASINO: self.update_casino()
-            elif self.state==STATE_TABLE: self.update_table()
+            elif self.state==STATE_TABLE: self.update_table(dt)
 
             # draw
             if self.state==STATE_WORLD: self.draw_world()
@@ -554,7 +553,7 @@ class Game:
             elif self.state==STATE_GAMEOVER: self.draw_gameover()
 
             pygame.display.flip()
-            clock.tick(FPS)
+            dt = clock.tick(FPS) / 1000.0
 
 # -------------- Run --------------
 if __name__ == "__main__":
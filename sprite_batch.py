@@ -0,0 +1,70 @@
+"""
+Depth-sorted sprite batch.
+
+Sprites from the world, the NPC manager and the player are collected each
+frame, sorted by the y-coordinate of their feet (so whoever stands lower on
+screen is drawn in front) and sent to the surface in a single fblits/blits
+call. draw_calls and sprites count the last frame's work.
+"""
+from operator import itemgetter
+
+import pygame as pg
+
+# pygame-ce has the faster fblits(); plain pygame falls back to blits()
+HAS_FBLITS = hasattr(pg.Surface, 'fblits')
+
+_foot_y = itemgetter(0)
+
+
+class SpriteBatch:
+    """Sprites queued for one frame, drawn back to front in one call."""
+
+    def __init__(self):
+        self._items = []     # (foot y, image, (x, y)) in map pixels
+        self.sprites = 0     # sprites drawn by the last draw()
+        self.draw_calls = 0  # blit calls issued by the last draw()
+        self.frames = 0
+        self.total_sprites = 0
+        self.total_draw_calls = 0
+
+    def add(self, image: pg.Surface, pos, foot_y=None):
+        """Queue image with its top-left at pos; foot_y defaults to its bottom edge."""
+        x, y = pos
+        if foot_y is None:
+            foot_y = y + image.get_height()
+        self._items.append((foot_y, image, (x, y)))
+
+    def extend(self, sprites):
+        """Queue (image, pos) pairs."""
+        for image, pos in sprites:
+            self.add(image, pos)
+
+    def draw(self, surface: pg.Surface, camera: pg.Rect = None):
+        """Draw everything queued, back to front, and empty the batch."""
+        items = self._items
+        items.sort(key=_foot_y)  # stable, so equal feet keep their queue order
+        if camera is None:
+            camera = surface.get_rect()
+        ox, oy = camera.x, camera.y
+        left, top, right, bottom = camera.left, camera.top, camera.right, camera.bottom
+        sequence = []
+        for _, image, (x, y) in items:
+            w, h = image.get_size()
+            if x < right and y < bottom and x + w > left and y + h > top:
+                sequence.append((image, (x - ox, y - oy)))
+        items.clear()
+
+        self.sprites = len(sequence)
+        self.draw_calls = 1 if sequence else 0
+        if sequence:
+            if HAS_FBLITS:
+                surface.fblits(sequence)
+            else:
+                surface.blits(sequence, doreturn=False)
+        self.frames += 1
+        self.total_sprites += self.sprites
+        self.total_draw_calls += self.draw_calls
+
+    def stats(self) -> dict:
+        return {"sprites": self.sprites, "draw_calls": self.draw_calls, "frames": self.frames,
+                "total_sprites": self.total_sprites, "total_draw_calls": self.total_draw_calls}
@@ -0,0 +1,77 @@
+"""
+LRU cache of rendered text surfaces.
+
+Labels like "Blackjack Table", the bankroll line or the HUD controls rarely
+change, so they are rasterized once and then blitted from the cache. Entries
+are keyed by (font, text, color, antialias, shadow) and evicted least
+recently used first once the cached surfaces exceed a byte budget. The
+hit/miss counters show whether a frame rendered any new glyphs.
+"""
+from collections import OrderedDict
+
+import pygame
+
+SHADOW_COLOR = (0, 0, 0)
+SHADOW_OFFSET = 2
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+
+
+class TextCache:
+    """Rendered text surfaces, evicted least recently used past max_bytes."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._entries = OrderedDict()  # key -> (surface, size in bytes)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, color, antialias=True, shadow=False):
+        """Cached equivalent of font.render(); shadow adds a drop shadow behind the text."""
+        key = (font, text, tuple(color), antialias, shadow)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        if shadow:
+            w, h = surf.get_size()
+            composed = pygame.Surface((w + SHADOW_OFFSET, h + SHADOW_OFFSET), pygame.SRCALPHA)
+            composed.blit(font.render(text, antialias, SHADOW_COLOR), (SHADOW_OFFSET, SHADOW_OFFSET))
+            composed.blit(surf, (0, 0))
+            surf = composed
+        size = surf.get_width() * surf.get_height() * surf.get_bytesize()
+        self._entries[key] = (surf, size)
+        self.bytes += size
+        while self.bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, old_size) = self._entries.popitem(last=False)
+            self.bytes -= old_size
+            self.evictions += 1
+        return surf
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes = 0
+
+    def reset_stats(self):
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        return {"entries": len(self._entries), "bytes": self.bytes, "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions}
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Shared cache used by draw_text / button and the main HUD
+TEXT_CACHE = TextCache()
+
+
+def render_text(font, text, color, antialias=True, shadow=False):
+    """Render through the shared cache."""
+    return TEXT_CACHE.render(font, text, color, antialias, shadow)
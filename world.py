@@ -3,14 +3,22 @@ World class for tilemap, collision detection, and decorative elements.
 """
 import os
 import pygame as pg
+from gamelog import ASSETS, COLLISION, NPC, TMX
 try:
     import pytmx
     PYTMX_AVAILABLE = True
 except ImportError:
     PYTMX_AVAILABLE = False
-    print("pytmx not available - Tiled map loading disabled")
+    TMX.warning("pytmx not available - Tiled map loading disabled")
 from assets import AssetManager
-from config import TILESET_IMAGE, CASINO_TILESET_DIR, MUSIC_FILE, MUSIC_ENABLED, USE_TILED_MAP, TILED_MAP_FILE, ASSET_DIR
+from fonts import get_font
+from map_renderer import ChunkedMapRenderer
+from animated_tiles import AnimatedTileLayer, tile_animation
+from collision_grid import CollisionGrid, FLAG_PROPERTIES, SOLID
+from collision_shapes import ShapeIndex, rect_shape, polygon_shape, polygon_edges, point_in_polygon
+from map_cache import cache_path, map_key, load_baked_map, save_baked_map
+from debug_overlay import DebugOverlay, DEBUG_MODES
+from config import TILESET_IMAGE, CASINO_TILESET_DIR, MUSIC_FILE, MUSIC_ENABLED, USE_TILED_MAP, TILED_MAP_FILE, ASSET_DIR, ANIMATION_TILESETS
 
 
 class World:
@@ -20,19 +28,24 @@ class World:
         self.tilesize = tilesize
         self.tiles = {}
         self.tilemap = []
-        self.collision_map = []
+        self.collision_grid = CollisionGrid(0, 0, tilesize)  # flat per-tile flags, see collision_grid.py
         # self.asset_manager = AssetManager()  # DISABLED - no extra props
         self.decorative_objects = []  # List of decorative elements
         self.ambient_effects = []     # List of ambient effects
-        self.show_collision_debug = False
+        self.debug_mode = 0          # index into DEBUG_MODES, cycled with F1
+        self.debug_overlay = None    # baked lazily, see debug_overlay.py
         self.tmx_data = None         # Store Tiled map data
-        self.tmx_surface = None      # Pre-rendered TMX surface
+        self.map_renderer = None     # Chunked TMX renderer (map_renderer.py)
+        self.animated_tiles = None   # Animated tiles drawn over the static chunks
+        self.anim_clock = 0.0        # ms, drives animated NPC sprites
         self.npc_objects = []        # NPCs from Tiled object layer
+        self.collision_objects = []  # rect / polygon shapes from the Tiled collision layer
+        self.collision_index = ShapeIndex(())  # broadphase over collision_objects
         self.load_tiles()
         
         # Load ONLY your TMX map - no procedural generation
         tmx_path = os.path.join(ASSET_DIR, TILED_MAP_FILE)
-        print(f"Loading TMX map only: {tmx_path}")
+        TMX.info("Loading TMX map: %s", tmx_path)
         self.load_tmx_only(tmx_path)
         
         # NO decorative elements setup
@@ -50,16 +63,15 @@ class World:
         """Load tile images from tileset."""
         # Load the tileset image
         try:
-            print(f"Attempting to load tileset: {TILESET_IMAGE}")
+            ASSETS.debug("Attempting to load tileset: %s", TILESET_IMAGE)
             tileset = pg.image.load(TILESET_IMAGE)
             if tileset:
                 tileset = tileset.convert_alpha()
-                print("Successfully loaded tileset")
-                print(f"Tileset size: {tileset.get_width()}x{tileset.get_height()}")
+                ASSETS.debug("Loaded tileset: %dx%d", tileset.get_width(), tileset.get_height())
             else:
                 raise Exception("Failed to load tileset")
         except Exception as e:
-            print(f'Error loading casino tileset: {e}')
+            ASSETS.error("Error loading casino tileset: %s", e)
             # Create fallback tiles
             self.create_fallback_tiles()
             return
@@ -97,7 +109,7 @@ class World:
                 #pg.draw.rect(blackjack_surface, (255, 215, 0), (0, 0, w, h), 3)  # Gold border
                 #pg.draw.rect(blackjack_surface, (0, 150, 0), (4, 4, w-8, h-8))  # Lighter green center
 
-                # font = pg.font.SysFont('Arial', 16, bold=True)
+                # font = get_font('Arial', 16, bold=True)
                 # text = font.render('BJ', True, (255, 215, 0))
                 # text_rect = text.get_rect(center=(w//2, h//2))
                 # blackjack_surface.blit(text, text_rect)
@@ -111,7 +123,7 @@ class World:
     def create_demo_map(self):
         """Create the beautiful detailed casino tilemap layout."""
         # Use the detailed procedural casino map with all the beautiful elements
-        print("Creating detailed procedural casino map with rich casino elements...")
+        TMX.info("Creating detailed procedural casino map with rich casino elements...")
         base_map = self.create_detailed_casino_map()
         self.tilemap = base_map
         
@@ -184,49 +196,53 @@ class World:
     def load_tmx_only(self, map_path):
         """Load your TMX file and render it directly with proper collision detection."""
         if not PYTMX_AVAILABLE:
-            print("ERROR: pytmx not available - cannot load TMX file!")
+            TMX.error("pytmx not available - cannot load TMX file!")
             return
             
         if not os.path.exists(map_path):
-            print(f"ERROR: TMX file not found: {map_path}")
+            TMX.error("TMX file not found: %s", map_path)
             return
             
         try:
+            # Baked data from an earlier launch skips pytmx entirely (see map_cache.py)
+            baked_path = cache_path(map_path, self.tilesize, map_key(map_path, self.tilesize, ANIMATION_TILESETS))
+            baked = load_baked_map(baked_path, self.tilesize)
+            if baked is not None:
+                for name, value in baked.items():
+                    setattr(self, name, value)
+                self.debug_overlay = None
+                grid = self.collision_grid
+                TMX.info("Loaded baked map: %s", baked_path)
+                COLLISION.info("Collision map: %d rows x %d columns, %d solid tiles",
+                               grid.height, grid.width, grid.count(SOLID))
+                return
+
             # Load your TMX map
             self.tmx_data = pytmx.load_pygame(map_path)
-            print(f"Successfully loaded TMX: {map_path}")
-            print(f"Map size: {self.tmx_data.width}x{self.tmx_data.height}")
-            print(f"Tile size: {self.tmx_data.tilewidth}x{self.tmx_data.tileheight}")
+            TMX.info("Loaded TMX: %s (%dx%d tiles of %dx%d)", map_path, self.tmx_data.width, self.tmx_data.height,
+                     self.tmx_data.tilewidth, self.tmx_data.tileheight)
             
             # Get all tile layers
             tile_layers = []
             for layer in self.tmx_data.visible_layers:
                 if isinstance(layer, pytmx.TiledTileLayer):
                     tile_layers.append(layer)
-                    print(f"Found layer: {layer.name}")
+                    TMX.debug("Found layer: %s", layer.name)
             
             if not tile_layers:
-                print("ERROR: No tile layers found in TMX file!")
+                TMX.error("No tile layers found in TMX file!")
                 return
             
-            # Create a surface to render the map onto
-            map_width = self.tmx_data.width * self.tmx_data.tilewidth
-            map_height = self.tmx_data.height * self.tmx_data.tileheight
-            self.tmx_surface = pg.Surface((map_width, map_height))
-            
-            # Render all layers to the surface
-            for layer in tile_layers:
-                for x, y, gid in layer:
-                    if gid:
-                        tile = self.tmx_data.get_tile_image_by_gid(gid)
-                        if tile:
-                            # Scale tile if needed
-                            if tile.get_width() != self.tilesize or tile.get_height() != self.tilesize:
-                                tile = pg.transform.scale(tile, (self.tilesize, self.tilesize))
-                            self.tmx_surface.blit(tile, (x * self.tilesize, y * self.tilesize))
+            # Tiles are rendered lazily into cached chunks, only where the camera looks
+            map_width = self.tmx_data.width * self.tilesize
+            map_height = self.tmx_data.height * self.tilesize
+            self.map_renderer = ChunkedMapRenderer(self.tmx_data, tile_layers, self.tilesize)
+            self.animated_tiles = AnimatedTileLayer.from_tmx(self.tmx_data, tile_layers, self.tilesize, ANIMATION_TILESETS)
+            TMX.debug("Animated tiles: %d", len(self.animated_tiles))
             
             # Create intelligent collision map using object layers
-            self.collision_map = []
+            collision_map = []
+            collision_cells = None  # rasterized straight from the collision objects
             self.collision_objects = []  # Store collision polygons for precise collision
             self.npc_objects = []  # Store NPC positions from object layer
             
@@ -238,10 +254,10 @@ class World:
                 if isinstance(layer, pytmx.TiledObjectGroup):
                     if layer.name.lower() in ['collisions', 'collision']:
                         collision_layer = layer
-                        print(f"Found collision layer: {layer.name} with {len(layer)} objects")
+                        COLLISION.debug("Found collision layer: %s with %d objects", layer.name, len(layer))
                     elif layer.name.lower() in ['npcs', 'npc']:
                         npc_layer = layer
-                        print(f"Found NPC layer: {layer.name} with {len(layer)} objects")
+                        NPC.debug("Found NPC layer: %s with %d objects", layer.name, len(layer))
             
             # Load NPCs from object layer
             if npc_layer:
@@ -264,21 +280,19 @@ class World:
                         npc_image = self.tmx_data.get_tile_image_by_gid(npc_data['gid'])
                         if npc_image:
                             npc_data['image'] = npc_image
+                        animation = tile_animation(self.tmx_data, npc_data['gid'])
+                        if animation:
+                            npc_data['animation'] = animation
                     
                     self.npc_objects.append(npc_data)
-                    print(f"Loaded NPC at ({obj.x}, {obj.y}) with GID {npc_data['gid']}")
+                    NPC.debug("Loaded NPC at (%s, %s) with GID %s", obj.x, obj.y, npc_data['gid'])
             
             # If we have a collision layer, use it
             if collision_layer:
                 # Store collision objects for precise collision detection
                 for obj in collision_layer:
                     if hasattr(obj, 'points'):  # Polygon collision
-                        self.collision_objects.append({
-                            'type': 'polygon',
-                            'x': obj.x,
-                            'y': obj.y,
-                            'points': obj.points
-                        })
+                        self.collision_objects.append(polygon_shape(obj.x, obj.y, obj.points))
                     else:  # Rectangle or point collision
                         # If width/height are 0 or not set, treat as a tile-sized collision area
                         width = getattr(obj, 'width', 0)
@@ -290,29 +304,17 @@ class World:
                         if height == 0:
                             height = self.tilesize
                         
-                        self.collision_objects.append({
-                            'type': 'rect',
-                            'x': obj.x,
-                            'y': obj.y,
-                            'width': width,
-                            'height': height
-                        })
+                        self.collision_objects.append(rect_shape(obj.x, obj.y, width, height))
                 
-                # Create tile-based collision map from objects
-                for y in range(self.tmx_data.height):
-                    collision_row = []
-                    for x in range(self.tmx_data.width):
-                        # Check if tile center is inside any collision object
-                        tile_center_x = (x + 0.5) * self.tilesize
-                        tile_center_y = (y + 0.5) * self.tilesize
-                        is_solid = self.point_in_collision_objects(tile_center_x, tile_center_y)
-                        collision_row.append(is_solid)
-                    self.collision_map.append(collision_row)
+                # A tile is solid when its center is inside a collision object
+                self.collision_index = ShapeIndex(self.collision_objects)
+                collision_cells = self.collision_index.rasterize(self.tmx_data.width, self.tmx_data.height,
+                                                                 self.tilesize)
                 
-                print(f"Using collision objects for precise collision detection")
+                COLLISION.debug("Using collision objects for precise collision detection")
             else:
                 # Fallback: Use GID-based collision detection
-                print("No collision layer found, using GID-based collision")
+                COLLISION.info("No collision layer found, using GID-based collision")
                 
                 # Define collision GIDs based on your map
                 wall_gids = {1478, 1542, 1479, 1477, 1414}  # Border walls
@@ -342,70 +344,66 @@ class World:
                                     break
                         
                         collision_row.append(is_solid)
-                    self.collision_map.append(collision_row)
+                    collision_map.append(collision_row)
             
-            print(f"TMX map rendered: {map_width}x{map_height} pixels")
-            print(f"Collision map created: {len(self.collision_map)} rows x {len(self.collision_map[0])} columns")
-            
-            # Count solid tiles for debug
-            solid_count = sum(sum(row) for row in self.collision_map)
-            print(f"Total solid tiles: {solid_count}")
+            if collision_cells is not None:
+                self.collision_grid = CollisionGrid(self.tmx_data.width, self.tmx_data.height,
+                                                    self.tilesize, collision_cells)
+            else:
+                self.collision_grid = CollisionGrid.from_rows(collision_map, self.tilesize)
+            self.apply_tile_flags(tile_layers)
+            self.debug_overlay = None  # collision data changed; re-bake on next use
+            TMX.debug("TMX map size: %dx%d pixels", map_width, map_height)
+            grid = self.collision_grid
+            COLLISION.info("Collision map: %d rows x %d columns, %d solid tiles",
+                           grid.height, grid.width, grid.count(SOLID))
             
-            # Print first few solid tile positions for debugging
-            if solid_count > 0:
-                print("Sample solid tiles:")
-                count = 0
-                for y, row in enumerate(self.collision_map):
-                    for x, is_solid in enumerate(row):
-                        if is_solid:
-                            print(f"  Tile ({x}, {y}) = SOLID")
-                            count += 1
-                            if count >= 10:  # Show first 10
-                                break
-                    if count >= 10:
-                        break
+            # First few solid tile positions, for debugging
+            if COLLISION.debug_enabled:
+                solid = [i for i, flags in enumerate(grid.cells) if flags & SOLID][:10]
+                COLLISION.debug("Sample solid tiles: %s", [(i % grid.stride, i // grid.stride) for i in solid])
+
+            save_baked_map(baked_path, self)
             
         except Exception as e:
-            print(f"ERROR loading TMX: {e}")
-            import traceback
-            traceback.print_exc()
+            TMX.error("Error loading TMX: %s", e, exc_info=True)
     
+    def apply_tile_flags(self, tile_layers):
+        """Set INTERACTABLE / SLOW / TRIGGER (and SOLID) from Tiled tile properties."""
+        flags_by_gid = {}
+        grid = self.collision_grid
+        for layer in tile_layers:
+            for y, row in enumerate(layer.data):
+                for x, gid in enumerate(row):
+                    if not gid:
+                        continue
+                    flags = flags_by_gid.get(gid)
+                    if flags is None:
+                        props = self.tmx_data.get_tile_properties_by_gid(gid) or {}
+                        flags = flags_by_gid[gid] = sum(flag for name, flag in FLAG_PROPERTIES.items()
+                                                        if props.get(name))
+                    if flags:
+                        grid.add_flags(x, y, flags)
+
+    @property
+    def collision_map(self) -> list:
+        """Rows of solid flags; a copy built from collision_grid."""
+        return self.collision_grid.rows()
+
+    @collision_map.setter
+    def collision_map(self, rows):
+        self.collision_grid = CollisionGrid.from_rows(rows, self.tilesize)
+        self.debug_overlay = None
+
     def point_in_collision_objects(self, x, y):
-        """Check if a point is inside any collision object."""
-        for obj in self.collision_objects:
-            if obj['type'] == 'rect':
-                # Rectangle collision
-                if (obj['x'] <= x <= obj['x'] + obj['width'] and
-                    obj['y'] <= y <= obj['y'] + obj['height']):
-                    return True
-            elif obj['type'] == 'polygon':
-                # Polygon collision using ray casting algorithm
-                if self.point_in_polygon(x, y, obj['x'], obj['y'], obj['points']):
-                    return True
-        return False
+        """Check if a point is inside any collision object (exact test, via the shape index)."""
+        return self.collision_index.contains(x, y)
     
     def point_in_polygon(self, x, y, poly_x, poly_y, points):
         """Check if point is inside polygon using ray casting algorithm.
-        NOTE: pytmx returns Point objects with x,y attributes, and they're already in absolute coordinates!"""
-        inside = False
-        n = len(points)
-        
-        for i in range(n):
-            # Get current point and next point (wrapping around)
-            p1 = points[i]
-            p2 = points[(i + 1) % n]
-            
-            # Points are already in absolute coordinates from pytmx
-            x1 = p1.x if hasattr(p1, 'x') else p1[0]
-            y1 = p1.y if hasattr(p1, 'y') else p1[1]
-            x2 = p2.x if hasattr(p2, 'x') else p2[0]
-            y2 = p2.y if hasattr(p2, 'y') else p2[1]
-            
-            # Ray casting algorithm
-            if ((y1 > y) != (y2 > y)) and (x < (x2 - x1) * (y - y1) / (y2 - y1) + x1):
-                inside = not inside
-        
-        return inside
+        NOTE: pytmx returns Point objects with x,y attributes, and they're already in absolute coordinates!
+        Shapes in collision_objects carry precomputed 'edges'; prefer collision_shapes.point_in_polygon."""
+        return point_in_polygon(x, y, polygon_edges(points))
     
     def get_tile_from_gid(self, gid):
         """GID to tile mapping for your map1.tmx."""
@@ -454,7 +452,7 @@ class World:
     def create_demo_map(self):
         """Create a simple fallback map if TMX fails."""
         self.tilemap = []
-        self.collision_map = []
+        collision_map = []
         
         # Simple 20x15 map
         for y in range(15):
@@ -468,7 +466,8 @@ class World:
                     tile_row.append('floor')
                     collision_row.append(False)
             self.tilemap.append(tile_row)
-            self.collision_map.append(collision_row)
+            collision_map.append(collision_row)
+        self.collision_map = collision_map
 
     def get_tile_name_from_gid(self, gid):
         """Map Tiled GID to our tile names based on map1.tmx casino tileset."""
@@ -618,7 +617,7 @@ class World:
         larger_tileset = os.path.join(CASINO_TILESET_DIR, '2D_TopDown_Tileset_Casino_1024x512.png')
         
         if os.path.exists(larger_tileset):
-            print("Loading plants from 1024x512 tileset...")
+            ASSETS.debug("Loading plants from 1024x512 tileset...")
             # Use confirmed in-bounds regions (sheet width 1024). Previous coordinates exceeded sheet width.
             # These should be replaced with actual plant cluster coordinates after visual verification.
             plant1 = self.asset_manager.extract_from_tileset(larger_tileset, 896, 384, 64, 64)
@@ -629,22 +628,22 @@ class World:
             # Place plants in all 4 corners of the casino (adjusted positions for visibility)
             # Top-left corner - moved more inward
             self.asset_manager.register_prop("corner_plant_tl", plant1, (64, 64))
-            print("Placed plant 1 at (64, 64)")
+            ASSETS.debug("Placed plant 1 at (64, 64)")
             
             # Top-right corner - moved more inward
             self.asset_manager.register_prop("corner_plant_tr", plant2, (896, 64))
-            print("Placed plant 2 at (896, 64)")
+            ASSETS.debug("Placed plant 2 at (896, 64)")
             
             # Bottom-left corner - moved more inward
             self.asset_manager.register_prop("corner_plant_bl", plant3, (64, 640))
-            print("Placed plant 3 at (64, 640)")
+            ASSETS.debug("Placed plant 3 at (64, 640)")
             
             # Bottom-right corner - moved more inward
             self.asset_manager.register_prop("corner_plant_br", plant4, (896, 640))
-            print("Placed plant 4 at (896, 640)")
+            ASSETS.debug("Placed plant 4 at (896, 640)")
             
         else:
-            print("1024 tileset not found, using fallback plants...")
+            ASSETS.warning("1024 tileset not found, using fallback plants...")
             # Fallback to smaller tileset plants if 1024 version not available
             plant = self.asset_manager.extract_from_tileset(tileset_path, 320, 96, 32, 32)
             self.asset_manager.register_prop("corner_plant_tl", plant, (64, 64))
@@ -661,7 +660,7 @@ class World:
             extract_w = min(32, lw)
             extract_h = min(32, lh)
             if extract_h < 32:
-                print(f"[INFO] Decorative lights sheet height {lh} < 32; using {extract_h} for extraction to avoid OOB.")
+                ASSETS.info("Decorative lights sheet height %d < 32; using %d for extraction to avoid OOB.", lh, extract_h)
             light_frame = self.asset_manager.extract_from_tileset(lights_sheet_path, 0, 0, extract_w, extract_h)
             y_top = 30
             y_bottom = 700 - (32 - extract_h)  # Adjust if shorter so it sits similarly
@@ -678,86 +677,120 @@ class World:
             self.asset_manager.register_prop("animated_slot1", slot_frame, (400, 100))
             self.asset_manager.register_prop("animated_slot2", slot_frame, (600, 100))
     
-    def draw(self, surface: pg.Surface):
-        """Draw ONLY the TMX map - no decorative elements."""
-        # If we have a rendered TMX surface, use that
-        if hasattr(self, 'tmx_surface') and self.tmx_surface:
-            # Draw the map at its original size (no scaling)
-            surface.blit(self.tmx_surface, (0, 0))
+    def update(self, dt: float):
+        """Advance tile and NPC animations."""
+        self.anim_clock += dt * 1000
+        if self.animated_tiles:
+            self.animated_tiles.update(dt)
+
+    def draw(self, surface: pg.Surface, camera: pg.Rect = None):
+        """Draw ONLY the TMX map - no decorative elements.
+
+        camera is the visible part of the map in map pixels; by default the
+        surface-sized area at the map origin.
+        """
+        if camera is None:
+            camera = surface.get_rect()
+        ox, oy = camera.x, camera.y
+        # Only the chunks under the camera are blitted
+        if self.map_renderer:
+            self.map_renderer.draw(surface, camera)
+            if self.animated_tiles:
+                self.animated_tiles.draw(surface, camera)
         else:
             # Fallback to tile-by-tile rendering
             missing_tiles = set()
             for y, row in enumerate(self.tilemap):
                 for x, tile_key in enumerate(row):
                     if tile_key in self.tiles:
-                        pos = (x * self.tilesize, y * self.tilesize)
+                        pos = (x * self.tilesize - ox, y * self.tilesize - oy)
                         surface.blit(self.tiles[tile_key]['image'], pos)
                     else:
                         missing_tiles.add(tile_key)
             
-            # Report missing tiles once
+            # Rate-limited, this runs every frame
             if missing_tiles:
-                print(f"Missing tile types in tileset: {missing_tiles}")
-                print(f"Available tiles: {list(self.tiles.keys())}")
-        
-        # Draw NPCs from Tiled object layer
-        if hasattr(self, 'npc_objects'):
-            for npc in self.npc_objects:
-                if 'image' in npc:
-                    # Position NPCs at their original object position
-                    npc_x = npc['x']
-                    npc_y = npc['y'] - npc['height']
-                    surface.blit(npc['image'], (npc_x, npc_y))
-        
+                ASSETS.warning("Missing tile types in tileset: %s (available: %s)", missing_tiles, list(self.tiles))
+
         # NO decorative objects, NO asset manager props, NO extra rendering
+        # (NPC objects go through the sprite batch, see sprites())
+
+    def sprites(self):
+        """(image, pos) of the NPCs from the Tiled object layer, for the sprite batch."""
+        clock = int(self.anim_clock)
+        for npc in self.npc_objects:
+            if 'image' in npc:
+                # Tiled places tile objects by their bottom-left corner
+                image = npc['animation'].frame_at(clock) if 'animation' in npc else npc['image']
+                yield image, (npc['x'], npc['y'] - npc['height'])
+
+    @property
+    def show_collision_debug(self) -> bool:
+        return self.debug_mode != 0
 
-        # Optional collision debug overlay (red translucent for solid tiles)
-        if self.show_collision_debug:
-            overlay = pg.Surface((self.tilesize, self.tilesize), pg.SRCALPHA)
-            overlay.fill((255, 0, 0, 90))
-            for y, row in enumerate(self.collision_map):
-                for x, solid in enumerate(row):
-                    if solid:
-                        surface.blit(overlay, (x * self.tilesize, y * self.tilesize))
+    @show_collision_debug.setter
+    def show_collision_debug(self, on: bool):
+        self.debug_mode = (self.debug_mode or 1) if on else 0
+
+    def cycle_debug_mode(self) -> str:
+        """Switch to the next collision debug mode and return its name."""
+        self.debug_mode = (self.debug_mode + 1) % len(DEBUG_MODES)
+        return DEBUG_MODES[self.debug_mode][0]
+
+    def draw_debug(self, surface: pg.Surface, camera: pg.Rect = None):
+        """Optional collision debug overlay, baked once into translucent chunks."""
+        if not self.debug_mode or not len(self.collision_grid):
+            return
+        if camera is None:
+            camera = surface.get_rect()
+        layers = DEBUG_MODES[self.debug_mode][1]
+        if self.debug_overlay is None:
+            self.debug_overlay = DebugOverlay(self, layers)
+        self.debug_overlay.set_layers(layers)
+        self.debug_overlay.draw(surface, camera)
     
     def get_tile_at(self, pos: pg.math.Vector2) -> tuple:
         """Get tile coordinates at world position."""
         # Convert pixel position to tile coordinates
         tile_x = int(pos.x // self.tilesize)
         tile_y = int(pos.y // self.tilesize)
-        
-        # Debug info for problematic positions
-        if pos.x > 960:  # Debug only for problematic positions
-            print(f"Debug: pos=({pos.x}, {pos.y}) -> tiles=({tile_x}, {tile_y}), map_size=({len(self.collision_map[0]) if self.collision_map else 0}, {len(self.collision_map)})")
-        
-        # Check bounds with additional safety for negative coordinates
-        if (tile_x >= 0 and tile_y >= 0 and 
-            self.collision_map and 
-            tile_y < len(self.collision_map) and
-            tile_x < len(self.collision_map[0])):
+        if self.collision_grid.in_bounds(tile_x, tile_y):
             return (tile_x, tile_y)
         return None
     
     def is_solid_at(self, pos: pg.math.Vector2) -> bool:
-        """Check if position is solid for collision."""
-        try:
-            tile_pos = self.get_tile_at(pos)
-            if tile_pos is not None:
-                tile_x, tile_y = tile_pos
-                is_solid = self.collision_map[tile_y][tile_x]
-                # Debug: Print when collision is detected
-                if is_solid:
-                    print(f"Collision detected at tile ({tile_x}, {tile_y}) / pos ({pos.x:.1f}, {pos.y:.1f})")
-                return is_solid
-            return True  # Out of bounds = solid
-        except Exception as e:
-            print(f"Collision error at position {pos}: {e}")
-            print(f"Collision map size: {len(self.collision_map)}x{len(self.collision_map[0]) if self.collision_map else 0}")
-            return True  # Safe fallback
+        """Check if position is solid for collision (out of bounds = solid)."""
+        return self.collision_grid.is_solid(pos.x, pos.y)
+
+    def flags_at(self, pos: pg.math.Vector2) -> int:
+        """Collision grid flags (SOLID, INTERACTABLE, SLOW, TRIGGER) at a position."""
+        return self.collision_grid.flags_at(pos.x, pos.y)
+
+    def solid_at_many(self, positions):
+        """is_solid_at for a sequence of (x, y) positions in one batched query."""
+        return self.collision_grid.solid_many(positions)
+
+    def move_box(self, pos: pg.math.Vector2, half_w: float, half_h: float, dx: float, dy: float) -> bool:
+        """Move a box centred at pos by (dx, dy), sliding along walls.
+
+        pos is updated in place; returns True if it moved at all.
+        """
+        x, y = self.collision_grid.move_box(pos.x, pos.y, half_w, half_h, dx, dy)
+        if COLLISION.debug_enabled and (x != pos.x + dx or y != pos.y + dy):
+            COLLISION.debug("Blocked at (%.1f, %.1f) moving (%.2f, %.2f)", x, y, dx, dy)
+        if x == pos.x and y == pos.y:
+            return False
+        pos.x = x
+        pos.y = y
+        return True
+
+    def boxes_blocked(self, centers, half_w: float, half_h: float):
+        """Per (x, y) centre: does a box of that size there overlap a solid tile? One batched query."""
+        return self.collision_grid.box_corners_solid(centers, half_w, half_h)
         
     def create_fallback_tiles(self):
         """Create fallback tiles if tileset fails to load."""
-        print("Creating fallback tiles...")
+        ASSETS.warning("Creating fallback tiles...")
         floor_tile = pg.Surface((self.tilesize, self.tilesize))
         floor_tile.fill((100, 100, 100))  # Gray for floor
         
@@ -773,7 +806,7 @@ class World:
         pg.draw.rect(blackjack_tile, (255, 215, 0), (0, 0, self.tilesize, self.tilesize), 3)  # Gold border
         pg.draw.rect(blackjack_tile, (0, 150, 0), (4, 4, self.tilesize-8, self.tilesize-8))  # Lighter green center
         # Add "BJ" text
-        font = pg.font.SysFont('Arial', 16, bold=True)
+        font = get_font('Arial', 16, bold=True)
         text = font.render('BJ', True, (255, 215, 0))
         text_rect = text.get_rect(center=(self.tilesize//2, self.tilesize//2))
         blackjack_tile.blit(text, text_rect)